@@ -3,6 +3,7 @@ Components 패키지
 게임 엔티티의 구성요소들
 """
 from components.entity import Entity, Actor, Item
+from components.actor_store import ActorStore
 from components.fighter import Fighter
 from components.survival import Survival, SurvivalStatus
 from components.inventory import Inventory
@@ -13,6 +14,7 @@ __all__ = [
     "Entity",
     "Actor",
     "Item",
+    "ActorStore",
     "Fighter",
     "Survival",
     "SurvivalStatus",
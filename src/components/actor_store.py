@@ -0,0 +1,188 @@
+"""
+Actor 저장소 (Structure-of-Arrays)
+맵 위 Actor들의 핵심 수치를 연속된 numpy 열(column)로 보관
+
+Actor/Fighter/HostileAI는 맵에 추가되면 이 저장소의 한 행(slot)을 가리키는
+얇은 파사드가 되어, 기존 코드는 actor.x, actor.fighter.hp처럼 그대로 쓰고
+거리 계산/감지/깨움 판정은 수천 마리 단위로 벡터 연산할 수 있습니다.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, Optional, Tuple
+import numpy as np
+
+if TYPE_CHECKING:
+    from components.entity import Actor
+
+# AI 종류 코드
+AI_NONE = 0
+AI_HOSTILE = 1
+AI_PASSIVE = 2
+
+
+class ActorStore:
+    """
+    Actor 수치 열 저장소
+
+    Attributes:
+        x, y: 위치
+        hp, max_hp, power, defense: 전투 수치
+        ai_kind: AI 종류 (AI_NONE, AI_HOSTILE, AI_PASSIVE)
+        detection_range: 감지 범위 (적대 AI만, 나머지는 0)
+        used: 사용 중인 행 여부
+        parked: 스케줄러에서 대기(park) 중인 행 여부
+        dormant: 활성 영역 밖이라 휴면 중인 행 여부
+        actors: 행 번호 → Actor
+    """
+
+    COLUMNS = ("x", "y", "hp", "max_hp", "power", "defense", "ai_kind", "detection_range")
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int32))
+        self.used = np.zeros(capacity, dtype=bool)
+        self.parked = np.zeros(capacity, dtype=bool)
+        self.dormant = np.zeros(capacity, dtype=bool)
+        self.actors: List[Optional[Actor]] = [None] * capacity
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return int(self.used.sum())
+
+    def _grow(self) -> None:
+        """용량 두 배로 확장"""
+        old = self.capacity
+        self.capacity = old * 2
+        for name in self.COLUMNS:
+            column = np.zeros(self.capacity, dtype=np.int32)
+            column[:old] = getattr(self, name)
+            setattr(self, name, column)
+        used = np.zeros(self.capacity, dtype=bool)
+        used[:old] = self.used
+        self.used = used
+        parked = np.zeros(self.capacity, dtype=bool)
+        parked[:old] = self.parked
+        self.parked = parked
+        dormant = np.zeros(self.capacity, dtype=bool)
+        dormant[:old] = self.dormant
+        self.dormant = dormant
+        self.actors.extend([None] * old)
+        self._free.extend(range(self.capacity - 1, old - 1, -1))
+
+    def attach(self, actor: Actor) -> int:
+        """
+        Actor를 저장소에 연결 (현재 값을 행으로 복사)
+
+        Returns:
+            할당된 행 번호
+        """
+        if actor._store is not None:
+            raise ValueError(f"{actor.name}은(는) 이미 다른 저장소에 연결되어 있습니다")
+
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+
+        self.used[slot] = True
+        self.actors[slot] = actor
+        self.x[slot] = actor._x
+        self.y[slot] = actor._y
+        actor._store = self
+        actor._slot = slot
+        self.write_components(actor)
+        return slot
+
+    def write_components(self, actor: Actor) -> None:
+        """Fighter/AI 컴포넌트의 로컬 값을 행에 기록 (컴포넌트 교체 시)"""
+        slot = actor._slot
+
+        fighter = actor._fighter
+        if fighter is not None:
+            self.hp[slot] = fighter._hp
+            self.max_hp[slot] = fighter._max_hp
+            self.power[slot] = fighter._power
+            self.defense[slot] = fighter._defense
+        else:
+            self.hp[slot] = self.max_hp[slot] = self.power[slot] = self.defense[slot] = 0
+
+        ai = actor._ai
+        self.ai_kind[slot] = ai.kind if ai is not None else AI_NONE
+        self.detection_range[slot] = getattr(ai, "_detection_range", 0)
+
+    def detach(self, actor: Actor) -> None:
+        """Actor 연결 해제 (행 값을 Actor 로컬 값으로 되돌림)"""
+        if actor._store is not self:
+            return
+
+        slot = actor._slot
+        actor._x = int(self.x[slot])
+        actor._y = int(self.y[slot])
+
+        fighter = actor._fighter
+        if fighter is not None:
+            fighter._hp = int(self.hp[slot])
+            fighter._max_hp = int(self.max_hp[slot])
+            fighter._power = int(self.power[slot])
+            fighter._defense = int(self.defense[slot])
+
+        ai = actor._ai
+        if ai is not None and hasattr(ai, "_detection_range"):
+            ai._detection_range = int(self.detection_range[slot])
+
+        self.used[slot] = False
+        self.parked[slot] = False
+        self.dormant[slot] = False
+        self.actors[slot] = None
+        self._free.append(slot)
+        actor._store = None
+        actor._slot = -1
+
+    # =========================================================================
+    # 벡터 연산
+    # =========================================================================
+
+    def active_slots(self) -> np.ndarray:
+        """사용 중인 행 번호 배열"""
+        return np.flatnonzero(self.used)
+
+    def chebyshev_distances(self, x: int, y: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        모든 Actor의 (x, y)까지 체비셰프 거리
+
+        Returns:
+            (행 번호 배열, 거리 배열)
+        """
+        slots = self.active_slots()
+        distances = np.maximum(np.abs(self.x[slots] - x), np.abs(self.y[slots] - y))
+        return slots, distances
+
+    def detecting(self, x: int, y: int) -> List[Actor]:
+        """(x, y)가 감지 범위 안에 있는 살아있는 적대 Actor 목록"""
+        slots, distances = self.chebyshev_distances(x, y)
+        mask = (
+            (self.ai_kind[slots] == AI_HOSTILE)
+            & (self.hp[slots] > 0)
+            & (distances <= self.detection_range[slots])
+        )
+        return [self.actors[slot] for slot in slots[mask]]
+
+    def waking(self, x: int, y: int, radius: int) -> List[Actor]:
+        """
+        (x, y)가 깨움 범위 안에 들어온 대기 중 Actor 목록
+
+        깨움 범위는 radius와 각 Actor의 감지 범위 중 큰 값입니다.
+        """
+        slots = np.flatnonzero(self.parked & self.used)
+        if slots.size == 0:
+            return []
+        distances = np.maximum(np.abs(self.x[slots] - x), np.abs(self.y[slots] - y))
+        mask = distances <= np.maximum(self.detection_range[slots], radius)
+        return [self.actors[slot] for slot in slots[mask]]
+
+    def entering(self, x: int, y: int, radius: int) -> List[Actor]:
+        """(x, y) 기준 활성 영역(radius) 안으로 들어온 휴면 중 Actor 목록"""
+        slots = np.flatnonzero(self.dormant & self.used)
+        if slots.size == 0:
+            return []
+        distances = np.maximum(np.abs(self.x[slots] - x), np.abs(self.y[slots] - y))
+        return [self.actors[slot] for slot in slots[distances <= radius]]
@@ -4,26 +4,77 @@ AI 컴포넌트
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING, List, Tuple, Optional
-import random
+
+from components.actor_store import AI_NONE, AI_HOSTILE, AI_PASSIVE
 
 if TYPE_CHECKING:
     from components.entity import Actor
     from systems.game_map import GameMap
+    from systems.pathfinding import FlowField
+
+# 8방향 이동
+_DIRECTIONS: Tuple[Tuple[int, int], ...] = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0),          (1, 0),
+    (-1, 1),  (0, 1),  (1, 1),
+)
+
+
+def _random_step(entity: Actor, game_map: GameMap) -> Optional[Tuple[int, int]]:
+    """이동 가능한 방향 중 하나를 균등하게 선택 (없으면 None)"""
+    x, y = entity.x, entity.y
+    steps = [
+        (dx, dy) for dx, dy in _DIRECTIONS if game_map.is_walkable(x + dx, y + dy)
+    ]
+    if not steps:
+        return None
+    return steps[int(game_map.rng.integers(len(steps)))]
 
 
 class BaseAI:
     """AI 기본 클래스"""
 
+    kind = AI_NONE  # ActorStore에 기록되는 AI 종류
+    WANDER_CHANCE = 0.0  # 한 번 행동할 때 배회 이동할 확률
+
     def __init__(self):
         self.entity: Actor = None  # type: ignore
 
-    def perform(self, game_map: GameMap, target: Actor) -> Optional[Tuple[int, int]]:
+    def catch_up(self, game_map: GameMap, missed_actions: int, max_steps: int) -> None:
+        """
+        휴면 중 놓친 행동을 한 번에 따라잡기
+
+        전체 AI를 다시 돌리는 대신, 놓친 행동 수에 배회 확률을 곱한 만큼
+        (최대 max_steps) 임의 이동만 적용합니다.
+
+        Args:
+            game_map: 현재 게임 맵
+            missed_actions: 휴면 중 놓친 행동 수
+            max_steps: 최대 이동 칸 수
+        """
+        steps = min(int(missed_actions * self.WANDER_CHANCE), max_steps)
+        for _ in range(steps):
+            step = _random_step(self.entity, game_map)
+            if step is None:
+                break
+            self.entity.move(*step)
+
+    def perform(
+        self,
+        game_map: GameMap,
+        target: Actor,
+        flow_field: Optional[FlowField] = None,
+        detected: Optional[bool] = None,
+    ) -> Optional[Tuple[int, int]]:
         """
         AI 행동 수행
 
         Args:
             game_map: 현재 게임 맵
             target: 추적 대상 (보통 플레이어)
+            flow_field: 대상 기준 거리 지도 (엔진이 턴마다 공유)
+            detected: 대상이 감지 범위 안인지 (엔진이 ActorStore.detecting으로
+                한 번에 계산, None이면 AI가 직접 거리를 비교)
 
         Returns:
             이동할 방향 (dx, dy) 또는 None
@@ -37,12 +88,37 @@ class HostileAI(BaseAI):
     플레이어를 감지하면 추적하고 공격
     """
 
+    kind = AI_HOSTILE
+    WANDER_CHANCE = 0.25
+
     def __init__(self, detection_range: int = 8):
         super().__init__()
-        self.detection_range = detection_range
+        self._detection_range = detection_range
         self.path: List[Tuple[int, int]] = []
 
-    def perform(self, game_map: GameMap, target: Actor) -> Optional[Tuple[int, int]]:
+    @property
+    def detection_range(self) -> int:
+        """감지 범위 (ActorStore에 연결되어 있으면 저장소 열 사용)"""
+        entity = self.entity
+        if entity is not None and entity._store is not None and entity._ai is self:
+            return int(entity._store.detection_range[entity._slot])
+        return self._detection_range
+
+    @detection_range.setter
+    def detection_range(self, value: int) -> None:
+        entity = self.entity
+        if entity is not None and entity._store is not None and entity._ai is self:
+            entity._store.detection_range[entity._slot] = value
+        else:
+            self._detection_range = value
+
+    def perform(
+        self,
+        game_map: GameMap,
+        target: Actor,
+        flow_field: Optional[FlowField] = None,
+        detected: Optional[bool] = None,
+    ) -> Optional[Tuple[int, int]]:
         """적대적 행동 수행"""
         if not self.entity or not target:
             return None
@@ -53,7 +129,9 @@ class HostileAI(BaseAI):
         distance = max(abs(dx), abs(dy))  # 체비셰프 거리
 
         # 감지 범위 밖이면 아무것도 안 함
-        if distance > self.detection_range:
+        if detected is None:
+            detected = distance <= self.detection_range
+        if not detected:
             return self._wander(game_map)
 
         # 시야 내에 있는지 확인 (간단한 체크)
@@ -65,9 +143,52 @@ class HostileAI(BaseAI):
         if distance <= 1:
             return (dx, dy)  # 공격 방향
 
-        # 추적 이동 (간단한 직선 추적)
+        # 추적 이동 (거리 지도를 따라 벽을 돌아감)
+        if flow_field is not None and flow_field.origin == (target.x, target.y):
+            step = flow_field.next_step(self.entity.x, self.entity.y, game_map)
+            if step is not None:
+                return step
+
+        # 거리 지도가 없거나 범위 밖이면 A* 경로 추적
+        step = self._follow_path(target.x, target.y, game_map)
+        if step is not None:
+            return step
+
         return self._move_towards(target.x, target.y, game_map)
 
+    def _follow_path(
+        self, target_x: int, target_y: int, game_map: GameMap
+    ) -> Optional[Tuple[int, int]]:
+        """
+        저장된 경로(self.path)를 따라 이동
+
+        목표가 바뀌었거나 경로에서 벗어났을 때만 다시 계산하므로
+        여러 턴에 걸쳐 같은 경로를 재사용합니다.
+        """
+        if (
+            not self.path
+            or self.path[-1] != (target_x, target_y)
+            or max(
+                abs(self.path[0][0] - self.entity.x),
+                abs(self.path[0][1] - self.entity.y),
+            ) != 1
+        ):
+            self.path = game_map.get_path(
+                (self.entity.x, self.entity.y), (target_x, target_y)
+            )
+
+        if not self.path:
+            return None
+
+        next_x, next_y = self.path[0]
+        if (next_x, next_y) != (target_x, target_y) and not game_map.is_walkable(
+            next_x, next_y
+        ):
+            return None  # 다른 엔티티가 막고 있음 (경로는 유지)
+
+        self.path.pop(0)
+        return (next_x - self.entity.x, next_y - self.entity.y)
+
     def _move_towards(
         self, target_x: int, target_y: int, game_map: GameMap
     ) -> Optional[Tuple[int, int]]:
@@ -97,24 +218,10 @@ class HostileAI(BaseAI):
     def _wander(self, game_map: GameMap) -> Optional[Tuple[int, int]]:
         """배회 (랜덤 이동)"""
         # 25% 확률로 이동
-        if random.random() > 0.25:
+        if game_map.rng.random() > self.WANDER_CHANCE:
             return None
 
-        # 랜덤 방향
-        directions = [
-            (-1, -1), (0, -1), (1, -1),
-            (-1, 0),          (1, 0),
-            (-1, 1),  (0, 1),  (1, 1),
-        ]
-        random.shuffle(directions)
-
-        for dx, dy in directions:
-            new_x = self.entity.x + dx
-            new_y = self.entity.y + dy
-            if game_map.is_walkable(new_x, new_y):
-                return (dx, dy)
-
-        return None
+        return _random_step(self.entity, game_map)
 
 
 class PassiveAI(BaseAI):
@@ -123,13 +230,22 @@ class PassiveAI(BaseAI):
     공격받기 전까지는 공격하지 않음 (동물, 중립 NPC)
     """
 
+    kind = AI_PASSIVE
+    WANDER_CHANCE = 0.1
+
     def __init__(self, flee_hp_percent: float = 0.3):
         super().__init__()
         self.is_hostile = False
         self.flee_hp_percent = flee_hp_percent
 
-    def perform(self, game_map: GameMap, target: Actor) -> Optional[Tuple[int, int]]:
-        """수동적 행동 수행"""
+    def perform(
+        self,
+        game_map: GameMap,
+        target: Actor,
+        flow_field: Optional[FlowField] = None,
+        detected: Optional[bool] = None,
+    ) -> Optional[Tuple[int, int]]:
+        """수동적 행동 수행 (감지 범위가 없으므로 detected는 쓰지 않음)"""
         if not self.entity:
             return None
 
@@ -141,7 +257,7 @@ class PassiveAI(BaseAI):
 
         # 적대적 상태가 되면 추적
         if self.is_hostile:
-            return self._chase(target, game_map)
+            return self._chase(target, game_map, flow_field)
 
         # 평화로운 배회
         return self._peaceful_wander(game_map)
@@ -168,7 +284,12 @@ class PassiveAI(BaseAI):
 
         return self._peaceful_wander(game_map)
 
-    def _chase(self, target: Actor, game_map: GameMap) -> Optional[Tuple[int, int]]:
+    def _chase(
+        self,
+        target: Actor,
+        game_map: GameMap,
+        flow_field: Optional[FlowField] = None,
+    ) -> Optional[Tuple[int, int]]:
         """대상 추적"""
         if not target:
             return None
@@ -180,6 +301,11 @@ class PassiveAI(BaseAI):
         if distance <= 1:
             return (dx, dy)  # 공격
 
+        if flow_field is not None and flow_field.origin == (target.x, target.y):
+            step = flow_field.next_step(self.entity.x, self.entity.y, game_map)
+            if step is not None:
+                return step
+
         # 정규화
         dx = 0 if dx == 0 else (1 if dx > 0 else -1)
         dy = 0 if dy == 0 else (1 if dy > 0 else -1)
@@ -195,23 +321,10 @@ class PassiveAI(BaseAI):
     def _peaceful_wander(self, game_map: GameMap) -> Optional[Tuple[int, int]]:
         """평화로운 배회"""
         # 10% 확률로 이동
-        if random.random() > 0.1:
+        if game_map.rng.random() > self.WANDER_CHANCE:
             return None
 
-        directions = [
-            (-1, -1), (0, -1), (1, -1),
-            (-1, 0),          (1, 0),
-            (-1, 1),  (0, 1),  (1, 1),
-        ]
-        random.shuffle(directions)
-
-        for dx, dy in directions:
-            new_x = self.entity.x + dx
-            new_y = self.entity.y + dy
-            if game_map.is_walkable(new_x, new_y):
-                return (dx, dy)
-
-        return None
+        return _random_step(self.entity, game_map)
 
     def become_hostile(self) -> None:
         """적대적 상태로 전환"""
@@ -3,17 +3,21 @@ Entity 컴포넌트
 게임의 모든 객체(플레이어, 몬스터, 아이템)의 기본 클래스
 """
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, TYPE_CHECKING
 import copy
 
 if TYPE_CHECKING:
+    from components.actor_store import ActorStore
     from components.ai import BaseAI
+    from components.equipment import Equipment
     from components.fighter import Fighter
     from components.inventory import Inventory
     from components.survival import Survival
     from components.npc import NPCComponent
     from systems.quest import QuestLog
     from systems.religion import Religion
+    from systems.game_map import GameMap
 
 
 class Entity:
@@ -21,33 +25,35 @@ class Entity:
     게임 내 모든 객체의 기본 클래스
 
     Attributes:
-        x, y: 맵에서의 위치
-        char: 화면에 표시될 ASCII 문자
-        color: 표시 색상 (R, G, B)
-        name: 엔티티 이름
+        x, y: 맵에서의 위치 (서브클래스가 제공)
+        char: 화면에 표시될 ASCII 문자 (서브클래스가 제공)
+        color: 표시 색상 (R, G, B) (서브클래스가 제공)
+        name: 엔티티 이름 (서브클래스가 제공)
         blocks_movement: 이동을 막는지 여부
+        game_map: 소속된 맵 (GameMap.add_entity/add_item에서 설정)
+
+    위치와 표시 정보는 서브클래스마다 저장 방식이 달라서
+    (Actor는 ActorStore, Item은 프로토타입) 공통 슬롯은 두 개뿐이고,
+    나머지 슬롯과 그 초기화는 실제로 값을 저장하는 서브클래스가 맡습니다.
     """
 
-    def __init__(
-        self,
-        x: int = 0,
-        y: int = 0,
-        char: str = "?",
-        color: tuple[int, int, int] = (255, 255, 255),
-        name: str = "<Unnamed>",
-        blocks_movement: bool = False,
-    ):
-        self.x = x
-        self.y = y
-        self.char = char
-        self.color = color
-        self.name = name
+    __slots__ = ("blocks_movement", "game_map")
+
+    def __init__(self, blocks_movement: bool = False):
         self.blocks_movement = blocks_movement
+        self.game_map: Optional[GameMap] = None
 
     def move(self, dx: int, dy: int) -> None:
         """엔티티를 상대적으로 이동"""
-        self.x += dx
-        self.y += dy
+        self.place(self.x + dx, self.y + dy)
+
+    def place(self, x: int, y: int) -> None:
+        """엔티티를 절대 좌표로 이동 (맵의 공간 인덱스 갱신)"""
+        old_x, old_y = self.x, self.y
+        self.x = x
+        self.y = y
+        if self.game_map is not None:
+            self.game_map.update_position(self, old_x, old_y)
 
     def distance_to(self, other: Entity) -> float:
         """다른 엔티티까지의 거리 계산"""
@@ -68,8 +74,19 @@ class Actor(Entity):
         fighter: 전투 컴포넌트
         inventory: 인벤토리 컴포넌트
         survival: 생존 컴포넌트 (플레이어용)
+        equipment: 장비 컴포넌트 (무기 속도가 공격 시간에 반영됨)
+        speed: 행동 속도 (100 = 보통, 높을수록 자주 행동)
+
+    맵에 추가되면 위치와 전투/AI 수치는 맵의 ActorStore 행에 저장되고,
+    이 클래스는 그 행을 읽고 쓰는 파사드로 동작합니다.
     """
 
+    __slots__ = (
+        "_store", "_slot", "_ai", "_fighter", "_x", "_y", "char", "color", "name",
+        "inventory", "survival", "equipment", "npc", "gold", "quest_log", "religion",
+        "speed",
+    )
+
     def __init__(
         self,
         x: int = 0,
@@ -83,22 +100,23 @@ class Actor(Entity):
         survival: Optional[Survival] = None,
         npc: Optional[NPCComponent] = None,
         gold: int = 0,
+        equipment: Optional[Equipment] = None,
+        speed: int = 100,
     ):
-        super().__init__(
-            x=x,
-            y=y,
-            char=char,
-            color=color,
-            name=name,
-            blocks_movement=True,  # Actor는 항상 이동을 막음
-        )
-        self.ai = ai
-        if self.ai:
-            self.ai.entity = self
+        # ActorStore 연결 정보 (GameMap.add_entity에서 설정)
+        self._store: Optional[ActorStore] = None
+        self._slot = -1
+        self._ai: Optional[BaseAI] = None
+        self._fighter: Optional[Fighter] = None
 
+        super().__init__(blocks_movement=True)  # Actor는 항상 이동을 막음
+        self.x = x
+        self.y = y
+        self.char = char
+        self.color = color
+        self.name = name
+        self.ai = ai
         self.fighter = fighter
-        if self.fighter:
-            self.fighter.entity = self
 
         self.inventory = inventory
         if self.inventory:
@@ -108,6 +126,13 @@ class Actor(Entity):
         if self.survival:
             self.survival.entity = self
 
+        self.equipment = equipment
+        if self.equipment:
+            self.equipment.entity = self
+
+        # 행동 속도 (TurnScheduler가 행동 간격 계산에 사용)
+        self.speed = speed
+
         # NPC 컴포넌트
         self.npc = npc
         if self.npc:
@@ -120,6 +145,56 @@ class Actor(Entity):
         self.quest_log: Optional[QuestLog] = None
         self.religion: Optional[Religion] = None
 
+    @property
+    def x(self) -> int:
+        if self._store is not None:
+            return int(self._store.x[self._slot])
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        if self._store is not None:
+            self._store.x[self._slot] = value
+        else:
+            self._x = value
+
+    @property
+    def y(self) -> int:
+        if self._store is not None:
+            return int(self._store.y[self._slot])
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        if self._store is not None:
+            self._store.y[self._slot] = value
+        else:
+            self._y = value
+
+    @property
+    def ai(self) -> Optional[BaseAI]:
+        return self._ai
+
+    @ai.setter
+    def ai(self, value: Optional[BaseAI]) -> None:
+        self._ai = value
+        if value is not None:
+            value.entity = self
+        if self._store is not None:
+            self._store.write_components(self)
+
+    @property
+    def fighter(self) -> Optional[Fighter]:
+        return self._fighter
+
+    @fighter.setter
+    def fighter(self, value: Optional[Fighter]) -> None:
+        self._fighter = value
+        if value is not None:
+            value.entity = self
+        if self._store is not None:
+            self._store.write_components(self)
+
     @property
     def is_alive(self) -> bool:
         """살아있는지 확인"""
@@ -128,15 +203,74 @@ class Actor(Entity):
         return False
 
 
+class ItemPrototype(NamedTuple):
+    """
+    아이템 프로토타입 (불변, 공유)
+
+    같은 종류의 아이템이 공유하는 표시 정보와 효과 수치
+    """
+    char: str
+    color: tuple[int, int, int]
+    name: str
+    consumable: bool = False
+    nutrition: int = 0
+    hydration: int = 0
+
+    def intern(self) -> ItemPrototype:
+        """같은 값의 프로토타입이 이미 있으면 그것을 반환 (플라이웨이트)"""
+        interned = _interned_prototypes.get(self)
+        if interned is not None:
+            _interned_prototypes.move_to_end(self)
+            return interned
+        _interned_prototypes[self] = self
+        if len(_interned_prototypes) > _INTERN_LIMIT:
+            _interned_prototypes.popitem(last=False)
+        return self
+
+
+# 값이 같은 프로토타입은 하나만 유지 (최근에 쓴 것부터 _INTERN_LIMIT개까지)
+# 밀려난 프로토타입도 그것을 쓰는 아이템이 있는 동안은 그대로 유효
+_INTERN_LIMIT = 256
+_interned_prototypes: OrderedDict[ItemPrototype, ItemPrototype] = OrderedDict()
+
+# ID → 프로토타입 (data/items.py 기반)
+_named_prototypes: Dict[str, ItemPrototype] = {}
+
+
+def get_item_prototype(item_id: str) -> ItemPrototype:
+    """
+    ID로 아이템 프로토타입 가져오기
+
+    Args:
+        item_id: 아이템 ID (data/items.py에 정의된)
+    """
+    prototype = _named_prototypes.get(item_id)
+    if prototype is None:
+        from data.items import ITEMS
+
+        if item_id not in ITEMS:
+            raise KeyError(f"알 수 없는 아이템 ID: {item_id}")
+        prototype = ItemPrototype(**ITEMS[item_id]).intern()
+        _named_prototypes[item_id] = prototype
+    return prototype
+
+
 class Item(Entity):
     """
     아이템 엔티티
 
+    표시 정보와 효과 수치는 공유 프로토타입에 있고,
+    각 아이템은 위치/수량/내구도만 따로 가집니다.
+    (char, name 등에 대입하면 이 아이템만의 새 프로토타입으로 교체됨)
+
     추가 속성:
-        consumable: 소비 가능 여부
-        equippable: 장착 가능 여부
+        prototype: 공유 프로토타입
+        count: 겹쳐진 수량
+        durability: 내구도 (0=해당 없음)
     """
 
+    __slots__ = ("x", "y", "prototype", "count", "durability")
+
     def __init__(
         self,
         x: int = 0,
@@ -147,15 +281,81 @@ class Item(Entity):
         consumable: bool = False,
         nutrition: int = 0,      # 음식일 경우 포만감
         hydration: int = 0,      # 음료일 경우 수분
+        prototype: Optional[ItemPrototype] = None,
+        count: int = 1,
+        durability: int = 0,
     ):
-        super().__init__(
-            x=x,
-            y=y,
-            char=char,
-            color=color,
-            name=name,
-            blocks_movement=False,  # 아이템은 이동을 막지 않음
-        )
-        self.consumable = consumable
-        self.nutrition = nutrition
-        self.hydration = hydration
+        if prototype is None:
+            prototype = ItemPrototype(
+                char, tuple(color), name, consumable, nutrition, hydration
+            ).intern()
+        self.prototype = prototype
+        self.count = count
+        self.durability = durability
+
+        # 표시 정보는 프로토타입이 가지므로 위치 관련 속성만 설정
+        super().__init__(blocks_movement=False)  # 아이템은 이동을 막지 않음
+        self.x = x
+        self.y = y
+
+    @classmethod
+    def from_prototype(cls, item_id: str, x: int = 0, y: int = 0) -> Item:
+        """data/items.py의 ID로 아이템 생성"""
+        return cls(x=x, y=y, prototype=get_item_prototype(item_id))
+
+    def _replace(self, **changes) -> None:
+        """
+        프로토타입 일부 값을 바꾼 새 프로토타입으로 교체
+
+        한 번뿐인 변경이 공유 캐시에 쌓이지 않도록 intern하지 않고
+        이 아이템만 가집니다.
+        """
+        self.prototype = self.prototype._replace(**changes)
+
+    @property
+    def char(self) -> str:
+        return self.prototype.char
+
+    @char.setter
+    def char(self, value: str) -> None:
+        self._replace(char=value)
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        return self.prototype.color
+
+    @color.setter
+    def color(self, value: tuple[int, int, int]) -> None:
+        self._replace(color=tuple(value))
+
+    @property
+    def name(self) -> str:
+        return self.prototype.name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._replace(name=value)
+
+    @property
+    def consumable(self) -> bool:
+        return self.prototype.consumable
+
+    @consumable.setter
+    def consumable(self, value: bool) -> None:
+        self._replace(consumable=value)
+
+    @property
+    def nutrition(self) -> int:
+        return self.prototype.nutrition
+
+    @nutrition.setter
+    def nutrition(self, value: int) -> None:
+        self._replace(nutrition=value)
+
+    @property
+    def hydration(self) -> int:
+        return self.prototype.hydration
+
+    @hydration.setter
+    def hydration(self, value: int) -> None:
+        self._replace(hydration=value)
@@ -3,13 +3,19 @@
 무기, 방어구 등의 장착 시스템
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Dict, List
-from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Dict, List
+from dataclasses import asdict, dataclass, field
 from enum import Enum, auto
+import numpy as np
+
+from systems import streams
 
 if TYPE_CHECKING:
     from components.entity import Actor
 
+# 난수 생성기를 넘기지 않은 호출이 공유하는 기본 스트림
+_default_rng = streams.player_streams(streams.DEFAULT_SEED)["equipment"]
+
 
 class EquipmentSlot(Enum):
     """장비 슬롯"""
@@ -186,6 +192,23 @@ class Equipment:
             if item is not None
         ]
 
+    def to_spec(self) -> Dict[str, Any]:
+        """JSON으로 저장할 수 있는 명세로 변환 (슬롯 이름 → 무기 데이터)"""
+        return {
+            slot.name: {**asdict(item), "color": list(item.color)}
+            for slot, item in self.get_equipped_list()
+        }
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "Equipment":
+        """명세에서 Equipment 생성 (내구도 등 현재 상태 포함)"""
+        equipment = cls()
+        for slot_name, data in spec.items():
+            equipment.slots[EquipmentSlot[slot_name]] = WeaponData(
+                **{**data, "color": tuple(data["color"])}
+            )
+        return equipment
+
 
 # =============================================================================
 # 무기 생성 헬퍼 함수
@@ -212,6 +235,8 @@ def create_weapon(weapon_id: str) -> Optional[WeaponData]:
 def create_random_weapon(
     weapon_type: str = None,
     rarity: str = None,
+    *,
+    rng: Optional[np.random.Generator] = None,
 ) -> Optional[WeaponData]:
     """
     랜덤 무기 생성
@@ -219,11 +244,12 @@ def create_random_weapon(
     Args:
         weapon_type: 무기 타입 필터 (melee, ranged, magic)
         rarity: 희귀도 필터
+        rng: 난수 생성기 (보통 streams.player_streams의 "equipment" 스트림,
+            None이면 기본 시드의 공유 스트림)
 
     Returns:
         랜덤 생성된 무기
     """
-    import random
     from data.weapons import ALL_WEAPONS
 
     candidates = []
@@ -237,7 +263,9 @@ def create_random_weapon(
     if not candidates:
         return None
 
-    weapon_id, weapon_data = random.choice(candidates)
+    if rng is None:
+        rng = _default_rng
+    weapon_id, weapon_data = candidates[int(rng.integers(len(candidates)))]
     return WeaponData.from_dict(weapon_id, weapon_data)
 
 
@@ -249,6 +277,8 @@ def calculate_weapon_damage(
     attacker: Actor,
     weapon: Optional[WeaponData],
     target: Actor,
+    *,
+    rng: Optional[np.random.Generator] = None,
 ) -> tuple[int, List[str]]:
     """
     무기 데미지 계산
@@ -257,12 +287,11 @@ def calculate_weapon_damage(
         attacker: 공격자
         weapon: 사용 무기 (None이면 맨손)
         target: 대상
+        rng: 명중 판정용 난수 생성기 (None이면 기본 시드의 공유 스트림)
 
     Returns:
         (총 데미지, 적용된 효과 리스트)
     """
-    import random
-
     # 기본 데미지
     base_damage = attacker.power if hasattr(attacker, 'power') else 5
 
@@ -299,7 +328,9 @@ def calculate_weapon_damage(
     if weapon:
         accuracy += weapon.accuracy
 
-    if random.randint(1, 100) > accuracy:
+    if rng is None:
+        rng = _default_rng
+    if int(rng.integers(1, 101)) > accuracy:
         return 0, ["빗나감"]
 
     return total_damage, effects_applied
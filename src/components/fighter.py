@@ -18,27 +18,92 @@ class Fighter:
         hp: 현재 체력
         defense: 방어력 (받는 데미지 감소)
         power: 공격력 (주는 데미지)
+
+    소유 Actor가 맵의 ActorStore에 연결되어 있으면 수치는 저장소 열에서
+    읽고 쓰며, 그렇지 않으면 로컬 값을 사용합니다.
     """
 
+    __slots__ = ("_max_hp", "_hp", "_defense", "_power", "entity")
+
     def __init__(
         self,
         hp: int,
         defense: int,
         power: int,
     ):
-        self.max_hp = hp
+        self._max_hp = hp
         self._hp = hp
-        self.defense = defense
-        self.power = power
+        self._defense = defense
+        self._power = power
         self.entity: Actor = None  # type: ignore
 
+    def _row(self):
+        """연결된 ActorStore와 행 번호 (없으면 None)"""
+        entity = self.entity
+        if entity is not None and entity._store is not None and entity._fighter is self:
+            return entity._store, entity._slot
+        return None
+
     @property
     def hp(self) -> int:
+        row = self._row()
+        if row is not None:
+            return int(row[0].hp[row[1]])
         return self._hp
 
     @hp.setter
     def hp(self, value: int) -> None:
-        self._hp = max(0, min(value, self.max_hp))
+        value = max(0, min(value, self.max_hp))
+        row = self._row()
+        if row is not None:
+            row[0].hp[row[1]] = value
+        else:
+            self._hp = value
+
+    @property
+    def max_hp(self) -> int:
+        row = self._row()
+        if row is not None:
+            return int(row[0].max_hp[row[1]])
+        return self._max_hp
+
+    @max_hp.setter
+    def max_hp(self, value: int) -> None:
+        row = self._row()
+        if row is not None:
+            row[0].max_hp[row[1]] = value
+        else:
+            self._max_hp = value
+
+    @property
+    def defense(self) -> int:
+        row = self._row()
+        if row is not None:
+            return int(row[0].defense[row[1]])
+        return self._defense
+
+    @defense.setter
+    def defense(self, value: int) -> None:
+        row = self._row()
+        if row is not None:
+            row[0].defense[row[1]] = value
+        else:
+            self._defense = value
+
+    @property
+    def power(self) -> int:
+        row = self._row()
+        if row is not None:
+            return int(row[0].power[row[1]])
+        return self._power
+
+    @power.setter
+    def power(self, value: int) -> None:
+        row = self._row()
+        if row is not None:
+            row[0].power[row[1]] = value
+        else:
+            self._power = value
 
     def take_damage(self, amount: int) -> int:
         """
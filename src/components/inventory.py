@@ -18,6 +18,8 @@ class Inventory:
         items: 소지 중인 아이템 리스트
     """
 
+    __slots__ = ("capacity", "items", "entity")
+
     def __init__(self, capacity: int = 26):  # a-z까지 26개
         self.capacity = capacity
         self.items: List[Item] = []
@@ -16,20 +16,42 @@ MAP_HEIGHT = 43
 # UI 영역
 UI_HEIGHT = 7  # 하단 UI 높이
 
+# 렌더링
+RENDER_FPS = 60  # 초당 최대 화면 갱신 횟수 (이 간격 안에 들어온 입력은 모아서 처리)
+SHOW_AI_STATS = True  # 상태바에 지난 적 턴의 AI 실행/휴면 Actor 수 표시
+
 # =============================================================================
 # 맵 생성 설정
 # =============================================================================
 ROOM_MAX_SIZE = 10
 ROOM_MIN_SIZE = 6
 MAX_ROOMS = 30
+DUNGEON_ALGORITHM = "rooms"  # 방 배치 알고리즘: "rooms" (무작위 배치) 또는 "bsp" (BSP 분할)
+LEVEL_CACHE_SIZE = 3  # 메모리에 유지할 최대 층 수 (나머지는 디스크로)
+WORLD_SEED = None     # 월드 시드 (정수로 고정하면 같은 던전이 재현됨, None이면 무작위)
+PREGENERATE_LEVELS = 2  # 백그라운드 프로세스에서 미리 만들어 둘 다음 층 수 (0이면 끔)
 
 # =============================================================================
 # 시야(FOV) 설정
 # =============================================================================
-FOV_ALGORITHM = 0  # 기본 FOV 알고리즘
+FOV_ALGORITHM = 0  # 0: 대칭 섀도캐스팅, 1: 관대한 섀도캐스팅 (systems/fov.py)
 FOV_LIGHT_WALLS = True
 FOV_RADIUS = 10
 
+# =============================================================================
+# AI 설정
+# =============================================================================
+FLOW_FIELD_RADIUS = 20  # 추적용 거리 지도 계산 범위 (플레이어 기준 타일)
+
+# 행동 시간 (속도 100인 Actor가 한 번 행동하는 데 걸리는 시간)
+ACTION_COST = 100
+WAKE_RADIUS = 10   # 대기 중인 Actor가 깨어나는 플레이어 거리
+NOISE_RADIUS = 6   # 전투 소음이 대기 중인 Actor를 깨우는 거리
+
+# 시뮬레이션 LOD (이 거리 밖의 Actor는 휴면했다가 돌아올 때 따라잡음)
+SIMULATION_RADIUS = 30
+CATCH_UP_MAX_STEPS = 8  # 따라잡기 때 최대 이동 칸 수
+
 # =============================================================================
 # 생존 시스템 설정
 # =============================================================================
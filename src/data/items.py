@@ -0,0 +1,68 @@
+"""
+아이템 프로토타입 데이터 정의
+이 파일을 수정하여 바닥에 생성되는 기본 아이템을 추가/수정할 수 있습니다.
+
+같은 ID로 생성된 아이템은 모두 하나의 불변 프로토타입(ItemPrototype)을
+공유하고, 각 아이템은 위치/수량/내구도만 따로 가집니다.
+
+아이템 속성 설명:
+- name: 아이템 이름 (한글)
+- char: ASCII 문자
+- color: RGB 색상 튜플
+- consumable: 소비 가능 여부
+- nutrition: 먹었을 때 포만감
+- hydration: 마셨을 때 수분
+"""
+
+# =============================================================================
+# 음식/음료
+# =============================================================================
+ITEMS = {
+    "dried_meat": {
+        "name": "마른 고기",
+        "char": "%",
+        "color": (0, 200, 0),
+        "consumable": True,
+        "nutrition": 200,
+        "hydration": 0,
+    },
+    "water_bottle": {
+        "name": "물병",
+        "char": "!",
+        "color": (0, 150, 255),
+        "consumable": True,
+        "nutrition": 0,
+        "hydration": 300,
+    },
+    "healing_potion": {
+        "name": "치료 물약",
+        "char": "!",
+        "color": (255, 0, 0),
+        "consumable": True,
+        "nutrition": 0,
+        "hydration": 0,
+    },
+
+    # --- 야외 자원 ---
+    "wild_berry": {
+        "name": "야생 베리",
+        "char": ";",
+        "color": (100, 200, 100),
+        "consumable": True,
+        "nutrition": 50,
+        "hydration": 30,
+    },
+    "herb": {
+        "name": "약초",
+        "char": ";",
+        "color": (0, 150, 0),
+        "consumable": True,
+        "nutrition": 10,
+        "hydration": 0,
+    },
+}
+
+
+def get_item(item_id: str) -> dict:
+    """ID로 아이템 데이터 가져오기"""
+    return ITEMS.get(item_id, {})
@@ -13,10 +13,14 @@ Nethack + Unreal World 스타일
     x: 둘러보기
     r: 휴식
     .: 대기
+    >/<: 계단 내려가기/올라가기
     Ctrl+Q: 종료
 """
 import sys
 import os
+import time
+import atexit
+from typing import List
 
 # 모듈 경로 설정
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -29,9 +33,7 @@ from config import (
     SCREEN_HEIGHT,
     MAP_WIDTH,
     MAP_HEIGHT,
-    ROOM_MIN_SIZE,
-    ROOM_MAX_SIZE,
-    MAX_ROOMS,
+    RENDER_FPS,
     Colors,
     Symbols,
 )
@@ -39,10 +41,12 @@ from components.entity import Actor
 from components.fighter import Fighter
 from components.survival import Survival
 from components.inventory import Inventory
+from components.equipment import Equipment
 from systems.engine import Engine, GameState
 from systems.game_map import GameMap
-from systems import procgen
+from systems.level_manager import create_dungeon_levels
 from systems import renderer
+from systems.camera import Camera
 from systems.input_handler import (
     handle_main_game_input,
     handle_inventory_input,
@@ -58,6 +62,8 @@ from systems.input_handler import (
     QuitAction,
     EscapeAction,
     RestAction,
+    DescendAction,
+    AscendAction,
 )
 
 
@@ -71,6 +77,7 @@ def create_player() -> Actor:
         name="당신",
         fighter=Fighter(hp=30, defense=2, power=5),
         inventory=Inventory(capacity=26),
+        equipment=Equipment(),
         survival=Survival(
             max_hunger=1000,
             max_thirst=1000,
@@ -85,20 +92,12 @@ def new_game() -> Engine:
     # 플레이어 생성
     player = create_player()
 
-    # 던전 생성
-    game_map = procgen.generate_dungeon(
-        map_width=MAP_WIDTH,
-        map_height=MAP_HEIGHT,
-        max_rooms=MAX_ROOMS,
-        room_min_size=ROOM_MIN_SIZE,
-        room_max_size=ROOM_MAX_SIZE,
-        player=player,
-        max_monsters_per_room=2,
-        max_items_per_room=2,
-    )
+    # 던전 생성 (1층)
+    levels = create_dungeon_levels()
+    game_map = levels.get(1, player)
 
     # 엔진 생성
-    engine = Engine(player=player, game_map=game_map)
+    engine = Engine(player=player, game_map=game_map, levels=levels)
 
     # 초기 메시지
     engine.message_log.add(
@@ -116,6 +115,163 @@ def new_game() -> Engine:
     return engine
 
 
+class UIState:
+    """
+    화면 전용 상태 (게임 엔진 밖에서 관리)
+
+    Attributes:
+        show_help: 도움말 창 표시 여부
+        look_x, look_y: 둘러보기 모드 커서 위치
+    """
+
+    def __init__(self, engine: Engine):
+        self.show_help = False
+        self.look_x = engine.player.x
+        self.look_y = engine.player.y
+
+    def view_key(self, engine: Engine) -> tuple:
+        """화면에 영향을 주는 UI 상태 요약 키"""
+        look = (self.look_x, self.look_y) if engine.game_state == GameState.LOOK else None
+        return (self.show_help, look)
+
+
+def handle_event(event: tcod.event.Event, engine: Engine, ui: UIState) -> None:
+    """
+    입력 이벤트 하나 처리 (행동 실행, 턴 진행)
+
+    Args:
+        event: tcod 이벤트
+        engine: 게임 엔진
+        ui: 화면 전용 상태
+    """
+    # 창 닫기
+    if isinstance(event, tcod.event.Quit):
+        raise SystemExit()
+
+    # 키보드 입력
+    if not isinstance(event, tcod.event.KeyDown):
+        return
+
+    # 도움말 토글
+    if event.sym == tcod.event.KeySym.QUESTION or (
+        event.sym == tcod.event.KeySym.SLASH
+        and event.mod & tcod.event.KMOD_SHIFT
+    ):
+        ui.show_help = not ui.show_help
+        return
+
+    if ui.show_help:
+        if event.sym == tcod.event.KeySym.ESCAPE:
+            ui.show_help = False
+        return
+
+    # 상태별 입력 처리
+    action = None
+
+    if engine.game_state == GameState.PLAYING:
+        action = handle_main_game_input(event)
+    elif engine.game_state == GameState.INVENTORY:
+        action = handle_inventory_input(event)
+    elif engine.game_state == GameState.PLAYER_DEAD:
+        action = handle_dead_input(event)
+    elif engine.game_state == GameState.LOOK:
+        action = handle_look_input(event)
+
+    if action is None:
+        return
+
+    # 액션 처리
+    turn_consumed = False
+
+    if isinstance(action, QuitAction):
+        raise SystemExit()
+
+    elif isinstance(action, EscapeAction):
+        if engine.game_state == GameState.INVENTORY:
+            engine.game_state = GameState.PLAYING
+        elif engine.game_state == GameState.LOOK:
+            engine.game_state = GameState.PLAYING
+        else:
+            raise SystemExit()
+
+    elif isinstance(action, MoveAction):
+        if engine.game_state == GameState.LOOK:
+            # 둘러보기 모드: 커서 이동
+            new_x = ui.look_x + action.dx
+            new_y = ui.look_y + action.dy
+            if engine.game_map and engine.game_map.in_bounds(new_x, new_y):
+                ui.look_x = new_x
+                ui.look_y = new_y
+        else:
+            # 일반 모드: 플레이어 이동
+            turn_consumed = engine.handle_player_turn(action.dx, action.dy)
+
+    elif isinstance(action, WaitAction):
+        turn_consumed = True
+
+    elif isinstance(action, DescendAction):
+        turn_consumed = engine.descend()
+
+    elif isinstance(action, AscendAction):
+        turn_consumed = engine.ascend()
+
+    elif isinstance(action, PickupAction):
+        turn_consumed = engine.pickup_item()
+
+    elif isinstance(action, InventoryAction):
+        engine.game_state = GameState.INVENTORY
+
+    elif isinstance(action, UseItemAction):
+        turn_consumed = engine.use_item(action.index)
+        if turn_consumed:
+            engine.game_state = GameState.PLAYING
+
+    elif isinstance(action, DropItemAction):
+        turn_consumed = engine.drop_item(action.index)
+        if turn_consumed:
+            engine.game_state = GameState.PLAYING
+
+    elif isinstance(action, LookAction):
+        engine.game_state = GameState.LOOK
+        ui.look_x = engine.player.x
+        ui.look_y = engine.player.y
+
+    elif isinstance(action, RestAction):
+        if engine.player.survival:
+            if engine.player.survival.is_resting:
+                msg = engine.player.survival.stop_rest()
+            else:
+                msg = engine.player.survival.rest()
+            engine.message_log.add(msg)
+        turn_consumed = True
+
+    # 턴 처리
+    if turn_consumed and engine.game_state == GameState.PLAYING:
+        # 적 턴
+        engine.handle_enemy_turn()
+
+        # 턴 종료 처리 (생존 시스템 등)
+        engine.process_turn()
+
+        # FOV 업데이트
+        engine.update_fov()
+
+
+def collect_events(last_present: float, frame_time: float) -> List[tcod.event.Event]:
+    """
+    처리할 입력 모으기
+
+    첫 입력이 올 때까지 기다린 뒤, 마지막 화면 갱신 후 한 프레임이
+    지날 때까지 들어오는 입력(키 반복 등)을 모두 모아 한 번에 돌려줍니다.
+    """
+    events = list(tcod.event.wait())
+    while True:
+        remaining = frame_time - (time.perf_counter() - last_present)
+        if remaining <= 0:
+            return events
+        events.extend(tcod.event.wait(timeout=remaining))
+
+
 def main() -> None:
     """메인 함수"""
     # 폰트 설정 (기본 tcod 폰트 사용)
@@ -130,10 +286,12 @@ def main() -> None:
     # 게임 초기화
     engine = new_game()
 
-    # 둘러보기 모드 커서
-    look_cursor_x = engine.player.x
-    look_cursor_y = engine.player.y
-    show_help = False
+    # 종료 시 미리 생성 프로세스와 임시 층 파일 정리
+    if engine.levels:
+        atexit.register(engine.levels.close)
+
+    # 화면 전용 상태 (도움말, 둘러보기 커서)
+    ui = UIState(engine)
 
     # tcod 컨텍스트 생성
     with tcod.context.new(
@@ -147,140 +305,61 @@ def main() -> None:
         # 루트 콘솔 생성
         root_console = tcod.console.Console(SCREEN_WIDTH, SCREEN_HEIGHT, order="F")
 
-        # 메인 게임 루프
-        while True:
-            # 화면 클리어
-            root_console.clear()
-
-            # 렌더링
-            if engine.game_map:
-                renderer.render_map(root_console, engine.game_map)
-
-            renderer.render_ui(root_console, engine)
-
-            # 상태별 추가 렌더링
-            if engine.game_state == GameState.PLAYER_DEAD:
-                renderer.render_game_over(root_console)
-            elif engine.game_state == GameState.INVENTORY:
-                renderer.render_inventory(root_console, engine)
-            elif engine.game_state == GameState.LOOK:
-                renderer.render_look_mode(
-                    root_console, engine, look_cursor_x, look_cursor_y
-                )
+        # 증분 맵 렌더러 (콘솔을 지우지 않고 바뀐 칸만 다시 그림)
+        # 카메라는 화면의 맵 영역만큼 맵을 잘라 보여줌
+        map_renderer = renderer.MapRenderer(MAP_WIDTH, MAP_HEIGHT)
+        camera = Camera(MAP_WIDTH, MAP_HEIGHT)
+        # 상태 패널 (표시 값이 바뀐 위젯만 다시 그림)
+        status_panel = renderer.StatusPanel()
+        overlay_state = None
 
-            if show_help:
-                renderer.render_help(root_console)
+        frame_time = 1.0 / RENDER_FPS
+        last_view = None
+        last_present = 0.0
 
-            # 화면 표시
-            context.present(root_console)
+        # 메인 게임 루프: 화면 상태가 바뀌었을 때만 그리고, 쌓인 입력은 한 번에 처리
+        while True:
+            view = (engine.view_key(), ui.view_key(engine))
+            if view != last_view:
+                last_view = view
+
+                # 맵 위에 그리는 창이 열리거나 닫히면 맵 영역 전체를 다시 그림
+                if (engine.game_state, ui.show_help) != overlay_state:
+                    overlay_state = (engine.game_state, ui.show_help)
+                    map_renderer.invalidate()
+
+                # 렌더링
+                renderer.render_frame(
+                    root_console,
+                    engine,
+                    map_renderer,
+                    look=(ui.look_x, ui.look_y),
+                    show_help=ui.show_help,
+                    camera=camera,
+                    status_panel=status_panel,
+                )
 
-            # 이벤트 처리
-            for event in tcod.event.wait():
-                # 창 닫기
-                if isinstance(event, tcod.event.Quit):
-                    raise SystemExit()
+                # 화면 표시
+                context.present(root_console)
+                last_present = time.perf_counter()
 
-                # 키보드 입력
-                if not isinstance(event, tcod.event.KeyDown):
+            # 이벤트 처리 (한 프레임 동안 쌓인 입력을 모두 처리)
+            messages = engine.message_log.revision
+            for event in collect_events(last_present, frame_time):
+                # 창 크기 변경/노출 등은 화면만 다시 그림
+                if isinstance(event, tcod.event.WindowEvent):
+                    last_view = None
                     continue
 
-                # 도움말 토글
-                if event.sym == tcod.event.KeySym.QUESTION or (
-                    event.sym == tcod.event.KeySym.SLASH
-                    and event.mod & tcod.event.KMOD_SHIFT
+                # 무언가 보고된 뒤에 쌓인 키 반복 입력은 버림 (이동 중 기습 등)
+                if (
+                    isinstance(event, tcod.event.KeyDown)
+                    and event.repeat
+                    and engine.message_log.revision != messages
                 ):
-                    show_help = not show_help
-                    continue
-
-                if show_help:
-                    if event.sym == tcod.event.KeySym.ESCAPE:
-                        show_help = False
-                    continue
-
-                # 상태별 입력 처리
-                action = None
-
-                if engine.game_state == GameState.PLAYING:
-                    action = handle_main_game_input(event)
-                elif engine.game_state == GameState.INVENTORY:
-                    action = handle_inventory_input(event)
-                elif engine.game_state == GameState.PLAYER_DEAD:
-                    action = handle_dead_input(event)
-                elif engine.game_state == GameState.LOOK:
-                    action = handle_look_input(event)
-
-                if action is None:
                     continue
 
-                # 액션 처리
-                turn_consumed = False
-
-                if isinstance(action, QuitAction):
-                    raise SystemExit()
-
-                elif isinstance(action, EscapeAction):
-                    if engine.game_state == GameState.INVENTORY:
-                        engine.game_state = GameState.PLAYING
-                    elif engine.game_state == GameState.LOOK:
-                        engine.game_state = GameState.PLAYING
-                    else:
-                        raise SystemExit()
-
-                elif isinstance(action, MoveAction):
-                    if engine.game_state == GameState.LOOK:
-                        # 둘러보기 모드: 커서 이동
-                        new_x = look_cursor_x + action.dx
-                        new_y = look_cursor_y + action.dy
-                        if engine.game_map and engine.game_map.in_bounds(new_x, new_y):
-                            look_cursor_x = new_x
-                            look_cursor_y = new_y
-                    else:
-                        # 일반 모드: 플레이어 이동
-                        turn_consumed = engine.handle_player_turn(action.dx, action.dy)
-
-                elif isinstance(action, WaitAction):
-                    turn_consumed = True
-
-                elif isinstance(action, PickupAction):
-                    turn_consumed = engine.pickup_item()
-
-                elif isinstance(action, InventoryAction):
-                    engine.game_state = GameState.INVENTORY
-
-                elif isinstance(action, UseItemAction):
-                    turn_consumed = engine.use_item(action.index)
-                    if turn_consumed:
-                        engine.game_state = GameState.PLAYING
-
-                elif isinstance(action, DropItemAction):
-                    turn_consumed = engine.drop_item(action.index)
-                    if turn_consumed:
-                        engine.game_state = GameState.PLAYING
-
-                elif isinstance(action, LookAction):
-                    engine.game_state = GameState.LOOK
-                    look_cursor_x = engine.player.x
-                    look_cursor_y = engine.player.y
-
-                elif isinstance(action, RestAction):
-                    if engine.player.survival:
-                        if engine.player.survival.is_resting:
-                            msg = engine.player.survival.stop_rest()
-                        else:
-                            msg = engine.player.survival.rest()
-                        engine.message_log.add(msg)
-                    turn_consumed = True
-
-                # 턴 처리
-                if turn_consumed and engine.game_state == GameState.PLAYING:
-                    # 적 턴
-                    engine.handle_enemy_turn()
-
-                    # 턴 종료 처리 (생존 시스템 등)
-                    engine.process_turn()
-
-                    # FOV 업데이트
-                    engine.update_fov()
+                handle_event(event, engine, ui)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ Systems 패키지
 게임의 핵심 시스템들
 """
 from systems.game_map import GameMap
+from systems.chunked_map import ChunkedGameMap
+from systems.level_manager import LevelManager
 from systems.engine import Engine, GameState, MessageLog
 from systems import tile_types
 from systems import procgen
@@ -12,6 +14,8 @@ from systems import economy
 
 __all__ = [
     "GameMap",
+    "ChunkedGameMap",
+    "LevelManager",
     "Engine",
     "GameState",
     "MessageLog",
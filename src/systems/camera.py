@@ -0,0 +1,55 @@
+"""
+카메라 (뷰포트)
+화면보다 큰 맵에서 화면에 보이는 부분을 정함
+
+렌더러는 카메라 영역의 tiles/visible/explored와 그 안의 엔티티만
+다루므로 맵 크기와 관계없이 프레임 비용이 화면 크기에 비례합니다.
+"""
+from __future__ import annotations
+from typing import Tuple
+
+
+class Camera:
+    """
+    맵을 따라 움직이는 뷰포트
+
+    Attributes:
+        width, height: 뷰포트 크기 (화면의 맵 영역, 문자 단위)
+        x, y: 뷰포트 좌상단의 맵 좌표
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.x = 0
+        self.y = 0
+
+    def follow(self, target_x: int, target_y: int, map_width: int, map_height: int) -> None:
+        """
+        대상을 화면 가운데에 두도록 이동 (맵 가장자리에서는 멈춤)
+
+        맵이 뷰포트보다 작은 축은 0에 고정됩니다.
+
+        Args:
+            target_x, target_y: 따라갈 맵 좌표 (플레이어, 둘러보기 커서 등)
+            map_width, map_height: 맵 크기
+        """
+        self.x = max(0, min(target_x - self.width // 2, map_width - self.width))
+        self.y = max(0, min(target_y - self.height // 2, map_height - self.height))
+
+    def viewport(self, map_width: int, map_height: int) -> Tuple[int, int, int, int]:
+        """맵 안에 들어오는 뷰포트 영역 (x, y, 너비, 높이)"""
+        return (
+            self.x,
+            self.y,
+            max(0, min(self.width, map_width - self.x)),
+            max(0, min(self.height, map_height - self.y)),
+        )
+
+    def to_screen(self, x: int, y: int) -> Tuple[int, int]:
+        """맵 좌표 → 화면 좌표"""
+        return x - self.x, y - self.y
+
+    def to_map(self, screen_x: int, screen_y: int) -> Tuple[int, int]:
+        """화면 좌표 → 맵 좌표"""
+        return screen_x + self.x, screen_y + self.y
@@ -0,0 +1,373 @@
+"""
+청크 기반 게임 맵 (Chunked GameMap)
+Unreal World 스타일의 거대한 야외 월드를 제한된 메모리로 다루기 위한 맵
+
+맵을 고정 크기 청크로 나누어 플레이어가 다가갈 때 생성하고,
+오래 쓰이지 않은 청크는 LRU 순서로 디스크에 내보냅니다.
+tiles/visible/explored는 numpy 배열처럼 [x, y] 또는 [슬라이스, 슬라이스]로
+조회/대입할 수 있는 청크 뷰(ChunkedLayer)로 제공됩니다.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple, Union
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from systems import fov
+from systems import pathfinding
+from systems import tile_types
+from systems.game_map import GameMap
+
+# 청크 생성 함수: (x0, y0, width, height) → (width, height) 타일 배열
+ChunkGenerator = Callable[[int, int, int, int], np.ndarray]
+
+
+class Chunk:
+    """
+    맵 청크
+
+    Attributes:
+        tiles: 청크 타일 배열
+        explored: 탐험한 타일
+        visible: 현재 보이는 타일 (디스크에는 저장하지 않음)
+        dirty: 마지막 저장 이후 변경 여부
+    """
+
+    def __init__(self, tiles: np.ndarray, explored: np.ndarray):
+        self.tiles = tiles
+        self.explored = explored
+        self.visible = np.zeros(tiles.shape, dtype=bool, order="F")
+        self.dirty = True
+
+
+class ChunkStore:
+    """
+    청크 저장소
+
+    메모리에 올라온 청크를 LRU 순서로 관리하고, 한도를 넘으면
+    가장 오래 쓰이지 않은 청크를 디스크 캐시로 내보냅니다.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        chunk_size: int,
+        generator: ChunkGenerator,
+        max_loaded: int,
+        cache_dir: Optional[str] = None,
+    ):
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.generator = generator
+        self.max_loaded = max_loaded
+        self.cache_dir = cache_dir
+        self._owns_cache_dir = False
+
+        self.chunks: OrderedDict[Tuple[int, int], Chunk] = OrderedDict()
+
+        # 통계
+        self.generated_count = 0
+        self.loaded_count = 0
+        self.evicted_count = 0
+
+    def get(self, cx: int, cy: int) -> Chunk:
+        """청크 가져오기 (없으면 디스크에서 불러오거나 생성)"""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        chunk = self._load(cx, cy)
+        self.chunks[key] = chunk
+        self._evict()
+        return chunk
+
+    def chunk_bounds(self, cx: int, cy: int) -> Tuple[int, int, int, int]:
+        """청크의 맵 좌표 범위 (x0, y0, width, height)"""
+        x0 = cx * self.chunk_size
+        y0 = cy * self.chunk_size
+        return (
+            x0,
+            y0,
+            min(self.chunk_size, self.width - x0),
+            min(self.chunk_size, self.height - y0),
+        )
+
+    def _path(self, cx: int, cy: int) -> Optional[str]:
+        """청크 캐시 파일 경로"""
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"chunk_{cx}_{cy}.npz")
+
+    def _load(self, cx: int, cy: int) -> Chunk:
+        """디스크 캐시에서 불러오거나 새로 생성"""
+        path = self._path(cx, cy)
+        if path is not None and os.path.exists(path):
+            with np.load(path) as data:
+                chunk = Chunk(
+                    np.asfortranarray(data["tiles"]),
+                    np.asfortranarray(data["explored"]),
+                )
+            chunk.dirty = False
+            self.loaded_count += 1
+            return chunk
+
+        x0, y0, width, height = self.chunk_bounds(cx, cy)
+        tiles = np.asfortranarray(self.generator(x0, y0, width, height))
+        self.generated_count += 1
+        return Chunk(tiles, np.zeros((width, height), dtype=bool, order="F"))
+
+    def _evict(self) -> None:
+        """한도를 넘은 청크를 LRU 순서로 디스크에 내보냄"""
+        while len(self.chunks) > self.max_loaded:
+            (cx, cy), chunk = self.chunks.popitem(last=False)
+            if chunk.dirty:
+                if self.cache_dir is None:
+                    self.cache_dir = tempfile.mkdtemp(prefix="chunks_")
+                    self._owns_cache_dir = True
+                np.savez_compressed(
+                    self._path(cx, cy), tiles=chunk.tiles, explored=chunk.explored
+                )
+            self.evicted_count += 1
+
+    def close(self) -> None:
+        """직접 만든 디스크 캐시 삭제"""
+        self.chunks.clear()
+        if self._owns_cache_dir and self.cache_dir is not None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self.cache_dir = None
+            self._owns_cache_dir = False
+
+
+class ChunkedLayer:
+    """
+    청크에 걸친 2차원 배열 뷰
+
+    numpy 배열과 같은 방식으로 [x, y] 스칼라 조회, [슬라이스, 슬라이스]
+    영역 조회(복사본)와 대입을 지원합니다. tiles 레이어는
+    tiles["walkable"]처럼 필드 이름으로 하위 뷰를 얻을 수 있습니다.
+    불리언 마스크 인덱싱은 지원하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        store: ChunkStore,
+        layer: str,
+        field: Union[str, List[str], None] = None,
+    ):
+        self.store = store
+        self.layer = layer
+        self.field = field
+
+        dtype = tile_types.tile_dt if layer == "tiles" else np.dtype(bool)
+        if field is not None:
+            dtype = np.empty(0, dtype=dtype)[field].dtype
+        self.dtype = dtype
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.store.width, self.store.height)
+
+    def _array_of(self, chunk: Chunk) -> np.ndarray:
+        """청크에서 이 뷰가 가리키는 배열"""
+        array = getattr(chunk, self.layer)
+        if self.field is not None:
+            array = array[self.field]
+        return array
+
+    def _normalize(self, key) -> Tuple[slice, slice, Tuple[bool, bool]]:
+        """인덱스를 (x 슬라이스, y 슬라이스, 축별 정수 여부)로 변환"""
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        if len(key) != 2:
+            raise IndexError("청크 맵은 2차원 인덱스만 지원합니다")
+
+        ranges = []
+        scalar = []
+        for index, size in zip(key, self.shape):
+            if isinstance(index, (int, np.integer)):
+                if not 0 <= index < size:
+                    raise IndexError(f"인덱스 {index}가 범위(0-{size - 1})를 벗어났습니다")
+                ranges.append(slice(int(index), int(index) + 1))
+                scalar.append(True)
+            elif isinstance(index, slice):
+                start, stop, step = index.indices(size)
+                if step != 1:
+                    raise IndexError("청크 맵은 간격(step) 슬라이스를 지원하지 않습니다")
+                ranges.append(slice(start, max(start, stop)))
+                scalar.append(False)
+            else:
+                raise TypeError(f"청크 맵에서 지원하지 않는 인덱스: {type(index).__name__}")
+
+        return ranges[0], ranges[1], (scalar[0], scalar[1])
+
+    def _overlaps(self, xs: slice, ys: slice):
+        """영역과 겹치는 청크별 (청크, 청크 내 슬라이스, 결과 내 슬라이스)"""
+        size = self.store.chunk_size
+        for cx in range(xs.start // size, (xs.stop - 1) // size + 1):
+            for cy in range(ys.start // size, (ys.stop - 1) // size + 1):
+                chunk = self.store.get(cx, cy)
+                x0, y0, width, height = self.store.chunk_bounds(cx, cy)
+                ax0, ax1 = max(xs.start, x0), min(xs.stop, x0 + width)
+                ay0, ay1 = max(ys.start, y0), min(ys.stop, y0 + height)
+                yield (
+                    chunk,
+                    (slice(ax0 - x0, ax1 - x0), slice(ay0 - y0, ay1 - y0)),
+                    (slice(ax0 - xs.start, ax1 - xs.start), slice(ay0 - ys.start, ay1 - ys.start)),
+                )
+
+    def __getitem__(self, key):
+        if isinstance(key, (str, list)):
+            return ChunkedLayer(self.store, self.layer, key)
+
+        xs, ys, scalar = self._normalize(key)
+
+        # 단일 타일 조회 (가장 흔한 경우)
+        if scalar == (True, True):
+            size = self.store.chunk_size
+            chunk = self.store.get(xs.start // size, ys.start // size)
+            return self._array_of(chunk)[xs.start % size, ys.start % size]
+
+        out = np.empty((xs.stop - xs.start, ys.stop - ys.start), dtype=self.dtype, order="F")
+        if out.size:
+            for chunk, local, target in self._overlaps(xs, ys):
+                out[target] = self._array_of(chunk)[local]
+
+        if scalar[0]:
+            return out[0, :]
+        if scalar[1]:
+            return out[:, 0]
+        return out
+
+    def __setitem__(self, key, value) -> None:
+        xs, ys, scalar = self._normalize(key)
+        region = (xs.stop - xs.start, ys.stop - ys.start)
+        if 0 in region:
+            return
+
+        # 값을 영역 크기로 맞춤 (정수 축은 크기 1로 복원)
+        value = np.asarray(value, dtype=self.dtype)
+        squeezed = tuple(n for n, is_scalar in zip(region, scalar) if not is_scalar)
+        value = np.broadcast_to(value, squeezed).reshape(region)
+
+        for chunk, local, target in self._overlaps(xs, ys):
+            self._array_of(chunk)[local] = value[target]
+            if self.layer != "visible":
+                chunk.dirty = True
+
+
+class ChunkedGameMap(GameMap):
+    """
+    청크 기반 게임 맵
+
+    GameMap과 같은 조회 인터페이스(in_bounds, is_walkable, tiles, visible,
+    explored, compute_fov, get_path)를 제공하지만, 타일은 청크 단위로
+    필요할 때 생성되고 메모리에는 max_loaded_chunks개까지만 유지됩니다.
+    엔티티/아이템 리스트는 청크와 무관하게 항상 메모리에 남습니다.
+
+    Attributes:
+        chunks: 청크 저장소
+        stream_radius: 플레이어 주변에 미리 올려둘 청크 반경
+    """
+
+    PATH_SEARCH_MARGIN = 16  # A* 탐색 창을 시작/목표 바깥으로 넓히는 여유 타일 수
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        generator: ChunkGenerator,
+        chunk_size: int = 64,
+        max_loaded_chunks: int = 36,
+        cache_dir: Optional[str] = None,
+        stream_radius: int = 1,
+    ):
+        if max_loaded_chunks < (2 * stream_radius + 1) ** 2:
+            raise ValueError("max_loaded_chunks가 스트리밍 영역보다 작습니다")
+
+        self.chunk_size = chunk_size
+        self.stream_radius = stream_radius
+        self._generator = generator
+        self._max_loaded_chunks = max_loaded_chunks
+        self._cache_dir = cache_dir
+
+        super().__init__(width, height)
+
+    def _allocate_layers(self) -> None:
+        """청크 저장소와 레이어 뷰 생성"""
+        self.chunks = ChunkStore(
+            self.width,
+            self.height,
+            self.chunk_size,
+            self._generator,
+            self._max_loaded_chunks,
+            self._cache_dir,
+        )
+        self.tiles = ChunkedLayer(self.chunks, "tiles")
+        self.visible = ChunkedLayer(self.chunks, "visible")
+        self.explored = ChunkedLayer(self.chunks, "explored")
+
+    def stream_around(self, x: int, y: int) -> None:
+        """(x, y) 주변 청크를 미리 불러옴"""
+        size = self.chunk_size
+        cx, cy = x // size, y // size
+        max_cx = (self.width - 1) // size
+        max_cy = (self.height - 1) // size
+
+        for nx in range(max(0, cx - self.stream_radius), min(max_cx, cx + self.stream_radius) + 1):
+            for ny in range(max(0, cy - self.stream_radius), min(max_cy, cy + self.stream_radius) + 1):
+                self.chunks.get(nx, ny)
+
+        # 플레이어가 있는 청크를 가장 최근 사용으로
+        self.chunks.get(cx, cy)
+
+    def compute_fov(
+        self,
+        x: int,
+        y: int,
+        radius: int,
+        algorithm: int = fov.FOV_SYMMETRIC_SHADOWCAST,
+        light_walls: bool = True,
+    ) -> None:
+        """주변 청크를 불러온 뒤 시야 계산"""
+        self.stream_around(x, y)
+        super().compute_fov(x, y, radius, algorithm, light_walls)
+
+    @property
+    def visible_tiles(self) -> np.ndarray:
+        """현재 보이는 타일 배열 (마지막 시야 영역 기준)"""
+        region = self._visible_region
+        return self.tiles[region][self.visible[region]]
+
+    def _find_path(
+        self,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        cost: Optional[np.ndarray],
+        max_expansions: int,
+    ) -> List[Tuple[int, int]]:
+        """시작/목표를 감싸는 창 안에서만 A* 실행"""
+        margin = self.PATH_SEARCH_MARGIN
+        x0 = max(0, min(start[0], goal[0]) - margin)
+        y0 = max(0, min(start[1], goal[1]) - margin)
+        x1 = min(self.width, max(start[0], goal[0]) + margin + 1)
+        y1 = min(self.height, max(start[1], goal[1]) + margin + 1)
+        window = (slice(x0, x1), slice(y0, y1))
+
+        path = pathfinding.find_path(
+            self.tiles["walkable"][window],
+            (start[0] - x0, start[1] - y0),
+            (goal[0] - x0, goal[1] - y0),
+            cost[window] if cost is not None else None,
+            max_expansions,
+        )
+        return [(x + x0, y + y0) for x, y in path]
+
+    def close(self) -> None:
+        """디스크 캐시 정리"""
+        self.chunks.close()
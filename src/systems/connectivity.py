@@ -0,0 +1,212 @@
+"""
+맵 연결성 분석
+이동 가능한 타일의 연결 영역을 찾고, 시작 지점과 끊긴 영역을 잇거나 메움
+
+연결 영역 라벨링은 칸 단위 탐색 대신 numpy로 처리합니다.
+각 행의 연속된 이동 가능 구간(run)에 번호를 붙이고, 위아래로 맞닿은
+구간 쌍을 모아 최소 번호를 전파(포인터 점프)하는 방식이라
+반복 횟수가 칸 수가 아닌 구간 연결 깊이의 로그에 비례합니다.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Tuple
+import numpy as np
+
+from systems import tile_types
+
+if TYPE_CHECKING:
+    from systems.game_map import GameMap
+
+
+class ConnectivityReport(NamedTuple):
+    """
+    연결성 검사/수리 결과
+
+    Attributes:
+        region_count: 수리 전 연결 영역 수
+        disconnected_area: 수리 전 시작 지점과 이어지지 않은 이동 가능 칸 수
+        joined: 통로로 이은 영역 수
+        filled: 메운 영역 수
+    """
+    region_count: int
+    disconnected_area: int
+    joined: int
+    filled: int
+
+
+def label_regions(walkable: np.ndarray, diagonal: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    이동 가능한 칸의 연결 영역 라벨링
+
+    Args:
+        walkable: (width, height) 불리언 배열
+        diagonal: 대각선으로 맞닿은 칸도 연결로 볼지 (8방향 이동)
+
+    Returns:
+        (labels, sizes)
+        labels: 칸별 영역 번호 (이동 불가 칸은 -1), sizes: 영역별 칸 수
+    """
+    walkable = np.asarray(walkable, dtype=bool)
+    width, height = walkable.shape
+
+    # 행(같은 y)마다 x 방향으로 이어진 구간의 시작 표시
+    starts = walkable.copy()
+    starts[1:, :] &= ~walkable[:-1, :]
+
+    # x가 가장 빠르게 변하는 순서(F)로 누적합 → 구간 번호
+    runs = np.cumsum(starts.ravel(order="F")).reshape((width, height), order="F") - 1
+    run_count = int(starts.sum())
+    runs = np.where(walkable, runs, -1)
+    if run_count == 0:
+        return runs.astype(np.int32), np.zeros(0, dtype=np.int64)
+
+    # 위아래 행에서 맞닿은 구간 쌍
+    offsets = (-1, 0, 1) if diagonal else (0,)
+    pairs = []
+    upper, lower = runs[:, :-1], runs[:, 1:]
+    for dx in offsets:
+        if dx < 0:
+            a, b = upper[1:], lower[:-1]
+        elif dx > 0:
+            a, b = upper[:-1], lower[1:]
+        else:
+            a, b = upper, lower
+        touching = (a >= 0) & (b >= 0)
+        pairs.append(a[touching] * run_count + b[touching])
+    keys = np.unique(np.concatenate(pairs))
+    pairs = np.stack([keys // run_count, keys % run_count], axis=1)
+
+    # 최소 번호 전파 + 포인터 점프 (모든 구간이 영역 대표 번호를 가리킬 때까지)
+    parent = np.arange(run_count)
+    while True:
+        low = np.minimum(parent[pairs[:, 0]], parent[pairs[:, 1]])
+        updated = parent.copy()
+        np.minimum.at(updated, pairs[:, 0], low)
+        np.minimum.at(updated, pairs[:, 1], low)
+        updated = updated[updated]
+        if np.array_equal(updated, parent):
+            break
+        parent = updated
+
+    # 대표 번호를 0부터 연속된 영역 번호로 압축
+    roots, region_of_run = np.unique(parent, return_inverse=True)
+    labels = np.full((width, height), -1, dtype=np.int32, order="F")
+    labels[walkable] = region_of_run[runs[walkable]]
+    sizes = np.bincount(labels[walkable], minlength=len(roots))
+    return labels, sizes
+
+
+def _nearest(cells: np.ndarray, x: int, y: int) -> Tuple[int, int]:
+    """(n, 2) 좌표 배열에서 (x, y)에 가장 가까운 칸 (체비셰프 거리)"""
+    distance = np.maximum(np.abs(cells[:, 0] - x), np.abs(cells[:, 1] - y))
+    nx, ny = cells[int(np.argmin(distance))]
+    return int(nx), int(ny)
+
+
+def _nearest_connected(
+    labels: np.ndarray, connected: np.ndarray, x: int, y: int
+) -> Tuple[int, int]:
+    """
+    (x, y)에 가장 가까운 연결된 영역의 칸 (체비셰프 거리)
+
+    (x, y)를 중심으로 한 정사각형 창을 두 배씩 넓혀 가며 찾습니다.
+    체비셰프 거리에서 정사각형 창은 곧 반경이므로 창 안에서 찾은
+    가장 가까운 칸이 맵 전체에서도 가장 가깝고, 비용은 연결된 영역의
+    크기가 아니라 거리에만 비례합니다.
+
+    Args:
+        labels: label_regions의 영역 번호 배열
+        connected: 영역 번호 + 1 → 연결 여부 (0번은 이동 불가 칸)
+    """
+    width, height = labels.shape
+    radius = 8
+    while True:
+        x0, y0 = max(0, x - radius), max(0, y - radius)
+        x1, y1 = min(width, x + radius + 1), min(height, y + radius + 1)
+        xs, ys = np.nonzero(connected[labels[x0:x1, y0:y1] + 1])
+        if len(xs):
+            distance = np.maximum(np.abs(xs + x0 - x), np.abs(ys + y0 - y))
+            i = int(np.argmin(distance))
+            return int(xs[i] + x0), int(ys[i] + y0)
+        if x0 == 0 and y0 == 0 and x1 == width and y1 == height:
+            raise ValueError("연결된 영역이 없습니다")
+        radius *= 2
+
+
+def repair_connectivity(
+    game_map: GameMap,
+    start: Tuple[int, int],
+    required: Iterable[Tuple[int, int]] = (),
+    min_join_size: int = 1,
+    fill_tile: Optional[np.ndarray] = None,
+    path_tile: np.ndarray = tile_types.floor,
+    diagonal: bool = True,
+) -> ConnectivityReport:
+    """
+    시작 지점과 끊긴 영역을 통로로 잇거나 메움
+
+    min_join_size 이상인 영역과 required 좌표가 속한 영역은 가장 가까운
+    칸끼리 L자 통로로 잇습니다. 나머지 작은 영역은 fill_tile이 있으면
+    그 타일로 메우고, 없으면 그대로 둡니다.
+    (몬스터/아이템을 배치하기 전에 호출해야 메운 칸에 갇히지 않음)
+
+    Args:
+        game_map: 검사할 맵 (밀집 배열 맵)
+        start: 시작 지점 (플레이어 위치, 이동 가능해야 함)
+        required: 반드시 이어야 하는 좌표 (계단 등)
+        min_join_size: 통로로 이을 최소 영역 크기
+        fill_tile: 작은 영역을 메울 타일 (None이면 그대로 둠)
+        path_tile: 통로 타일
+        diagonal: 대각선 이동을 연결로 볼지
+
+    Returns:
+        ConnectivityReport
+    """
+    labels, sizes = label_regions(game_map.tiles["walkable"], diagonal)
+    main = labels[start]
+    if main < 0:
+        raise ValueError(f"시작 지점 {start}이 이동 가능한 칸이 아닙니다")
+
+    region_count = len(sizes)
+    disconnected_area = int(sizes.sum() - sizes[main])
+    if disconnected_area == 0:
+        return ConnectivityReport(region_count, 0, 0, 0)
+
+    must_join = {int(labels[point]) for point in required if labels[point] >= 0}
+
+    # 시작 영역 밖의 칸 좌표만 영역별로 나눔 (라벨 정렬 한 번)
+    xs, ys = np.nonzero((labels >= 0) & (labels != main))
+    flat = labels[xs, ys]
+    order = np.argsort(flat, kind="stable")
+    other_sizes = sizes.copy()
+    other_sizes[main] = 0
+    cells = np.split(np.stack([xs[order], ys[order]], axis=1), np.cumsum(other_sizes)[:-1])
+
+    # 영역 번호 + 1 → 연결 여부 (0번은 이동 불가 칸의 -1)
+    connected = np.zeros(region_count + 1, dtype=bool)
+    connected[main + 1] = True
+    joined = 0
+    to_fill = np.zeros(region_count + 1, dtype=bool)
+
+    # 큰 영역부터 이어 붙임 (이어진 영역은 다음 연결의 대상이 됨)
+    for region in np.argsort(-sizes, kind="stable"):
+        region = int(region)
+        if region == main:
+            continue
+        if sizes[region] < min_join_size and region not in must_join:
+            to_fill[region + 1] = True
+            continue
+
+        # 영역 안의 아무 칸 → 가장 가까운 연결된 칸 → 그 칸에 가장 가까운 영역 칸
+        px, py = cells[region][0]
+        target = _nearest_connected(labels, connected, int(px), int(py))
+        source = _nearest(cells[region], *target)
+        game_map.carve_tunnel(source, target, horizontal_first=True, tile=path_tile)
+        connected[region + 1] = True
+        joined += 1
+
+    filled = 0
+    if fill_tile is not None and to_fill.any():
+        game_map.set_tiles(to_fill[labels + 1], fill_tile)
+        filled = int(to_fill.sum())
+
+    return ConnectivityReport(region_count, disconnected_area, joined, filled)
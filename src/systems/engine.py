@@ -3,12 +3,17 @@
 메인 게임 루프, 상태 관리, 턴 처리
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from enum import Enum, auto
+import heapq
+import itertools
+
+from systems import pathfinding
 
 if TYPE_CHECKING:
     from components.entity import Actor
     from systems.game_map import GameMap
+    from systems.level_manager import LevelManager
 
 
 class GameState(Enum):
@@ -25,14 +30,19 @@ class MessageLog:
     """
     게임 메시지 로그
     Nethack 스타일의 메시지 표시
+
+    Attributes:
+        revision: 메시지가 추가/삭제될 때마다 증가하는 리비전
     """
 
     def __init__(self, max_messages: int = 100):
         self.messages: List[tuple[str, tuple[int, int, int]]] = []
         self.max_messages = max_messages
+        self.revision = 0
 
     def add(self, text: str, color: tuple[int, int, int] = (255, 255, 255)) -> None:
         """메시지 추가"""
+        self.revision += 1
         self.messages.append((text, color))
         if len(self.messages) > self.max_messages:
             self.messages.pop(0)
@@ -43,9 +53,124 @@ class MessageLog:
 
     def clear(self) -> None:
         """모든 메시지 삭제"""
+        self.revision += 1
         self.messages.clear()
 
 
+class TurnScheduler:
+    """
+    행동 시간 기반 턴 스케줄러
+
+    (다음 행동 시간, 순번, Actor) 힙에서 가장 먼저 행동할 Actor를 꺼냅니다.
+    빠른 Actor는 짧은 간격으로 다시 예약되어 더 자주 행동하고,
+    할 일이 없는 Actor는 대기(park)시켜 힙에서 빼 두었다가
+    플레이어 접근이나 전투 소음 같은 사건이 생기면 깨웁니다.
+    활성 영역 밖의 Actor는 휴면(suspend)시킵니다. 대기와 휴면 모두
+    다시 예약할 때 멈춰 있던 시간을 알려 주어 한 번에 따라잡게 합니다.
+
+    Attributes:
+        parked: 대기 중인 Actor → 대기 시작 시간
+        dormant: 휴면 중인 Actor → 휴면 시작 시간
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, Actor]] = []
+        self._counter = itertools.count()  # 같은 시간이면 먼저 예약한 순서
+        self._entries: Dict[Actor, int] = {}  # 예약 중인 Actor → 유효한 항목 순번
+        self.parked: Dict[Actor, int] = {}
+        self.dormant: Dict[Actor, int] = {}
+
+    def __len__(self) -> int:
+        """예약 중인 (활동) Actor 수"""
+        return len(self._entries)
+
+    def __contains__(self, actor: Actor) -> bool:
+        return actor in self._entries or actor in self.parked or actor in self.dormant
+
+    def schedule(self, actor: Actor, time: int) -> None:
+        """Actor를 time에 행동하도록 예약 (이미 예약/대기 중이면 무시)"""
+        if actor in self:
+            return
+        seq = next(self._counter)
+        self._entries[actor] = seq
+        heapq.heappush(self._heap, (time, seq, actor))
+
+    def pop_due(self, now: int) -> Optional[Tuple[int, Actor]]:
+        """
+        now까지 행동할 차례인 Actor를 하나 꺼냄
+
+        Returns:
+            (예약 시간, Actor) 또는 None (차례인 Actor 없음)
+        """
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            time, seq, actor = heapq.heappop(heap)
+            # 제거/재예약으로 무효가 된 항목은 건너뜀
+            if self._entries.get(actor) == seq:
+                del self._entries[actor]
+                return time, actor
+        return None
+
+    def park(self, actor: Actor, time: int) -> None:
+        """Actor를 time부터 대기 상태로 전환 (힙에서 빠지고 깨울 때까지 행동하지 않음)"""
+        self._entries.pop(actor, None)
+        self.parked[actor] = time
+        if actor._store is not None:
+            actor._store.parked[actor._slot] = True
+
+    def wake(self, actor: Actor, time: int) -> int:
+        """
+        대기 중인 Actor를 깨워 time에 행동하도록 예약
+
+        Returns:
+            대기했던 시간 (대기 중이 아니었으면 0)
+        """
+        since = self.parked.pop(actor, None)
+        if since is None:
+            return 0
+        if actor._store is not None:
+            actor._store.parked[actor._slot] = False
+        self.schedule(actor, time)
+        return time - since
+
+    def suspend(self, actor: Actor, time: int) -> None:
+        """Actor를 time부터 휴면 상태로 전환 (활성 영역 밖)"""
+        self._entries.pop(actor, None)
+        self.dormant[actor] = time
+        if actor._store is not None:
+            actor._store.dormant[actor._slot] = True
+
+    def resume(self, actor: Actor, time: int) -> int:
+        """
+        휴면 중인 Actor를 깨워 time에 행동하도록 예약
+
+        Returns:
+            휴면했던 시간 (휴면 중이 아니었으면 0)
+        """
+        since = self.dormant.pop(actor, None)
+        if since is None:
+            return 0
+        if actor._store is not None:
+            actor._store.dormant[actor._slot] = False
+        self.schedule(actor, time)
+        return time - since
+
+    def remove(self, actor: Actor) -> None:
+        """Actor를 스케줄러에서 제거 (사망, 맵 이탈 등)"""
+        self._entries.pop(actor, None)
+        if self.parked.pop(actor, None) is not None and actor._store is not None:
+            actor._store.parked[actor._slot] = False
+        if self.dormant.pop(actor, None) is not None and actor._store is not None:
+            actor._store.dormant[actor._slot] = False
+
+    def clear(self) -> None:
+        """모든 예약/대기/휴면 제거"""
+        for actor in list(self.parked) + list(self.dormant):
+            self.remove(actor)
+        self._heap.clear()
+        self._entries.clear()
+
+
 class Engine:
     """
     게임 엔진 클래스
@@ -55,22 +180,42 @@ class Engine:
     Attributes:
         player: 플레이어 Actor
         game_map: 현재 게임 맵
+        levels: 층별 맵 관리자 (없으면 층 이동 불가)
         message_log: 메시지 로그
         game_state: 현재 게임 상태
         turn_count: 경과 턴 수
+        time: 행동 시간 (플레이어 행동마다 그 행동의 시간만큼 증가)
+        scheduler: 몬스터 행동 예약 스케줄러
+        processed_count: 지난 적 턴에 AI를 실행한 Actor 수
+        dormant_count: 지난 적 턴 종료 시 휴면/대기 중인 Actor 수
     """
 
     def __init__(
         self,
         player: Actor,
         game_map: Optional[GameMap] = None,
+        levels: Optional[LevelManager] = None,
     ):
         self.player = player
         self.game_map = game_map
+        self.levels = levels
         self.message_log = MessageLog()
         self.game_state = GameState.PLAYING
         self.turn_count = 0
 
+        # 적 턴마다 공유하는 플레이어 기준 거리 지도
+        self.flow_field: Optional[pathfinding.FlowField] = None
+
+        # 행동 시간 스케줄러
+        self.time = 0
+        self.scheduler = TurnScheduler()
+        self._scheduled_map: Optional[GameMap] = None  # 스케줄러가 관리하는 맵
+        self._player_action_cost: Optional[int] = None  # 이번 플레이어 행동의 시간
+
+        # 적 턴 시뮬레이션 통계 (턴마다 갱신)
+        self.processed_count = 0
+        self.dormant_count = 0
+
         # 시간 시스템
         self.hour = 8  # 오전 8시 시작
         self.day = 1
@@ -129,6 +274,11 @@ class Engine:
             return False
 
         damage, is_dead = self.player.fighter.attack(target)
+        self._player_action_cost = self.action_cost(self.player, attack=True)
+
+        # 공격당한 대상과 주변의 대기 중인 Actor는 소음에 깨어남
+        self.wake_actors_near(target.x, target.y)
+        self._wake(target)
 
         if damage > 0:
             self.message_log.add(
@@ -150,6 +300,69 @@ class Engine:
 
         return True
 
+    @property
+    def depth(self) -> int:
+        """현재 층"""
+        return self.levels.depth if self.levels else 1
+
+    def descend(self) -> bool:
+        """내려가는 계단에서 다음 층으로 이동"""
+        if not self.game_map:
+            return False
+
+        if (self.player.x, self.player.y) != self.game_map.downstairs_location:
+            self.message_log.add("여기에는 내려가는 계단이 없다.", (128, 128, 128))
+            return False
+
+        return self._change_level(self.depth + 1)
+
+    def ascend(self) -> bool:
+        """올라가는 계단에서 이전 층으로 이동"""
+        if not self.game_map:
+            return False
+
+        if (
+            self.depth <= 1
+            or (self.player.x, self.player.y) != self.game_map.upstairs_location
+        ):
+            self.message_log.add("여기에는 올라가는 계단이 없다.", (128, 128, 128))
+            return False
+
+        return self._change_level(self.depth - 1)
+
+    def _change_level(self, depth: int) -> bool:
+        """
+        depth 층으로 이동
+
+        방문했던 층은 LevelManager의 캐시/디스크에서 복원되고,
+        플레이어는 이동 방향에 맞는 계단 위에 놓입니다.
+        """
+        if not self.levels:
+            self.message_log.add("이곳에서는 다른 층으로 갈 수 없다.", (128, 128, 128))
+            return False
+
+        going_down = depth > self.depth
+        self.game_map.remove_entity(self.player)
+
+        game_map = self.levels.get(depth, self.player)
+        if self.player.game_map is not game_map:
+            arrival = (
+                game_map.upstairs_location if going_down
+                else game_map.downstairs_location
+            )
+            if arrival is not None:
+                self.player.x, self.player.y = arrival
+            game_map.add_entity(self.player)
+
+        self.game_map = game_map
+        self.flow_field = None
+
+        if going_down:
+            self.message_log.add(f"{depth}층으로 내려왔다.", (200, 200, 255))
+        else:
+            self.message_log.add(f"{depth}층으로 올라왔다.", (200, 200, 255))
+        return True
+
     def _kill_entity(self, entity: Actor) -> None:
         """엔티티 사망 처리"""
         from components.entity import Item
@@ -160,6 +373,8 @@ class Engine:
             self.game_state = GameState.PLAYER_DEAD
             entity.char = '%'
             entity.color = (191, 0, 0)
+            if self.game_map:
+                self.game_map.entity_revision += 1  # 모양이 바뀌었으므로 다시 그림
         else:
             # 시체 생성
             corpse = Item(
@@ -172,36 +387,182 @@ class Engine:
                 nutrition=100,  # 시체는 먹을 수 있음 (Nethack 스타일!)
                 hydration=20,
             )
+            self.scheduler.remove(entity)
             self.game_map.add_item(corpse)
             self.game_map.remove_entity(entity)
 
+    def action_cost(self, actor: Actor, attack: bool = False) -> int:
+        """
+        Actor가 한 번 행동하는 데 걸리는 시간
+
+        속도 100이면 ACTION_COST이고, 속도가 높을수록 짧아집니다.
+        공격은 장착 무기의 속도(낮을수록 빠름, 맨손 2 기준)를 곱해 계산합니다.
+        """
+        from config import ACTION_COST
+
+        cost = ACTION_COST * 100 // max(1, actor.speed)
+        if attack and actor.equipment:
+            cost = cost * actor.equipment.get_weapon_speed() // 2
+        return max(1, cost)
+
+    def wake_actors_near(self, x: int, y: int, radius: Optional[int] = None) -> None:
+        """(x, y) 주변의 대기 중인 Actor를 깨움 (소음, 플레이어 접근 등)"""
+        from config import NOISE_RADIUS
+
+        if not self.game_map or not self.scheduler.parked:
+            return
+        if radius is None:
+            radius = NOISE_RADIUS
+        for actor in self.game_map.actor_store.waking(x, y, radius):
+            self._wake(actor)
+
+    def _wake(self, actor: Actor) -> None:
+        """대기 중인 Actor를 깨우고 대기하는 동안 놓친 행동을 따라잡음"""
+        waited = self.scheduler.wake(actor, self.time)
+        if waited:
+            self._catch_up(actor, waited)
+
+    def _catch_up(self, actor: Actor, elapsed: int) -> None:
+        """elapsed 시간 동안 놓친 행동을 AI의 catch_up으로 한 번에 적용"""
+        from config import CATCH_UP_MAX_STEPS
+
+        if actor.ai:
+            missed = elapsed // self.action_cost(actor)
+            actor.ai.catch_up(self.game_map, missed, CATCH_UP_MAX_STEPS)
+
+    def _sync_scheduler(self) -> None:
+        """맵이 바뀌었으면 스케줄러를 비우고, 새로 추가된 Actor를 예약"""
+        game_map = self.game_map
+        if self._scheduled_map is not game_map:
+            self.scheduler.clear()
+            game_map.new_actors = list(game_map.actors)
+            self._scheduled_map = game_map
+
+        for actor in game_map.new_actors:
+            if actor is not self.player and actor.game_map is game_map:
+                self.scheduler.schedule(actor, self.time + self.action_cost(actor))
+        game_map.new_actors.clear()
+
+    def _is_idle(self, actor: Actor) -> bool:
+        """
+        대기시켜도 되는지 (할 일이 전혀 없는 Actor만)
+
+        플레이어가 깨움 범위 밖에 있고, 주변에 걸어갈 칸이 하나도 없어
+        배회조차 할 수 없을 때만 참입니다. 이번에 배회 확률에 걸리지
+        않았을 뿐인 Actor는 다음 행동 시간에 다시 굴립니다.
+        """
+        from config import WAKE_RADIUS
+
+        distance = max(abs(self.player.x - actor.x), abs(self.player.y - actor.y))
+        wake_range = max(WAKE_RADIUS, getattr(actor.ai, "detection_range", 0))
+        if distance <= wake_range:
+            return False
+
+        x, y = actor.x, actor.y
+        is_walkable = self.game_map.is_walkable
+        return not any(
+            is_walkable(x + dx, y + dy)
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            if dx or dy
+        )
+
     def handle_enemy_turn(self) -> None:
-        """적 턴 처리"""
+        """
+        적 턴 처리
+
+        플레이어 행동 시간만큼 시간을 진행하고, 그 사이에 행동 차례가 된
+        Actor만 스케줄러에서 꺼내 행동시킵니다. 대기 중인 Actor는
+        깨어나기 전까지 순회하지 않습니다.
+
+        전체 AI는 플레이어 주변 SIMULATION_RADIUS 안에서만 실행되고,
+        그 밖의 Actor는 휴면했다가 다시 들어올 때 catch_up으로 따라잡습니다.
+        대기했다가 깨어난 Actor도 같은 방식으로 따라잡습니다.
+        """
+        from config import FLOW_FIELD_RADIUS, SIMULATION_RADIUS, WAKE_RADIUS
+
         if not self.game_map:
             return
 
-        for actor in list(self.game_map.actors):
-            if actor == self.player:
+        self._sync_scheduler()
+
+        # 플레이어 행동 시간만큼 시간 진행
+        cost = self._player_action_cost or self.action_cost(self.player)
+        self._player_action_cost = None
+        self.time += cost
+
+        # 플레이어가 다가온 대기 Actor 깨우기
+        self.wake_actors_near(self.player.x, self.player.y, WAKE_RADIUS)
+
+        # 활성 영역으로 들어온 휴면 Actor는 놓친 행동을 한 번에 따라잡음
+        for actor in self.game_map.actor_store.entering(
+            self.player.x, self.player.y, SIMULATION_RADIUS
+        ):
+            slept = self.scheduler.resume(actor, self.time)
+            if slept:
+                self._catch_up(actor, slept)
+
+        processed = 0
+
+        # 플레이어를 감지한 적대 Actor (저장소 열로 한 번에 계산)
+        # 이번 턴에 이미 움직인 Actor는 위치가 바뀌었으므로 AI가 직접 다시 확인
+        detecting = set(self.game_map.actor_store.detecting(self.player.x, self.player.y))
+        acted = set()
+
+        # 모든 추적 몬스터가 공유할 거리 지도 (턴당 한 번)
+        self.flow_field = pathfinding.compute_flow_field(
+            self.game_map.tiles["walkable"],
+            (self.player.x, self.player.y),
+            FLOW_FIELD_RADIUS,
+        )
+
+        while True:
+            due = self.scheduler.pop_due(self.time)
+            if due is None:
+                break
+            time, actor = due
+
+            # 맵을 떠난 Actor는 예약에서 빠짐
+            if actor.game_map is not self.game_map:
                 continue
 
             if not actor.ai:
+                self.scheduler.park(actor, time)
                 continue
 
-            # AI 행동 결정
-            action = actor.ai.perform(self.game_map, self.player)
-
-            if action is None:
+            # 활성 영역 밖이면 휴면
+            distance = max(abs(self.player.x - actor.x), abs(self.player.y - actor.y))
+            if distance > SIMULATION_RADIUS:
+                self.scheduler.suspend(actor, time)
                 continue
 
-            dx, dy = action
-            new_x = actor.x + dx
-            new_y = actor.y + dy
+            # AI 행동 결정
+            detected = None if actor in acted else actor in detecting
+            action = actor.ai.perform(self.game_map, self.player, self.flow_field, detected)
+            acted.add(actor)
+            processed += 1
 
-            # 플레이어에게 공격?
-            if new_x == self.player.x and new_y == self.player.y:
-                self._handle_enemy_attack(actor)
-            elif self.game_map.is_walkable(new_x, new_y):
-                actor.move(dx, dy)
+            attacked = False
+            if action is None:
+                if self._is_idle(actor):
+                    self.scheduler.park(actor, time)
+                    continue
+            else:
+                dx, dy = action
+                new_x = actor.x + dx
+                new_y = actor.y + dy
+
+                # 플레이어에게 공격?
+                if new_x == self.player.x and new_y == self.player.y:
+                    self._handle_enemy_attack(actor)
+                    attacked = True
+                elif self.game_map.is_walkable(new_x, new_y):
+                    actor.move(dx, dy)
+
+            self.scheduler.schedule(actor, time + self.action_cost(actor, attack=attacked))
+
+        self.processed_count = processed
+        self.dormant_count = len(self.scheduler.dormant) + len(self.scheduler.parked)
 
     def _handle_enemy_attack(self, attacker: Actor) -> None:
         """적의 공격 처리"""
@@ -335,13 +696,38 @@ class Engine:
 
     def update_fov(self) -> None:
         """시야 업데이트"""
+        from config import FOV_ALGORITHM, FOV_LIGHT_WALLS, FOV_RADIUS
+
         if self.game_map:
             self.game_map.compute_fov(
                 self.player.x,
                 self.player.y,
-                radius=10,
+                radius=FOV_RADIUS,
+                algorithm=FOV_ALGORITHM,
+                light_walls=FOV_LIGHT_WALLS,
             )
 
+    def view_key(self) -> tuple:
+        """
+        화면에 보이는 게임 상태의 요약 키
+
+        이전 프레임의 키와 같으면 화면을 다시 그릴 필요가 없습니다.
+        """
+        game_map = self.game_map
+        fighter = self.player.fighter
+        inventory = self.player.inventory
+        return (
+            self.turn_count,
+            self.game_state,
+            self.depth,
+            self.message_log.revision,
+            fighter.hp if fighter else None,
+            len(inventory) if inventory is not None else None,
+            id(game_map),
+            (game_map.revision, game_map.fov_revision, game_map.entity_revision)
+            if game_map else None,
+        )
+
     def get_time_string(self) -> str:
         """현재 시간 문자열"""
         return f"Day {self.day}, {self.hour:02d}:00"
@@ -0,0 +1,166 @@
+"""
+시야(FOV) 계산 엔진
+재귀 대칭 섀도캐스팅(Symmetric Shadowcasting) 기반
+
+알고리즘:
+    FOV_SYMMETRIC_SHADOWCAST: 대칭 섀도캐스팅 (A가 B를 보면 B도 A를 봄)
+    FOV_PERMISSIVE: 관대한 섀도캐스팅 (타일의 일부라도 보이면 보임)
+
+기울기는 (분자, 분모) 정수 쌍으로 다뤄 부동소수점 경계 오차가 없습니다.
+
+구현 방식:
+    행 스캔은 numpy 벡터 연산이 아니라 미리 계산한 사분면 오프셋 테이블과
+    평탄화한 윈도우 리스트 위의 순수 파이썬 루프입니다. 시야 반경(10 안팎)에서는
+    한 행이 최대 2r+1칸이라 행마다 numpy 호출을 여러 번 하는 비용이 칸을 직접
+    도는 비용보다 커서 일부러 이렇게 했습니다. numpy는 윈도우 복사와 결과
+    슬라이스 대입에만 씁니다. (반경 10에서 호출당 약 0.1ms)
+
+tcod(FOV_SYMMETRIC_SHADOWCAST)와의 차이:
+    - 반경 경계: dx² + dy² == r²인 타일을 포함합니다 (tcod는 < r²만).
+    - 그림자 경계: 타일 중심이 벽 모서리의 기울기 위에 정확히 놓이는 등
+      경계에 걸친 타일을 참조 구현(Albert Ford)대로 반올림해 판정하므로,
+      tcod가 추가로 보여 주는 타일 일부가 보이지 않습니다.
+      (반경 안쪽 결과는 tcod 결과의 부분집합)
+    두 구현 모두 대칭성(A가 B를 보면 B도 A를 봄)은 지킵니다.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import List, Tuple
+import numpy as np
+
+FOV_SYMMETRIC_SHADOWCAST = 0
+FOV_PERMISSIVE = 1
+
+# 사분면 변환 테이블: (col→x, depth→x, col→y, depth→y)
+# 각 사분면은 depth(원점에서 멀어지는 방향)와 col(가로 방향)로 스캔됩니다.
+_QUADRANTS: Tuple[Tuple[int, int, int, int], ...] = (
+    (1, 0, 0, -1),   # 북
+    (1, 0, 0, 1),    # 남
+    (0, 1, 1, 0),    # 동
+    (0, -1, 1, 0),   # 서
+)
+
+
+@lru_cache(maxsize=16)
+def _quadrant_offsets(radius: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    반경별 사분면 오프셋 테이블 (미리 계산)
+
+    offsets[q][depth] = 해당 depth 행의 col=-depth..depth 타일들의
+    윈도우 평탄 인덱스. 윈도우는 (2r+1)x(2r+1)이고 원점은 중앙입니다.
+    """
+    size = 2 * radius + 1
+    tables = []
+    for xx, xy, yx, yy in _QUADRANTS:
+        rows = [()]
+        for depth in range(1, radius + 1):
+            rows.append(tuple(
+                (radius + col * xx + depth * xy) * size
+                + (radius + col * yx + depth * yy)
+                for col in range(-depth, depth + 1)
+            ))
+        tables.append(tuple(rows))
+    return tuple(tables)
+
+
+def compute_fov(
+    transparent: np.ndarray,
+    x: int,
+    y: int,
+    radius: int,
+    algorithm: int = FOV_SYMMETRIC_SHADOWCAST,
+    light_walls: bool = True,
+) -> Tuple[np.ndarray, Tuple[slice, slice]]:
+    """
+    시야 계산
+
+    Args:
+        transparent: (width, height) 투명도 배열
+        x, y: 시야 중심점
+        radius: 시야 반경 (유클리드 거리)
+        algorithm: FOV_SYMMETRIC_SHADOWCAST 또는 FOV_PERMISSIVE
+        light_walls: 벽도 밝힐지 여부
+
+    Returns:
+        (보이는 타일 배열, 맵 좌표 슬라이스) - 배열은 슬라이스 영역 크기
+    """
+    if algorithm not in (FOV_SYMMETRIC_SHADOWCAST, FOV_PERMISSIVE):
+        raise ValueError(f"알 수 없는 FOV 알고리즘: {algorithm}")
+
+    width, height = transparent.shape
+    radius = max(0, radius)
+    size = 2 * radius + 1
+
+    # 원점 중심 윈도우로 투명도 복사 (맵 밖은 불투명)
+    x0, x1 = max(0, x - radius), min(width, x + radius + 1)
+    y0, y1 = max(0, y - radius), min(height, y + radius + 1)
+    wx0, wy0 = x0 - (x - radius), y0 - (y - radius)
+    window = np.zeros((size, size), dtype=bool)
+    window[wx0:wx0 + x1 - x0, wy0:wy0 + y1 - y0] = transparent[x0:x1, y0:y1]
+
+    lit = _scan(
+        window.ravel().tolist(), radius,
+        algorithm == FOV_PERMISSIVE, light_walls,
+    )
+    lit_window = np.array(lit, dtype=bool).reshape(size, size)
+
+    result = lit_window[wx0:wx0 + x1 - x0, wy0:wy0 + y1 - y0]
+    return result, (slice(x0, x1), slice(y0, y1))
+
+
+def _scan(
+    trans: List[bool],
+    radius: int,
+    permissive: bool,
+    light_walls: bool,
+) -> List[bool]:
+    """4개 사분면을 섀도캐스팅으로 스캔 (평탄화된 윈도우 대상)"""
+    size = 2 * radius + 1
+    lit = [False] * (size * size)
+    lit[radius * size + radius] = True  # 중심점은 항상 보임
+
+    r2 = radius * radius
+    for offsets in _quadrant_offsets(radius):
+        # 행 스택: (depth, 시작 기울기 분자/분모, 끝 기울기 분자/분모)
+        rows = [(1, -1, 1, 1, 1)]
+        while rows:
+            depth, sn, sd, en, ed = rows.pop()
+            if depth > radius:
+                continue
+
+            # 열 범위 계산 (정수 반올림)
+            #   대칭: 중심이 원뿔 안인 타일, 관대: 일부라도 걸친 타일
+            if permissive:
+                lo = -((sd - 2 * depth * sn) // (2 * sd))
+                hi = (2 * depth * en + ed) // (2 * ed)
+            else:
+                lo = (2 * depth * sn + sd) // (2 * sd)
+                hi = -((ed - 2 * depth * en) // (2 * ed))
+
+            row = offsets[depth]
+            d2 = depth * depth
+            prev_wall = None
+
+            for col in range(lo, hi + 1):
+                index = row[col + depth]
+                is_wall = not trans[index]
+
+                if col * col + d2 <= r2:
+                    if is_wall:
+                        if light_walls:
+                            lit[index] = True
+                    elif permissive or (
+                        col * sd >= depth * sn and col * ed <= depth * en
+                    ):
+                        lit[index] = True
+
+                if prev_wall and not is_wall:
+                    sn, sd = 2 * col - 1, 2 * depth
+                elif prev_wall is False and is_wall:
+                    rows.append((depth + 1, sn, sd, 2 * col - 1, 2 * depth))
+                prev_wall = is_wall
+
+            if prev_wall is False:
+                rows.append((depth + 1, sn, sd, en, ed))
+
+    return lit
@@ -3,13 +3,18 @@ GameMap 클래스
 게임 맵과 엔티티 관리
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Optional, Iterator, Tuple
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Iterator, Tuple
 import numpy as np
 
+from components.actor_store import ActorStore
 from systems import tile_types
+from systems import fov
+from systems import pathfinding
 
 if TYPE_CHECKING:
     from components.entity import Entity, Actor, Item
+    from systems.procgen import RectangularRoom
 
 
 class GameMap:
@@ -24,18 +29,27 @@ class GameMap:
         visible: 현재 보이는 타일
         explored: 탐험한 타일
         entities: 맵에 있는 모든 엔티티
+        actor_store: Actor 수치를 numpy 열로 보관하는 저장소
+        revision: 투명도/이동 가능 여부가 바뀔 때마다 증가하는 리비전
+        fov_revision: visible/explored가 바뀔 때마다 증가하는 리비전
+        entity_revision: 엔티티/아이템이 추가/제거/이동할 때마다 증가하는 리비전
+        upstairs_location, downstairs_location: 올라가는/내려가는 계단 위치
+        rooms: 생성기가 배치한 방 목록 (야외 맵이나 저장/미리 생성 데이터로 조립한 맵은 빈 리스트)
+        rng: 이 맵에서 쓰는 행동용 난수 생성기 (몬스터 배회 등)
+
+    엔티티/아이템은 타일 좌표별 공간 인덱스로도 관리되어
+    위치 조회가 O(1)로 처리됩니다.
     """
 
+    FOV_CACHE_SIZE = 32    # 시야 캐시에 보관할 최대 결과 수
+    PATH_CACHE_SIZE = 128  # 경로 캐시에 보관할 최대 경로 수
+
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
 
-        # 타일 배열 초기화 (벽으로 채움)
-        self.tiles = np.full((width, height), fill_value=tile_types.wall, order="F")
-
-        # 시야 배열
-        self.visible = np.full((width, height), fill_value=False, order="F")
-        self.explored = np.full((width, height), fill_value=False, order="F")
+        # 타일/시야 배열 할당
+        self._allocate_layers()
 
         # 엔티티 리스트
         self.entities: List[Entity] = []
@@ -43,10 +57,205 @@ class GameMap:
         # 아이템 리스트 (바닥에 있는 아이템)
         self.items: List[Item] = []
 
+        # 공간 인덱스 (좌표 → 해당 타일의 엔티티/아이템)
+        self._entities_at: Dict[Tuple[int, int], List[Entity]] = {}
+        self._items_at: Dict[Tuple[int, int], List[Item]] = {}
+
+        # Actor 수치 열 저장소 (위치, 체력, 공격력 등)
+        self.actor_store = ActorStore()
+
+        # 행동용 난수 (procgen이 층 시드에서 파생한 스트림으로 교체)
+        self.rng = np.random.default_rng()
+
+        # 계단 위치 (층 이동 시 도착 지점)
+        self.upstairs_location: Optional[Tuple[int, int]] = None
+        self.downstairs_location: Optional[Tuple[int, int]] = None
+
+        # 생성기가 배치한 방 (던전만)
+        self.rooms: List[RectangularRoom] = []
+
+        # 스케줄러에 아직 등록되지 않은 새 Actor (Engine이 꺼내 감)
+        self.new_actors: List[Actor] = []
+
+        # 맵 리비전 및 시야 캐시
+        self.revision = 0
+        self.fov_revision = 0
+        self.entity_revision = 0
+        self._fov_cache: OrderedDict[tuple, Tuple[np.ndarray, Tuple[slice, slice]]] = OrderedDict()
+        self._fov_key: Optional[tuple] = None  # visible에 반영된 결과의 키
+        self._visible_region = (slice(0, 0), slice(0, 0))  # 다음 계산 때 지울 영역
+        self.fov_cache_hits = 0
+        self.fov_cache_misses = 0
+
+        # 경로 캐시 (리비전이 바뀌면 무효화)
+        self._path_cache: OrderedDict[tuple, List[Tuple[int, int]]] = OrderedDict()
+        self.path_cache_hits = 0
+        self.path_cache_misses = 0
+        self._path_scratch: Optional[pathfinding.PathScratch] = None  # A* 재사용 배열
+
+    def _allocate_layers(self) -> None:
+        """
+        tiles/visible/explored 저장소 할당
+
+        기본 맵은 맵 전체 크기의 밀집 배열을 사용합니다.
+        (ChunkedGameMap은 청크 단위 저장소로 재정의)
+        """
+        # 타일 배열 초기화 (벽으로 채움)
+        self.tiles = np.full((self.width, self.height), fill_value=tile_types.wall, order="F")
+
+        # 시야 배열
+        self.visible = np.full((self.width, self.height), fill_value=False, order="F")
+        self.explored = np.full((self.width, self.height), fill_value=False, order="F")
+
     def in_bounds(self, x: int, y: int) -> bool:
         """좌표가 맵 범위 내인지 확인"""
         return 0 <= x < self.width and 0 <= y < self.height
 
+    def set_tiles(self, index, tile: np.ndarray) -> None:
+        """
+        타일 변경 (투명도/이동 가능 여부가 바뀌면 리비전 증가)
+
+        게임 도중 지형이 바뀔 때(문 열기, 벌목 등)는 tiles에 직접 쓰지 말고
+        이 메서드를 사용해야 시야/경로 캐시가 무효화됩니다.
+
+        Args:
+            index: tiles 인덱스 (좌표 튜플, 슬라이스, 마스크 등)
+            tile: 새 타일
+        """
+        before = self.tiles[["walkable", "transparent"]][index].copy()
+        self.tiles[index] = tile
+        after = self.tiles[["walkable", "transparent"]][index]
+        if not np.array_equal(before, after):
+            self.bump_revision()
+
+    def bump_revision(self) -> None:
+        """맵 리비전 증가 및 시야/경로 캐시 무효화"""
+        self.revision += 1
+        self._fov_cache.clear()
+        self._fov_key = None
+        self._path_cache.clear()
+
+    # =========================================================================
+    # 지형 파기 (맵 생성기용 일괄 쓰기)
+    # =========================================================================
+
+    def _clip_rect(
+        self, x1: int, y1: int, x2: int, y2: int
+    ) -> Optional[Tuple[slice, slice]]:
+        """양 끝을 포함하는 사각형을 맵 범위로 잘라 슬라이스로 변환 (비면 None)"""
+        x1, x2 = max(0, min(x1, x2)), min(self.width - 1, max(x1, x2))
+        y1, y2 = max(0, min(y1, y2)), min(self.height - 1, max(y1, y2))
+        if x1 > x2 or y1 > y2:
+            return None
+        return slice(x1, x2 + 1), slice(y1, y2 + 1)
+
+    def _stamp_mask(
+        self, region: Tuple[slice, slice], mask: np.ndarray, tile: np.ndarray
+    ) -> None:
+        """영역 안에서 마스크가 True인 칸만 타일로 변경"""
+        patch = self.tiles[region]  # 밀집 배열은 뷰, 청크 맵은 복사본
+        patch[mask] = tile
+        self.tiles[region] = patch
+        self.bump_revision()
+
+    def carve_rect(
+        self, x1: int, y1: int, x2: int, y2: int, tile: np.ndarray = tile_types.floor
+    ) -> None:
+        """
+        사각형 영역을 한 번에 타일로 변경
+
+        Args:
+            x1, y1, x2, y2: 양 끝을 포함하는 모서리 좌표 (맵 밖은 잘림)
+            tile: 새 타일 (기본: 바닥)
+        """
+        region = self._clip_rect(x1, y1, x2, y2)
+        if region is None:
+            return
+        self.tiles[region] = tile
+        self.bump_revision()
+
+    def carve_tunnel(
+        self,
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+        horizontal_first: bool = True,
+        tile: np.ndarray = tile_types.floor,
+    ) -> None:
+        """
+        두 점 사이에 L자형 통로 파기 (가로/세로 슬라이스 두 번)
+
+        Args:
+            start: 시작점
+            end: 끝점
+            horizontal_first: True면 가로로 먼저 이동한 뒤 세로로 이동
+            tile: 새 타일 (기본: 바닥)
+        """
+        (x1, y1), (x2, y2) = start, end
+        corner_x, corner_y = (x2, y1) if horizontal_first else (x1, y2)
+        self.carve_rect(x1, y1, corner_x, corner_y, tile)
+        self.carve_rect(corner_x, corner_y, x2, y2, tile)
+
+    def carve_line(
+        self,
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+        tile: np.ndarray = tile_types.floor,
+    ) -> None:
+        """
+        두 점 사이 직선(브레젠험) 파기
+
+        직선 위의 좌표를 numpy로 한 번에 계산해 한 번에 씁니다.
+
+        Args:
+            start: 시작점
+            end: 끝점
+            tile: 새 타일 (기본: 바닥)
+        """
+        (x1, y1), (x2, y2) = start, end
+        dx, dy = x2 - x1, y2 - y1
+        steps = max(abs(dx), abs(dy), 1)
+
+        # 주축은 한 칸씩, 보조축은 반올림 (정수 연산)
+        t = np.arange(max(abs(dx), abs(dy)) + 1)
+        xs = x1 + (2 * t * dx + steps) // (2 * steps)
+        ys = y1 + (2 * t * dy + steps) // (2 * steps)
+
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs, ys = xs[inside], ys[inside]
+        if xs.size == 0:
+            return
+
+        if isinstance(self.tiles, np.ndarray):
+            self.tiles[xs, ys] = tile
+            self.bump_revision()
+            return
+
+        # 좌표 인덱싱을 지원하지 않는 저장소: 외접 사각형 마스크로 기록
+        x0, y0 = int(xs.min()), int(ys.min())
+        region = self._clip_rect(x0, y0, int(xs.max()), int(ys.max()))
+        mask = np.zeros((region[0].stop - x0, region[1].stop - y0), dtype=bool)
+        mask[xs - x0, ys - y0] = True
+        self._stamp_mask(region, mask, tile)
+
+    def carve_circle(
+        self, cx: int, cy: int, radius: int, tile: np.ndarray = tile_types.floor
+    ) -> None:
+        """
+        원형 영역 파기 (중심에서 거리 radius 이내)
+
+        Args:
+            cx, cy: 중심
+            radius: 반경
+            tile: 새 타일 (기본: 바닥)
+        """
+        region = self._clip_rect(cx - radius, cy - radius, cx + radius, cy + radius)
+        if region is None:
+            return
+        xs, ys = region
+        dx = np.arange(xs.start, xs.stop)[:, None] - cx
+        dy = np.arange(ys.start, ys.stop)[None, :] - cy
+        self._stamp_mask(region, dx * dx + dy * dy <= radius * radius, tile)
+
     def is_walkable(self, x: int, y: int) -> bool:
         """해당 위치로 이동 가능한지 확인"""
         if not self.in_bounds(x, y):
@@ -64,39 +273,124 @@ class GameMap:
 
     def get_blocking_entity_at(self, x: int, y: int) -> Optional[Entity]:
         """해당 위치의 블로킹 엔티티 반환"""
-        for entity in self.entities:
-            if entity.blocks_movement and entity.x == x and entity.y == y:
+        for entity in self._entities_at.get((x, y), ()):
+            if entity.blocks_movement:
                 return entity
         return None
 
     def get_actor_at(self, x: int, y: int) -> Optional[Actor]:
         """해당 위치의 Actor 반환"""
-        for entity in self.entities:
-            if hasattr(entity, "fighter") and entity.x == x and entity.y == y:
+        for entity in self._entities_at.get((x, y), ()):
+            if hasattr(entity, "fighter"):
                 return entity  # type: ignore
         return None
 
+    def get_entities_at(self, x: int, y: int) -> List[Entity]:
+        """해당 위치의 엔티티 리스트 반환"""
+        return list(self._entities_at.get((x, y), ()))
+
     def get_items_at(self, x: int, y: int) -> List[Item]:
         """해당 위치의 아이템 리스트 반환"""
-        return [item for item in self.items if item.x == x and item.y == y]
+        return list(self._items_at.get((x, y), ()))
+
+    def get_entities_in_rect(self, x: int, y: int, width: int, height: int) -> List[Entity]:
+        """사각 영역 안의 엔티티 리스트 반환 (공간 인덱스 조회)"""
+        return self._query_rect(self._entities_at, x, y, width, height)
+
+    def get_items_in_rect(self, x: int, y: int, width: int, height: int) -> List[Item]:
+        """사각 영역 안의 아이템 리스트 반환 (공간 인덱스 조회)"""
+        return self._query_rect(self._items_at, x, y, width, height)
+
+    @staticmethod
+    def _query_rect(
+        index: Dict[Tuple[int, int], list], x: int, y: int, width: int, height: int
+    ) -> list:
+        """
+        공간 인덱스에서 사각 영역 조회
+
+        영역 칸 수와 점유된 칸 수 중 작은 쪽을 순회합니다.
+        같은 칸의 객체는 추가된 순서를 유지합니다.
+        """
+        found: list = []
+        if width * height < len(index):
+            for cx in range(x, x + width):
+                for cy in range(y, y + height):
+                    bucket = index.get((cx, cy))
+                    if bucket:
+                        found.extend(bucket)
+        else:
+            for (cx, cy), bucket in index.items():
+                if x <= cx < x + width and y <= cy < y + height:
+                    found.extend(bucket)
+        return found
 
     def add_entity(self, entity: Entity) -> None:
         """엔티티 추가"""
+        if hasattr(entity, "fighter"):
+            self.actor_store.attach(entity)  # type: ignore
+            self.new_actors.append(entity)  # type: ignore
         self.entities.append(entity)
+        self._entities_at.setdefault((entity.x, entity.y), []).append(entity)
+        entity.game_map = self
+        self.entity_revision += 1
 
     def remove_entity(self, entity: Entity) -> None:
         """엔티티 제거"""
         if entity in self.entities:
             self.entities.remove(entity)
+            self._unindex(self._entities_at, entity, entity.x, entity.y)
+            entity.game_map = None
+            if hasattr(entity, "fighter"):
+                self.actor_store.detach(entity)  # type: ignore
+            self.entity_revision += 1
 
     def add_item(self, item: Item) -> None:
         """아이템 추가"""
         self.items.append(item)
+        self._items_at.setdefault((item.x, item.y), []).append(item)
+        item.game_map = self
+        self.entity_revision += 1
 
     def remove_item(self, item: Item) -> None:
         """아이템 제거"""
         if item in self.items:
             self.items.remove(item)
+            self._unindex(self._items_at, item, item.x, item.y)
+            item.game_map = None
+            self.entity_revision += 1
+
+    def update_position(self, entity: Entity, old_x: int, old_y: int) -> None:
+        """
+        엔티티 위치 변경을 공간 인덱스에 반영
+
+        Entity.move/place에서 호출됩니다.
+
+        Args:
+            entity: 이동한 엔티티 (이미 새 좌표를 가짐)
+            old_x, old_y: 이동 전 위치
+        """
+        if entity in self._items_at.get((old_x, old_y), ()):
+            index = self._items_at
+        else:
+            index = self._entities_at
+        self._unindex(index, entity, old_x, old_y)
+        index.setdefault((entity.x, entity.y), []).append(entity)
+        self.entity_revision += 1
+
+    @staticmethod
+    def _unindex(
+        index: Dict[Tuple[int, int], list], obj: Entity, x: int, y: int
+    ) -> None:
+        """공간 인덱스에서 객체 제거 (빈 칸은 키 삭제)"""
+        bucket = index.get((x, y))
+        if bucket is None:
+            return
+        for i, other in enumerate(bucket):
+            if other is obj:
+                del bucket[i]
+                break
+        if not bucket:
+            del index[(x, y)]
 
     @property
     def actors(self) -> Iterator[Actor]:
@@ -115,131 +409,98 @@ class GameMap:
         x: int,
         y: int,
         radius: int,
-        algorithm: int = 0,
+        algorithm: int = fov.FOV_SYMMETRIC_SHADOWCAST,
         light_walls: bool = True,
     ) -> None:
         """
         시야(FOV) 계산
 
-        간단한 레이캐스팅 알고리즘 사용
+        섀도캐스팅 결과를 visible/explored에 직접 기록합니다.
+        결과는 (위치, 반경, 알고리즘, 맵 리비전) 기준으로 캐시되므로
+        제자리 대기/휴식처럼 아무것도 바뀌지 않은 턴은 계산을 건너뜁니다.
 
         Args:
             x, y: 시야 중심점
             radius: 시야 반경
-            algorithm: 알고리즘 (미사용, 호환성용)
+            algorithm: FOV 알고리즘 (systems.fov 상수)
             light_walls: 벽도 밝힐지 여부
         """
-        # 모든 타일을 안 보이게 설정
-        self.visible[:] = False
-
-        # 중심점은 항상 보임
-        self.visible[x, y] = True
-        self.explored[x, y] = True
-
-        # 원형 시야 계산 (간단한 레이캐스팅)
-        for angle in range(360):
-            self._cast_ray(x, y, angle, radius, light_walls)
-
-    def _cast_ray(
-        self,
-        start_x: int,
-        start_y: int,
-        angle: int,
-        radius: int,
-        light_walls: bool,
-    ) -> None:
-        """레이 캐스팅으로 시야 계산"""
-        import math
-
-        # 각도를 라디안으로 변환
-        rad = math.radians(angle)
-        dx = math.cos(rad)
-        dy = math.sin(rad)
-
-        x = start_x + 0.5
-        y = start_y + 0.5
-
-        for _ in range(radius):
-            x += dx
-            y += dy
-
-            tile_x = int(x)
-            tile_y = int(y)
-
-            if not self.in_bounds(tile_x, tile_y):
-                break
-
-            # 거리 체크
-            dist = ((tile_x - start_x) ** 2 + (tile_y - start_y) ** 2) ** 0.5
-            if dist > radius:
-                break
-
-            # 이 타일을 볼 수 있음
-            self.visible[tile_x, tile_y] = True
-            self.explored[tile_x, tile_y] = True
-
-            # 불투명한 타일이면 레이 중단
-            if not self.tiles["transparent"][tile_x, tile_y]:
-                break
+        key = (x, y, radius, algorithm, light_walls, self.revision)
+
+        # 이미 visible에 반영된 결과면 아무것도 하지 않음
+        if key == self._fov_key:
+            self.fov_cache_hits += 1
+            return
+
+        cached = self._fov_cache.get(key)
+        if cached is not None:
+            self.fov_cache_hits += 1
+            self._fov_cache.move_to_end(key)
+        else:
+            self.fov_cache_misses += 1
+            cached = fov.compute_fov(
+                self.tiles["transparent"], x, y, radius, algorithm, light_walls
+            )
+            self._fov_cache[key] = cached
+            if len(self._fov_cache) > self.FOV_CACHE_SIZE:
+                self._fov_cache.popitem(last=False)
+
+        lit, region = cached
+        self.visible[self._visible_region] = False
+        self.visible[region] = lit
+        self._visible_region = region
+        self.explored[region] |= lit
+        self._fov_key = key
+        self.fov_revision += 1
 
     def get_path(
         self,
         start: Tuple[int, int],
         goal: Tuple[int, int],
+        cost: Optional[np.ndarray] = None,
+        max_expansions: int = pathfinding.DEFAULT_MAX_EXPANSIONS,
     ) -> List[Tuple[int, int]]:
         """
-        두 점 사이의 경로 계산 (간단한 A* 알고리즘)
+        두 점 사이의 경로 계산 (A* 알고리즘)
+
+        비용 배열 없이 호출한 결과는 맵 리비전이 바뀔 때까지 캐시됩니다.
 
         Args:
             start: 시작 위치
             goal: 목표 위치
+            cost: 타일 진입 비용 배수 배열 (선택)
+            max_expansions: 최대 노드 확장 수
 
         Returns:
             경로 좌표 리스트
         """
-        import heapq
-
-        def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> float:
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-        neighbors = [
-            (0, -1), (0, 1), (-1, 0), (1, 0),
-            (-1, -1), (-1, 1), (1, -1), (1, 1),
-        ]
-
-        open_set = []
-        heapq.heappush(open_set, (0, start))
-        came_from = {}
-        g_score = {start: 0}
-
-        while open_set:
-            current = heapq.heappop(open_set)[1]
-
-            if current == goal:
-                # 경로 재구성
-                path = []
-                while current in came_from:
-                    path.append(current)
-                    current = came_from[current]
-                return path[::-1]
-
-            for dx, dy in neighbors:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if not self.in_bounds(neighbor[0], neighbor[1]):
-                    continue
-
-                if not self.tiles["walkable"][neighbor[0], neighbor[1]]:
-                    continue
-
-                # 대각선 이동 비용은 약간 더 높음
-                move_cost = 1.4 if dx != 0 and dy != 0 else 1.0
-                tentative_g = g_score[current] + move_cost
-
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f_score = tentative_g + heuristic(neighbor, goal)
-                    heapq.heappush(open_set, (f_score, neighbor))
-
-        return []  # 경로 없음
+        if cost is not None:
+            return self._find_path(start, goal, cost, max_expansions)
+
+        key = (start, goal, max_expansions, self.revision)
+        path = self._path_cache.get(key)
+        if path is not None:
+            self.path_cache_hits += 1
+            self._path_cache.move_to_end(key)
+        else:
+            self.path_cache_misses += 1
+            path = self._find_path(start, goal, None, max_expansions)
+            self._path_cache[key] = path
+            if len(self._path_cache) > self.PATH_CACHE_SIZE:
+                self._path_cache.popitem(last=False)
+
+        return list(path)
+
+    def _find_path(
+        self,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        cost: Optional[np.ndarray],
+        max_expansions: int,
+    ) -> List[Tuple[int, int]]:
+        """맵 전체를 대상으로 A* 실행 (탐색 배열은 맵마다 재사용)"""
+        if self._path_scratch is None:
+            self._path_scratch = pathfinding.PathScratch(self.width, self.height)
+        return pathfinding.find_path(
+            self.tiles["walkable"], start, goal, cost, max_expansions, self._path_scratch
+        )
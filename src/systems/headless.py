@@ -0,0 +1,184 @@
+"""
+헤드리스 렌더링 대상
+창(SDL) 없이 화면을 numpy 배열(코드포인트, 전경색, 배경색)로 렌더링
+
+HeadlessConsole은 renderer가 사용하는 tcod 콘솔 기능(rgb 배열, print,
+draw_rect, draw_frame, clear)만 numpy로 구현하므로 디스플레이가 없는
+환경에서도 같은 렌더러 코드로 화면을 그릴 수 있습니다.
+렌더링 벤치마크, 화면 스냅샷 테스트, 자동 플레이에 사용합니다.
+
+사용 예:
+    console = HeadlessConsole(SCREEN_WIDTH, SCREEN_HEIGHT)
+    renderer.render_frame(console, engine)
+    console.rgb["ch"]   # (width, height) int32 코드포인트
+    console.to_text()   # 스냅샷 비교용 문자열
+"""
+from __future__ import annotations
+from typing import Optional, Tuple
+import numpy as np
+
+# tcod.console.Console.rgb와 같은 레이아웃
+rgb_dt = np.dtype([
+    ("ch", np.int32),  # 문자 코드포인트
+    ("fg", "3B"),      # 전경색 (RGB)
+    ("bg", "3B"),      # 배경색 (RGB)
+])
+
+Color = Tuple[int, int, int]
+
+DEFAULT_FG = (255, 255, 255)
+DEFAULT_BG = (0, 0, 0)
+
+# draw_frame 테두리 문자 (좌상, 상, 우상, 좌, 우, 좌하, 하, 우하)
+_FRAME = "┌─┐││└─┘"
+
+
+class HeadlessConsole:
+    """
+    numpy 배열 콘솔 (tcod.console.Console의 렌더러용 부분 구현)
+
+    Attributes:
+        width, height: 콘솔 크기 (문자 단위)
+        rgb: (width, height) 구조화 배열 (ch, fg, bg), [x, y] 인덱싱
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.rgb = np.zeros((width, height), dtype=rgb_dt, order="F")
+        self.clear()
+
+    @property
+    def ch(self) -> np.ndarray:
+        """문자 코드포인트 배열"""
+        return self.rgb["ch"]
+
+    @property
+    def fg(self) -> np.ndarray:
+        """전경색 배열"""
+        return self.rgb["fg"]
+
+    @property
+    def bg(self) -> np.ndarray:
+        """배경색 배열"""
+        return self.rgb["bg"]
+
+    def clear(self, ch: int = ord(" "), fg: Color = DEFAULT_FG, bg: Color = DEFAULT_BG) -> None:
+        """콘솔 전체 초기화"""
+        self.rgb[...] = (ch, fg, bg)
+
+    def _fill(
+        self,
+        xs: slice,
+        ys: slice,
+        ch: Optional[int],
+        fg: Optional[Color],
+        bg: Optional[Color],
+    ) -> None:
+        """영역 채우기 (None인 값은 그대로 둠)"""
+        if ch:
+            self.rgb["ch"][xs, ys] = ch
+        if fg is not None:
+            self.rgb["fg"][xs, ys] = fg
+        if bg is not None:
+            self.rgb["bg"][xs, ys] = bg
+
+    def _clip(self, x: int, y: int, width: int, height: int) -> Optional[Tuple[slice, slice]]:
+        """사각형을 콘솔 범위로 잘라 슬라이스로 변환 (비면 None)"""
+        x1, y1 = max(0, x), max(0, y)
+        x2, y2 = min(self.width, x + width), min(self.height, y + height)
+        if x1 >= x2 or y1 >= y2:
+            return None
+        return slice(x1, x2), slice(y1, y2)
+
+    def print(
+        self,
+        x: int,
+        y: int,
+        string: str,
+        fg: Optional[Color] = None,
+        bg: Optional[Color] = None,
+    ) -> None:
+        """
+        문자열 출력 (한 글자당 한 칸, 콘솔 밖은 잘림)
+
+        Args:
+            x, y: 시작 위치
+            string: 출력할 문자열
+            fg, bg: 색상 (None이면 기존 색 유지)
+        """
+        if not 0 <= y < self.height or not string:
+            return
+        start = max(0, -x)
+        stop = min(len(string), self.width - x)
+        if start >= stop:
+            return
+
+        codes = np.frombuffer(string[start:stop].encode("utf-32-le"), dtype=np.int32)
+        self._fill(slice(x + start, x + stop), slice(y, y + 1), None, fg, bg)
+        self.rgb["ch"][x + start:x + stop, y] = codes
+
+    def draw_rect(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        ch: int,
+        fg: Optional[Color] = None,
+        bg: Optional[Color] = None,
+    ) -> None:
+        """
+        사각형 채우기
+
+        Args:
+            x, y, width, height: 영역
+            ch: 채울 문자 코드포인트 (0이면 문자 유지)
+            fg, bg: 색상 (None이면 기존 색 유지)
+        """
+        region = self._clip(x, y, width, height)
+        if region is not None:
+            self._fill(*region, ch, fg, bg)
+
+    def draw_frame(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        title: str = "",
+        clear: bool = True,
+        fg: Optional[Color] = None,
+        bg: Optional[Color] = None,
+    ) -> None:
+        """
+        테두리 창 그리기 (제목은 윗변 가운데에 전경/배경색을 뒤집어 표시)
+
+        Args:
+            x, y, width, height: 창 영역 (테두리 포함)
+            title: 제목
+            clear: 안쪽을 공백으로 지울지
+            fg, bg: 색상 (None이면 기존 색 유지)
+        """
+        if width < 2 or height < 2:
+            return
+
+        if clear:
+            self.draw_rect(x + 1, y + 1, width - 2, height - 2, ord(" "), fg, bg)
+
+        top_left, top, top_right, left, right, bottom_left, bottom, bottom_right = _FRAME
+        self.print(x, y, top_left + top * (width - 2) + top_right, fg, bg)
+        self.print(x, y + height - 1, bottom_left + bottom * (width - 2) + bottom_right, fg, bg)
+        self.draw_rect(x, y + 1, 1, height - 2, ord(left), fg, bg)
+        self.draw_rect(x + width - 1, y + 1, 1, height - 2, ord(right), fg, bg)
+
+        if title:
+            text = f" {title} "[: width - 2]
+            self.print(x + (width - len(text)) // 2, y, text, fg=bg, bg=fg)
+
+    def to_text(self) -> str:
+        """화면 문자를 줄 단위 문자열로 변환 (스냅샷 테스트용)"""
+        return "\n".join(
+            "".join(map(chr, self.rgb["ch"][:, y])).rstrip()
+            for y in range(self.height)
+        )
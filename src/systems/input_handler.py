@@ -95,6 +95,16 @@ class LookAction(Action):
     pass
 
 
+class DescendAction(Action):
+    """계단 내려가기 액션"""
+    pass
+
+
+class AscendAction(Action):
+    """계단 올라가기 액션"""
+    pass
+
+
 class QuitAction(Action):
     """게임 종료 액션"""
     pass
@@ -128,6 +138,16 @@ def handle_main_game_input(event: tcod.event.KeyDown) -> Optional[Action]:
         dx, dy = MOVE_KEYS[key]
         return MoveAction(dx, dy)
 
+    # 계단 (> / <, Shift+. / Shift+,)
+    if key == tcod.event.KeySym.GREATER or (
+        key == tcod.event.KeySym.PERIOD and mod & tcod.event.KMOD_SHIFT
+    ):
+        return DescendAction()
+    if key == tcod.event.KeySym.LESS or (
+        key == tcod.event.KeySym.COMMA and mod & tcod.event.KMOD_SHIFT
+    ):
+        return AscendAction()
+
     # 대기
     if key in WAIT_KEYS:
         return WaitAction()
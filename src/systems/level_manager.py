@@ -0,0 +1,428 @@
+"""
+레벨 관리자
+여러 층으로 이루어진 던전의 층별 GameMap 관리
+
+최근에 방문한 층은 LRU 캐시에 그대로 두고, 한도를 넘어 밀려난 층은
+타일 번호(uint8)/탐험 배열과 엔티티 명세를 압축 파일로 디스크에 내보냅니다.
+(미리 생성된 층의 페이로드와 같은 tile_types.encode_tiles 형식)
+다시 방문하면 캐시나 디스크에서 복원하므로 층을 다시 생성하지 않습니다.
+아직 방문하지 않은 다음 층들은 LevelPregenerator가 미리 만들어 둘 수 있습니다.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from components.actor_store import AI_HOSTILE, AI_PASSIVE
+from systems import streams
+from systems import tile_types
+from systems.game_map import GameMap
+from systems.pregen import LevelPregenerator, map_from_payload
+
+if TYPE_CHECKING:
+    from components.entity import Actor, Item
+
+# 층 생성 함수: (깊이, 플레이어, 월드 시드) → 플레이어가 배치된 GameMap
+LevelGenerator = Callable[[int, "Actor", int], GameMap]
+
+
+# =============================================================================
+# 엔티티 명세 (디스크 저장용 딕셔너리)
+# =============================================================================
+
+def actor_to_spec(actor: Actor) -> Dict[str, Any]:
+    """Actor를 JSON으로 저장할 수 있는 명세로 변환"""
+    spec: Dict[str, Any] = {
+        "x": actor.x,
+        "y": actor.y,
+        "char": actor.char,
+        "color": list(actor.color),
+        "name": actor.name,
+        "speed": actor.speed,
+    }
+
+    if actor.fighter:
+        spec["fighter"] = {
+            "max_hp": actor.fighter.max_hp,
+            "hp": actor.fighter.hp,
+            "defense": actor.fighter.defense,
+            "power": actor.fighter.power,
+        }
+
+    if actor.equipment:
+        spec["equipment"] = actor.equipment.to_spec()
+
+    ai = actor.ai
+    if ai is not None and ai.kind == AI_HOSTILE:
+        spec["ai"] = {"kind": "hostile", "detection_range": ai.detection_range}
+    elif ai is not None and ai.kind == AI_PASSIVE:
+        spec["ai"] = {
+            "kind": "passive",
+            "flee_hp_percent": ai.flee_hp_percent,
+            "is_hostile": ai.is_hostile,
+        }
+
+    return spec
+
+
+def actor_from_spec(spec: Dict[str, Any]) -> Actor:
+    """명세에서 Actor 생성"""
+    from components.entity import Actor
+    from components.fighter import Fighter
+    from components.ai import HostileAI, PassiveAI
+    from components.equipment import Equipment
+
+    actor = Actor(
+        x=spec["x"],
+        y=spec["y"],
+        char=spec["char"],
+        color=tuple(spec["color"]),
+        name=spec["name"],
+        speed=spec.get("speed", 100),
+    )
+
+    if "fighter" in spec:
+        f = spec["fighter"]
+        actor.fighter = Fighter(hp=f["max_hp"], defense=f["defense"], power=f["power"])
+        actor.fighter.hp = f["hp"]
+
+    if "equipment" in spec:
+        actor.equipment = Equipment.from_spec(spec["equipment"])
+        actor.equipment.entity = actor
+
+    ai_spec = spec.get("ai")
+    if ai_spec is not None and ai_spec["kind"] == "hostile":
+        actor.ai = HostileAI(detection_range=ai_spec["detection_range"])
+    elif ai_spec is not None and ai_spec["kind"] == "passive":
+        ai = PassiveAI(flee_hp_percent=ai_spec["flee_hp_percent"])
+        ai.is_hostile = ai_spec["is_hostile"]
+        actor.ai = ai
+
+    return actor
+
+
+def item_to_spec(item: Item) -> Dict[str, Any]:
+    """Item을 JSON으로 저장할 수 있는 명세로 변환"""
+    return {
+        "x": item.x,
+        "y": item.y,
+        "char": item.char,
+        "color": list(item.color),
+        "name": item.name,
+        "consumable": item.consumable,
+        "nutrition": item.nutrition,
+        "hydration": item.hydration,
+        "count": item.count,
+        "durability": item.durability,
+    }
+
+
+def item_from_spec(spec: Dict[str, Any]) -> Item:
+    """명세에서 Item 생성 (같은 프로토타입은 공유됨)"""
+    from components.entity import Item
+
+    return Item(
+        x=spec["x"],
+        y=spec["y"],
+        char=spec["char"],
+        color=tuple(spec["color"]),
+        name=spec["name"],
+        consumable=spec["consumable"],
+        nutrition=spec["nutrition"],
+        hydration=spec["hydration"],
+        count=spec.get("count", 1),
+        durability=spec.get("durability", 0),
+    )
+
+
+def level_meta(game_map: GameMap, exclude: Optional[Actor] = None) -> Dict[str, Any]:
+    """
+    층 파일에 타일 배열과 함께 저장하는 메타 정보 (계단, 난수 상태, 엔티티)
+
+    Args:
+        game_map: 저장할 맵
+        exclude: 명세에서 뺄 Actor (따로 저장하는 플레이어)
+    """
+    return {
+        "upstairs": game_map.upstairs_location,
+        "downstairs": game_map.downstairs_location,
+        "rng_state": game_map.rng.bit_generator.state,
+        "actors": [
+            actor_to_spec(actor)
+            for actor in game_map.entities
+            if hasattr(actor, "fighter") and actor is not exclude
+        ],
+        "items": [item_to_spec(item) for item in game_map.items],
+    }
+
+
+def level_from_spec(
+    tile_ids: np.ndarray, explored: np.ndarray, meta: Dict[str, Any]
+) -> GameMap:
+    """
+    타일 번호/탐험 배열과 level_meta 메타 정보로 GameMap 조립
+
+    층 파일과 세이브 파일이 같은 형식을 쓰므로 양쪽에서 사용합니다.
+    """
+    tiles = tile_types.decode_tiles(tile_ids)
+    width, height = tiles.shape
+    game_map = GameMap(width, height)
+    game_map.tiles[...] = tiles
+    game_map.explored[...] = explored
+    if meta["upstairs"] is not None:
+        game_map.upstairs_location = tuple(meta["upstairs"])
+    if meta["downstairs"] is not None:
+        game_map.downstairs_location = tuple(meta["downstairs"])
+    game_map.rng.bit_generator.state = meta["rng_state"]
+
+    for spec in meta["items"]:
+        game_map.add_item(item_from_spec(spec))
+    for spec in meta["actors"]:
+        game_map.add_entity(actor_from_spec(spec))
+    return game_map
+
+
+# =============================================================================
+# 레벨 관리자
+# =============================================================================
+
+class LevelManager:
+    """
+    층별 GameMap 관리자
+
+    Attributes:
+        seed: 월드 시드 (같은 시드면 층 N은 생성 순서와 관계없이 같음)
+        depth: 현재 층 (1부터 시작)
+        cache_size: 메모리에 유지할 최대 층 수
+        save_dir: 밀려난 층을 저장하는 디렉터리 (없으면 처음 내보낼 때 임시 생성)
+        pregenerator: 다음 층 미리 생성기 (lookahead가 0이면 None)
+    """
+
+    def __init__(
+        self,
+        generator: LevelGenerator,
+        seed: Optional[int] = None,
+        cache_size: int = 3,
+        save_dir: Optional[str] = None,
+        lookahead: int = 0,
+    ):
+        self.generator = generator
+        self.seed = seed if seed is not None else streams.new_world_seed()
+        self.cache_size = max(1, cache_size)
+        self.save_dir = save_dir
+        self._owns_save_dir = False
+        self.depth = 1
+
+        self.levels: OrderedDict[int, GameMap] = OrderedDict()
+
+        self.pregenerator: Optional[LevelPregenerator] = None
+        if lookahead > 0:
+            self.pregenerator = LevelPregenerator(generator, self.seed, lookahead)
+
+        # 통계
+        self.generated_count = 0
+        self.loaded_count = 0
+        self.evicted_count = 0
+
+    def add_level(self, depth: int, game_map: GameMap) -> None:
+        """이미 만든 맵을 해당 층으로 등록 (새 게임의 첫 층 등)"""
+        self.levels[depth] = game_map
+        self.levels.move_to_end(depth)
+        self.depth = depth
+        self._evict()
+        self._pregenerate_ahead(depth)
+
+    def get(self, depth: int, player: Actor) -> GameMap:
+        """
+        층 맵 가져오기 (캐시 → 디스크 → 미리 생성된 층 → 새로 생성 순)
+
+        새로 생성한 층에는 생성 함수가 플레이어를 배치하고,
+        캐시나 디스크에서 가져온 층에는 플레이어가 없습니다.
+
+        Args:
+            depth: 층
+            player: 플레이어 (새로 생성할 때 배치됨)
+
+        Returns:
+            해당 층의 GameMap
+        """
+        game_map = self.levels.get(depth)
+        if game_map is not None:
+            self.levels.move_to_end(depth)
+        else:
+            game_map = self._load(depth)
+            if game_map is None and self.pregenerator is not None:
+                payload = self.pregenerator.take(depth)
+                if payload is not None:
+                    game_map = map_from_payload(payload, player)
+                    self.generated_count += 1
+            if game_map is None:
+                game_map = self.generator(depth, player, self.seed)
+                self.generated_count += 1
+            self.levels[depth] = game_map
+            self._evict()
+
+        self.depth = depth
+        self._pregenerate_ahead(depth)
+        return game_map
+
+    def has_level(self, depth: int) -> bool:
+        """이미 만들어진 층인지 (캐시 또는 디스크)"""
+        if depth in self.levels:
+            return True
+        path = self._path(depth)
+        return path is not None and os.path.exists(path)
+
+    def _pregenerate_ahead(self, depth: int) -> None:
+        """
+        현재 층 다음의 아직 없는 층들을 미리 생성 요청
+
+        올라가는 등 현재 층에서 멀어져 범위를 벗어난 요청은 취소합니다.
+        """
+        if self.pregenerator is None:
+            return
+        window = range(depth + 1, depth + 1 + self.pregenerator.lookahead)
+        for pending in self.pregenerator.pending:
+            if pending not in window:
+                self.pregenerator.discard(pending)
+        for ahead in window:
+            if not self.has_level(ahead):
+                self.pregenerator.request(ahead)
+
+    def _path(self, depth: int) -> Optional[str]:
+        """층 저장 파일 경로"""
+        if self.save_dir is None:
+            return None
+        return os.path.join(self.save_dir, f"level_{depth:03d}.npz")
+
+    def _load(self, depth: int) -> Optional[GameMap]:
+        """디스크에 저장된 층 복원 (없으면 None)"""
+        path = self._path(depth)
+        if path is None or not os.path.exists(path):
+            return None
+
+        with np.load(path) as data:
+            game_map = level_from_spec(
+                data["tile_ids"], data["explored"], json.loads(str(data["meta"]))
+            )
+
+        os.remove(path)
+        self.loaded_count += 1
+        return game_map
+
+    def _save(self, depth: int, game_map: GameMap) -> None:
+        """층을 디스크에 저장 (타일 번호/탐험 배열 + 엔티티 명세)"""
+        self._write(
+            depth,
+            tile_types.encode_tiles(game_map.tiles),
+            game_map.explored,
+            level_meta(game_map),
+        )
+
+    def _write(
+        self, depth: int, tile_ids: np.ndarray, explored: np.ndarray, meta: Dict[str, Any]
+    ) -> None:
+        """층 파일 쓰기 (저장 디렉터리가 없으면 임시로 생성)"""
+        if self.save_dir is None:
+            self.save_dir = tempfile.mkdtemp(prefix="levels_")
+            self._owns_save_dir = True
+
+        np.savez_compressed(
+            self._path(depth),
+            tile_ids=tile_ids,
+            explored=explored,
+            meta=np.array(json.dumps(meta, ensure_ascii=False)),
+        )
+
+    def export_levels(self, exclude: Optional[int] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        캐시와 디스크에 있는 모든 층을 세이브 파일용 명세로 변환
+
+        Args:
+            exclude: 제외할 층 (세이브 파일에 따로 저장하는 현재 층)
+
+        Returns:
+            층 → {"tile_ids", "explored", 나머지 메타 정보} 명세
+        """
+        specs: Dict[int, Dict[str, Any]] = {}
+        for depth, game_map in self.levels.items():
+            if depth != exclude:
+                specs[depth] = {
+                    "tile_ids": tile_types.encode_tiles(game_map.tiles).tolist(),
+                    "explored": game_map.explored.tolist(),
+                    **level_meta(game_map),
+                }
+
+        if self.save_dir is not None:
+            for name in os.listdir(self.save_dir):
+                if not (name.startswith("level_") and name.endswith(".npz")):
+                    continue
+                depth = int(name[len("level_"):-len(".npz")])
+                if depth == exclude or depth in specs:
+                    continue
+                with np.load(os.path.join(self.save_dir, name)) as data:
+                    specs[depth] = {
+                        "tile_ids": data["tile_ids"].tolist(),
+                        "explored": data["explored"].tolist(),
+                        **json.loads(str(data["meta"])),
+                    }
+        return specs
+
+    def import_levels(self, specs: Dict[int, Dict[str, Any]]) -> None:
+        """
+        export_levels로 만든 명세를 층 파일로 기록
+
+        방문할 때 디스크에서 복원되므로 다시 생성되지 않습니다.
+        (현재 층을 add_level로 등록하기 전에 불러야 미리 생성을 건너뜀)
+        """
+        for depth, spec in specs.items():
+            spec = dict(spec)
+            tile_ids = np.asarray(spec.pop("tile_ids"), dtype=np.uint8)
+            explored = np.asarray(spec.pop("explored"), dtype=bool)
+            self._write(int(depth), tile_ids, explored, spec)
+
+    def _evict(self) -> None:
+        """
+        한도를 넘은 층을 LRU 순서로 디스크에 내보냄
+
+        get/add_level은 현재 층을 맨 뒤로 옮긴 뒤에 부르므로
+        현재 층은 가장 최근 항목이라 내보내지지 않습니다.
+        """
+        while len(self.levels) > self.cache_size:
+            depth, game_map = self.levels.popitem(last=False)
+            self._save(depth, game_map)
+            self.evicted_count += 1
+
+    def close(self) -> None:
+        """미리 생성기 종료 및 직접 만든 저장 디렉터리 삭제"""
+        if self.pregenerator is not None:
+            self.pregenerator.shutdown()
+        self.levels.clear()
+        if self._owns_save_dir and self.save_dir is not None:
+            shutil.rmtree(self.save_dir, ignore_errors=True)
+            self.save_dir = None
+            self._owns_save_dir = False
+
+
+def create_dungeon_levels(seed: Optional[int] = None) -> LevelManager:
+    """
+    config 설정(캐시 크기, 미리 생성할 층 수)으로 던전 층 관리자 생성
+
+    새 게임과 불러온 게임이 같은 설정으로 동작하도록 양쪽에서 사용합니다.
+
+    Args:
+        seed: 월드 시드 (None이면 config.WORLD_SEED, 그것도 None이면 무작위)
+    """
+    from config import LEVEL_CACHE_SIZE, PREGENERATE_LEVELS, WORLD_SEED
+    from systems import procgen
+
+    return LevelManager(
+        procgen.generate_dungeon_level,
+        seed=seed if seed is not None else WORLD_SEED,
+        cache_size=LEVEL_CACHE_SIZE,
+        lookahead=PREGENERATE_LEVELS,
+    )
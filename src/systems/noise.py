@@ -0,0 +1,118 @@
+"""
+지형 노이즈 생성기
+시드 기반 값 노이즈(Value Noise)와 옥타브 합성(fBm)을 numpy로 계산
+
+격자점의 값은 (시드, 격자 좌표) 해시로 정해지므로 맵 전체를 한 번에
+만들든 청크 단위로 나누어 만들든 같은 좌표에서는 같은 값이 나옵니다.
+"""
+from __future__ import annotations
+import numpy as np
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+
+def _lattice(ix: np.ndarray, iy: np.ndarray, seed: int) -> np.ndarray:
+    """
+    격자점 해시 값 (0.0 ~ 1.0)
+
+    Args:
+        ix: x 격자 좌표 (1차원)
+        iy: y 격자 좌표 (1차원)
+        seed: 시드
+
+    Returns:
+        (len(ix), len(iy)) 배열
+    """
+    hx = ix.astype(np.uint64)[:, None] * np.uint64(374761393)
+    hy = iy.astype(np.uint64)[None, :] * np.uint64(668265263)
+    h = (hx + hy + np.uint64(seed & 0xFFFFFFFF) * np.uint64(2654435761)) & _MASK32
+    h = ((h ^ (h >> np.uint64(13))) * np.uint64(1274126177)) & _MASK32
+    h ^= h >> np.uint64(16)
+    return h.astype(np.float64) / float(0xFFFFFFFF)
+
+
+def value_noise(
+    x0: int,
+    y0: int,
+    width: int,
+    height: int,
+    period: float,
+    seed: int,
+) -> np.ndarray:
+    """
+    한 옥타브의 값 노이즈
+
+    period 간격의 격자점 값을 스무스스텝으로 보간합니다.
+    x/y 축을 나눠 보간하므로 격자 크기만큼의 해시만 계산합니다.
+
+    Args:
+        x0, y0: 영역의 맵 기준 좌상단 좌표
+        width, height: 영역 크기
+        period: 격자 간격 (타일 단위, 클수록 완만함)
+        seed: 시드
+
+    Returns:
+        (width, height) 배열 (0.0 ~ 1.0)
+    """
+    fx = (np.arange(x0, x0 + width) + 0.5) / period
+    fy = (np.arange(y0, y0 + height) + 0.5) / period
+    gx = np.floor(fx).astype(np.int64)
+    gy = np.floor(fy).astype(np.int64)
+    sx = fx - gx
+    sy = fy - gy
+    sx = sx * sx * (3.0 - 2.0 * sx)
+    sy = sy * sy * (3.0 - 2.0 * sy)
+
+    # 필요한 격자 범위만 해시
+    lattice = _lattice(
+        np.arange(gx[0], gx[-1] + 2),
+        np.arange(gy[0], gy[-1] + 2),
+        seed,
+    )
+    lx = gx - gx[0]
+    ly = gy - gy[0]
+
+    # x축 보간 → y축 보간
+    rows = lattice[lx] * (1.0 - sx)[:, None] + lattice[lx + 1] * sx[:, None]
+    return rows[:, ly] * (1.0 - sy)[None, :] + rows[:, ly + 1] * sy[None, :]
+
+
+def fractal_noise(
+    x0: int,
+    y0: int,
+    width: int,
+    height: int,
+    seed: int,
+    period: float = 32.0,
+    octaves: int = 4,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+) -> np.ndarray:
+    """
+    옥타브를 겹친 프랙탈 노이즈 (fBm)
+
+    Args:
+        x0, y0: 영역의 맵 기준 좌상단 좌표
+        width, height: 영역 크기
+        seed: 시드 (옥타브마다 다른 시드를 파생)
+        period: 첫 옥타브의 격자 간격
+        octaves: 옥타브 수
+        persistence: 옥타브마다 곱하는 진폭 비율
+        lacunarity: 옥타브마다 나누는 격자 간격 비율
+
+    Returns:
+        (width, height) 배열 (0.0 ~ 1.0)
+    """
+    total = np.zeros((width, height), dtype=np.float64)
+    amplitude = 1.0
+    norm = 0.0
+
+    for octave in range(octaves):
+        total += amplitude * value_noise(
+            x0, y0, width, height, max(1.0, period), seed + octave * 1013
+        )
+        norm += amplitude
+        amplitude *= persistence
+        period /= lacunarity
+
+    return total / norm
@@ -0,0 +1,304 @@
+"""
+경로 탐색 시스템
+플레이어 기준 거리 지도(Flow Field)와 A* 경로 탐색
+
+모든 추적 몬스터가 하나의 거리 지도를 공유하므로
+몬스터 수가 늘어도 경로 계산 비용은 턴당 한 번으로 고정됩니다.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, Optional, Tuple
+import heapq
+import numpy as np
+
+if TYPE_CHECKING:
+    from systems.game_map import GameMap
+
+# 도달할 수 없는 타일의 거리 값
+UNREACHABLE = np.iinfo(np.int32).max
+
+# 8방향 이웃
+DIRECTIONS: Tuple[Tuple[int, int], ...] = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0),           (1, 0),
+    (-1, 1),  (0, 1),  (1, 1),
+)
+
+
+class FlowField:
+    """
+    거리 지도 (Dijkstra Map)
+
+    origin으로부터 각 타일까지의 이동 턴 수(8방향, 대각선 비용 1)를
+    origin 주변 창(window) 범위에서만 보관합니다.
+
+    Attributes:
+        origin: 거리 0인 지점 (보통 플레이어 위치)
+        distances: 창 범위의 거리 배열 (도달 불가는 UNREACHABLE)
+        offset: 창의 맵 기준 좌상단 좌표
+    """
+
+    def __init__(
+        self,
+        origin: Tuple[int, int],
+        distances: np.ndarray,
+        offset: Tuple[int, int],
+    ):
+        self.origin = origin
+        self.distances = distances
+        self.offset = offset
+
+    def distance_at(self, x: int, y: int) -> int:
+        """해당 타일까지의 거리 (범위 밖/도달 불가는 UNREACHABLE)"""
+        lx = x - self.offset[0]
+        ly = y - self.offset[1]
+        if 0 <= lx < self.distances.shape[0] and 0 <= ly < self.distances.shape[1]:
+            return int(self.distances[lx, ly])
+        return UNREACHABLE
+
+    def next_step(
+        self, x: int, y: int, game_map: GameMap
+    ) -> Optional[Tuple[int, int]]:
+        """
+        거리 지도를 내려가는 다음 이동 방향
+
+        막힌 칸(다른 몬스터 등)은 건너뛰고, 거리가 줄어드는
+        이웃 중 가장 가까운 칸을 고릅니다.
+
+        Args:
+            x, y: 현재 위치
+            game_map: 현재 게임 맵
+
+        Returns:
+            이동 방향 (dx, dy) 또는 None (길이 없음)
+        """
+        current = self.distance_at(x, y)
+        if current == UNREACHABLE:
+            return None
+
+        goal_x, goal_y = self.origin
+        best = None
+        best_key = None
+
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            distance = self.distance_at(nx, ny)
+            if distance >= current:
+                continue
+            # 같은 거리면 목표와 일직선에 가까운 칸 우선
+            key = (distance, (goal_x - nx) ** 2 + (goal_y - ny) ** 2)
+            if best_key is not None and key >= best_key:
+                continue
+            if (nx, ny) != self.origin and not game_map.is_walkable(nx, ny):
+                continue
+            best, best_key = (dx, dy), key
+
+        return best
+
+
+def compute_flow_field(
+    walkable: np.ndarray,
+    origin: Tuple[int, int],
+    max_distance: int,
+) -> FlowField:
+    """
+    origin 기준 거리 지도 계산 (numpy 너비 우선 탐색)
+
+    한 단계마다 현재 파면(frontier)을 3x3으로 팽창시키고
+    이동 가능한 미방문 타일만 남깁니다.
+
+    Args:
+        walkable: (width, height) 이동 가능 배열
+        origin: 시작점 (거리 0)
+        max_distance: 계산할 최대 거리 (이 범위의 창만 할당)
+
+    Returns:
+        FlowField
+    """
+    width, height = walkable.shape
+    ox, oy = origin
+
+    x0, x1 = max(0, ox - max_distance), min(width, ox + max_distance + 1)
+    y0, y1 = max(0, oy - max_distance), min(height, oy + max_distance + 1)
+    passable = walkable[x0:x1, y0:y1]
+
+    distances = np.full(passable.shape, UNREACHABLE, dtype=np.int32)
+    reached = np.zeros(passable.shape, dtype=bool)
+    frontier = np.zeros(passable.shape, dtype=bool)
+
+    start = (ox - x0, oy - y0)
+    distances[start] = 0
+    reached[start] = True
+    frontier[start] = True
+
+    for distance in range(1, max_distance + 1):
+        # 3x3 팽창 (x축 → y축 순으로 분리 적용)
+        grown = frontier.copy()
+        grown[1:, :] |= frontier[:-1, :]
+        grown[:-1, :] |= frontier[1:, :]
+        spread = grown.copy()
+        spread[:, 1:] |= grown[:, :-1]
+        spread[:, :-1] |= grown[:, 1:]
+
+        frontier = spread & passable & ~reached
+        if not frontier.any():
+            break
+        distances[frontier] = distance
+        reached |= frontier
+
+    return FlowField(origin, distances, (x0, y0))
+
+
+# =============================================================================
+# A* 경로 탐색
+# =============================================================================
+
+DIAGONAL_COST = 1.4            # 대각선 이동 비용
+DEFAULT_MAX_EXPANSIONS = 4096  # 기본 최대 노드 확장 수
+
+
+class PathScratch:
+    """
+    A* 탐색용 재사용 배열
+
+    g 점수, 부모, 방문/닫힘 표시를 맵 크기의 평탄 numpy 배열로 한 번만 할당하고,
+    탐색마다 세대 번호를 올려 이전 탐색의 값을 무효로 만듭니다.
+    방문 표시가 현재 세대가 아닌 칸은 미방문으로 취급하므로 탐색 전 초기화가 없고,
+    배열은 처음 쓰는 페이지만 실제 메모리를 차지합니다.
+    원소 접근은 numpy 스칼라 대신 memoryview로 합니다.
+
+    Attributes:
+        shape: 대상 배열 크기 (width, height)
+        generation: 마지막 탐색의 세대 번호
+    """
+
+    def __init__(self, width: int, height: int):
+        self.shape = (width, height)
+        size = width * height
+        self._arrays = (
+            np.empty(size, dtype=np.float64),  # g 점수
+            np.empty(size, dtype=np.int64),    # 부모 칸
+            np.zeros(size, dtype=np.uint32),   # g 점수/부모가 유효한 세대
+            np.zeros(size, dtype=np.uint32),   # 닫힌 세대
+        )
+        self.g_score, self.came_from, self.seen, self.closed = (
+            memoryview(array) for array in self._arrays
+        )
+        self.generation = 0
+
+    def next_generation(self) -> int:
+        """새 탐색의 세대 번호 (한 바퀴 돌면 표시 배열을 비움)"""
+        self.generation += 1
+        if self.generation > np.iinfo(np.uint32).max:
+            self._arrays[2][:] = 0
+            self._arrays[3][:] = 0
+            self.generation = 1
+        return self.generation
+
+
+def find_path(
+    walkable: np.ndarray,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    cost: Optional[np.ndarray] = None,
+    max_expansions: int = DEFAULT_MAX_EXPANSIONS,
+    scratch: Optional[PathScratch] = None,
+) -> List[Tuple[int, int]]:
+    """
+    A* 경로 탐색 (평탄 인덱스 배열 기반)
+
+    g 점수, 부모, 닫힌 집합을 평탄 인덱스(x + y * width) 배열에 두고,
+    대각선 비용에 맞는 옥타일(octile) 휴리스틱을 사용합니다.
+    맵 전체를 복사하거나 초기화하지 않으므로 비용은 확장한 노드 수에 비례합니다.
+
+    Args:
+        walkable: (width, height) 이동 가능 배열
+        start: 시작 위치
+        goal: 목표 위치
+        cost: 타일 진입 비용 배수 배열 (1 이상, 0은 통과 불가). None이면 모두 1
+        max_expansions: 최대 노드 확장 수 (초과하면 경로 없음으로 처리)
+        scratch: 재사용할 탐색 배열 (없거나 크기가 다르면 새로 할당)
+
+    Returns:
+        경로 좌표 리스트 (시작점 제외, 목표 포함). 경로가 없으면 빈 리스트
+    """
+    width, height = walkable.shape
+    sx, sy = start
+    gx, gy = goal
+
+    if not (0 <= gx < width and 0 <= gy < height) or not walkable[gx, gy]:
+        return []
+    if start == goal:
+        return []
+
+    if scratch is None or scratch.shape != (width, height):
+        scratch = PathScratch(width, height)
+    generation = scratch.next_generation()
+    g_score = scratch.g_score
+    came_from = scratch.came_from
+    seen = scratch.seen
+    closed = scratch.closed
+    passable = walkable.item
+    costs = cost.item if cost is not None else None
+
+    start_index = sx + sy * width
+    goal_index = gx + gy * width
+    g_score[start_index] = 0.0
+    seen[start_index] = generation
+
+    extra = DIAGONAL_COST - 2.0
+    open_set = [(0.0, start_index)]
+    expansions = 0
+
+    while open_set:
+        _, current = heapq.heappop(open_set)
+
+        if current == goal_index:
+            # 경로 재구성
+            path = []
+            while current != start_index:
+                path.append((current % width, current // width))
+                current = came_from[current]
+            return path[::-1]
+
+        if closed[current] == generation:
+            continue
+        closed[current] = generation
+
+        expansions += 1
+        if expansions > max_expansions:
+            break
+
+        cx = current % width
+        cy = current // width
+        current_g = g_score[current]
+
+        for dx, dy in DIRECTIONS:
+            nx = cx + dx
+            ny = cy + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+
+            neighbor = nx + ny * width
+            if closed[neighbor] == generation or not passable(nx, ny):
+                continue
+
+            move_cost = DIAGONAL_COST if dx and dy else 1.0
+            if costs is not None:
+                tile_cost = costs(nx, ny)
+                if tile_cost <= 0:
+                    continue
+                move_cost *= tile_cost
+
+            tentative_g = current_g + move_cost
+            if seen[neighbor] != generation or tentative_g < g_score[neighbor]:
+                seen[neighbor] = generation
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+
+                # 옥타일 휴리스틱
+                hx = abs(nx - gx)
+                hy = abs(ny - gy)
+                h = hx + hy + extra * (hx if hx < hy else hy)
+                heapq.heappush(open_set, (tentative_g + h, neighbor))
+
+    return []  # 경로 없음 (또는 탐색 한도 초과)
@@ -0,0 +1,181 @@
+"""
+레벨 미리 생성기
+플레이어가 현재 층에 있는 동안 다음 층들을 프로세스 풀에서 생성
+
+작업 프로세스는 GameMap 대신 타일 번호 배열과 엔티티 명세로 이루어진
+가벼운 페이로드(LevelPayload)를 돌려주고, 메인 프로세스는 계단을 탈 때
+페이로드를 꺼내 GameMap으로 조립만 합니다.
+층 생성은 (월드 시드, 층)으로 결정되므로 미리 만든 층과 그 자리에서
+만든 층은 같습니다.
+"""
+from __future__ import annotations
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+
+from systems import tile_types
+from systems.game_map import GameMap
+
+if TYPE_CHECKING:
+    from components.entity import Actor
+    from systems.level_manager import LevelGenerator
+
+
+class LevelPayload(NamedTuple):
+    """
+    프로세스 간에 전달하는 층 데이터 (pickle 가능)
+
+    Attributes:
+        depth: 층
+        tile_ids: 타일 번호 배열 (tile_types.TILE_PALETTE 기준)
+        player_start: 플레이어 시작 위치
+        upstairs, downstairs: 계단 위치
+        actors: Actor 명세 목록 (플레이어 제외)
+        items: Item 명세 목록
+        rng_state: 맵 행동용 난수 생성기 상태
+    """
+    depth: int
+    tile_ids: np.ndarray
+    player_start: Tuple[int, int]
+    upstairs: Optional[Tuple[int, int]]
+    downstairs: Optional[Tuple[int, int]]
+    actors: List[Dict[str, Any]]
+    items: List[Dict[str, Any]]
+    rng_state: Dict[str, Any]
+
+
+def build_level_payload(generator: LevelGenerator, depth: int, seed: int) -> LevelPayload:
+    """
+    층을 생성해 페이로드로 변환 (작업 프로세스에서 실행)
+
+    Args:
+        generator: 층 생성 함수 (모듈 최상위 함수여야 pickle 가능)
+        depth: 층
+        seed: 월드 시드
+    """
+    from components.entity import Actor
+    from systems.level_manager import actor_to_spec, item_to_spec
+
+    placeholder = Actor(name="<player>")
+    game_map = generator(depth, placeholder, seed)
+
+    return LevelPayload(
+        depth=depth,
+        tile_ids=tile_types.encode_tiles(game_map.tiles),
+        player_start=(placeholder.x, placeholder.y),
+        upstairs=game_map.upstairs_location,
+        downstairs=game_map.downstairs_location,
+        actors=[
+            actor_to_spec(entity)
+            for entity in game_map.entities
+            if hasattr(entity, "fighter") and entity is not placeholder
+        ],
+        items=[item_to_spec(item) for item in game_map.items],
+        rng_state=game_map.rng.bit_generator.state,
+    )
+
+
+def map_from_payload(payload: LevelPayload, player: Actor) -> GameMap:
+    """
+    페이로드를 GameMap으로 조립하고 플레이어를 시작 위치에 배치
+
+    Args:
+        payload: 층 데이터
+        player: 플레이어 (맵에서 빠져 있어야 함)
+    """
+    from systems.level_manager import actor_from_spec, item_from_spec
+
+    width, height = payload.tile_ids.shape
+    game_map = GameMap(width, height)
+    game_map.tiles[...] = tile_types.decode_tiles(payload.tile_ids)
+    game_map.upstairs_location = payload.upstairs
+    game_map.downstairs_location = payload.downstairs
+    game_map.rng.bit_generator.state = payload.rng_state
+
+    for spec in payload.items:
+        game_map.add_item(item_from_spec(spec))
+    for spec in payload.actors:
+        game_map.add_entity(actor_from_spec(spec))
+
+    player.x, player.y = payload.player_start
+    game_map.add_entity(player)
+    return game_map
+
+
+class LevelPregenerator:
+    """
+    다음 층 미리 생성기
+
+    요청한 층을 ProcessPoolExecutor에서 생성하고 완성된 페이로드를
+    층 번호로 보관합니다. 프로세스 풀을 쓸 수 없는 환경에서는
+    아무것도 미리 만들지 않고, 호출한 쪽이 그 자리에서 생성하게 둡니다.
+
+    Attributes:
+        lookahead: 현재 층 다음으로 미리 만들 층 수
+    """
+
+    def __init__(
+        self,
+        generator: LevelGenerator,
+        seed: int,
+        lookahead: int = 2,
+        max_workers: int = 1,
+    ):
+        self.generator = generator
+        self.seed = seed
+        self.lookahead = lookahead
+        self.max_workers = max_workers
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._disabled = False
+        self._pending: Dict[int, Future] = {}
+
+    @property
+    def pending(self) -> List[int]:
+        """요청했지만 아직 꺼내지 않은 층 목록"""
+        return list(self._pending)
+
+    def request(self, depth: int) -> None:
+        """depth 층 생성을 백그라운드에 요청 (이미 요청했으면 무시)"""
+        if self._disabled or depth in self._pending:
+            return
+
+        try:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self._pending[depth] = self._executor.submit(
+                build_level_payload, self.generator, depth, self.seed
+            )
+        except (OSError, NotImplementedError, RuntimeError):
+            # 프로세스를 만들 수 없는 환경: 미리 생성 기능 끔
+            self._disabled = True
+
+    def take(self, depth: int) -> Optional[LevelPayload]:
+        """
+        depth 층 페이로드 꺼내기
+
+        요청하지 않은 층이거나 생성에 실패했으면 None을 돌려줍니다.
+        아직 생성 중이면 처음부터 다시 만드는 것보다 빠르므로 완료를 기다립니다.
+        """
+        future = self._pending.pop(depth, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def discard(self, depth: int) -> None:
+        """더 이상 필요 없는 층 요청 취소"""
+        future = self._pending.pop(depth, None)
+        if future is not None:
+            future.cancel()
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료"""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -3,10 +3,16 @@
 로그라이크의 핵심: 매번 다른 던전/맵 생성
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Tuple, Iterator
-import random
+from typing import TYPE_CHECKING, List, Optional, Tuple
+import heapq
+import numpy as np
 
 from systems.game_map import GameMap
+from systems.chunked_map import ChunkedGameMap, ChunkGenerator
+from systems import connectivity
+from systems import noise
+from systems import streams
+from systems.streams import randint
 from systems import tile_types
 
 if TYPE_CHECKING:
@@ -48,44 +54,119 @@ class RectangularRoom:
         )
 
 
-def tunnel_between(
-    start: Tuple[int, int], end: Tuple[int, int]
-) -> Iterator[Tuple[int, int]]:
+def _random_rooms(
+    map_width: int,
+    map_height: int,
+    max_rooms: int,
+    room_min_size: int,
+    room_max_size: int,
+    rng: np.random.Generator,
+) -> List[RectangularRoom]:
     """
-    두 점 사이에 L자형 터널 생성
+    무작위 방 배치 (겹치면 버림)
 
-    Args:
-        start: 시작점
-        end: 끝점
+    방이 차지한 칸(벽 포함)을 점유 마스크에 기록해 두고,
+    새 방 영역의 마스크만 확인하므로 기존 방 수와 관계없이 검사합니다.
+    """
+    occupied = np.zeros((map_width, map_height), dtype=bool, order="F")
+    rooms: List[RectangularRoom] = []
+
+    for _ in range(max_rooms):
+        # 랜덤 방 크기
+        room_width = randint(rng, room_min_size, room_max_size)
+        room_height = randint(rng, room_min_size, room_max_size)
+
+        # 랜덤 위치 (맵 경계 안에)
+        x = randint(rng, 0, map_width - room_width - 1)
+        y = randint(rng, 0, map_height - room_height - 1)
+
+        new_room = RectangularRoom(x, y, room_width, room_height)
+        area = (slice(new_room.x1, new_room.x2 + 1), slice(new_room.y1, new_room.y2 + 1))
+
+        # 다른 방과 겹치는지 확인
+        if occupied[area].any():
+            continue  # 겹치면 스킵
+
+        occupied[area] = True
+        rooms.append(new_room)
 
-    Yields:
-        터널을 구성하는 좌표들
+    return rooms
+
+
+def _bsp_rooms(
+    map_width: int,
+    map_height: int,
+    max_rooms: int,
+    room_min_size: int,
+    room_max_size: int,
+    rng: np.random.Generator,
+) -> List[RectangularRoom]:
     """
-    x1, y1 = start
-    x2, y2 = end
+    BSP(Binary Space Partitioning) 방 배치
+
+    가장 넓은 영역부터 둘로 나누어 영역 수가 max_rooms가 될 때까지 분할하고,
+    영역마다 방을 하나씩 넣습니다. 방은 서로 다른 영역 안에만 놓이므로
+    겹침 검사나 버려지는 시도가 없습니다.
 
-    # 50% 확률로 먼저 수평/수직 이동 결정
-    if random.random() < 0.5:
-        # 먼저 수평 이동, 그 다음 수직
-        corner_x, corner_y = x2, y1
-    else:
-        # 먼저 수직 이동, 그 다음 수평
-        corner_x, corner_y = x1, y2
+    Returns:
+        분할 트리 순서(이웃한 영역끼리 연속)로 정렬된 방 목록
+    """
+    min_leaf = room_min_size + 1  # 방 + 영역 경계 여백
 
-    # 시작점에서 코너까지
-    for x in range(min(x1, corner_x), max(x1, corner_x) + 1):
-        yield x, y1
+    # 힙 항목: (-넓이, 분할 경로, x, y, 너비, 높이)
+    heap = [(-map_width * map_height, "", 0, 0, map_width, map_height)]
+    leaves = []
 
-    # 코너에서 끝점까지
-    for y in range(min(y1, corner_y), max(y1, corner_y) + 1):
-        yield corner_x, y
+    while heap and len(heap) + len(leaves) < max_rooms:
+        _, path, x, y, width, height = heapq.heappop(heap)
 
-    # 코너에서 끝점까지 (나머지)
-    for x in range(min(corner_x, x2), max(corner_x, x2) + 1):
-        yield x, corner_y
+        can_split_x = width >= min_leaf * 2
+        can_split_y = height >= min_leaf * 2
+        if not (can_split_x or can_split_y):
+            leaves.append((path, x, y, width, height))
+            continue
+
+        # 긴 쪽을 자르고, 비슷하면 무작위
+        if can_split_x and can_split_y:
+            if width > height * 1.25:
+                split_x = True
+            elif height > width * 1.25:
+                split_x = False
+            else:
+                split_x = rng.random() < 0.5
+        else:
+            split_x = can_split_x
+
+        if split_x:
+            cut = randint(rng, min_leaf, width - min_leaf)
+            children = ((x, y, cut, height), (x + cut, y, width - cut, height))
+        else:
+            cut = randint(rng, min_leaf, height - min_leaf)
+            children = ((x, y, width, cut), (x, y + cut, width, height - cut))
+
+        for bit, (cx, cy, cw, ch) in zip("01", children):
+            heapq.heappush(heap, (-cw * ch, path + bit, cx, cy, cw, ch))
+
+    leaves.extend((path, x, y, width, height) for _, path, x, y, width, height in heap)
+    leaves.sort()
+
+    rooms: List[RectangularRoom] = []
+    for _, x, y, width, height in leaves:
+        # 영역 오른쪽/아래 한 칸은 비워 이웃 영역의 방과 벽을 공유하지 않음
+        room_width = randint(rng, room_min_size, min(room_max_size, width - 1))
+        room_height = randint(rng, room_min_size, min(room_max_size, height - 1))
+        room_x = randint(rng, x, x + width - room_width - 1)
+        room_y = randint(rng, y, y + height - room_height - 1)
+        rooms.append(RectangularRoom(room_x, room_y, room_width, room_height))
 
-    for y in range(min(corner_y, y2), max(corner_y, y2) + 1):
-        yield x2, y
+    return rooms
+
+
+# 던전 방 배치 알고리즘
+DUNGEON_ALGORITHMS = {
+    "rooms": _random_rooms,
+    "bsp": _bsp_rooms,
+}
 
 
 def generate_dungeon(
@@ -97,12 +178,16 @@ def generate_dungeon(
     player: Actor,
     max_monsters_per_room: int = 2,
     max_items_per_room: int = 2,
+    seed: Optional[int] = None,
+    depth: int = 1,
+    algorithm: str = "rooms",
 ) -> GameMap:
     """
     절차적 던전 생성
 
-    BSP(Binary Space Partitioning) 대신 간단한
-    랜덤 방 배치 알고리즘 사용 (초보자 친화적)
+    방 배치 알고리즘:
+        rooms: 무작위 방 배치 (겹치는 방은 버림, max_rooms는 시도 횟수)
+        bsp: BSP 분할 (겹침 없이 max_rooms개를 목표로 배치)
 
     Args:
         map_width, map_height: 맵 크기
@@ -111,50 +196,60 @@ def generate_dungeon(
         player: 플레이어 엔티티
         max_monsters_per_room: 방당 최대 몬스터 수
         max_items_per_room: 방당 최대 아이템 수
+        seed: 월드 시드 (None이면 무작위)
+        depth: 층 (같은 시드와 층이면 항상 같은 던전)
+        algorithm: 방 배치 알고리즘 ("rooms" 또는 "bsp")
 
     Returns:
         생성된 GameMap
     """
-    dungeon = GameMap(map_width, map_height)
-    rooms: List[RectangularRoom] = []
+    if algorithm not in DUNGEON_ALGORITHMS:
+        raise ValueError(f"알 수 없는 던전 생성 알고리즘: {algorithm}")
 
-    for _ in range(max_rooms):
-        # 랜덤 방 크기
-        room_width = random.randint(room_min_size, room_max_size)
-        room_height = random.randint(room_min_size, room_max_size)
+    if seed is None:
+        seed = streams.new_world_seed()
+    rngs = streams.level_streams(seed, depth)
+    layout = rngs["layout"]
 
-        # 랜덤 위치 (맵 경계 안에)
-        x = random.randint(0, map_width - room_width - 1)
-        y = random.randint(0, map_height - room_height - 1)
+    dungeon = GameMap(map_width, map_height)
+    dungeon.rng = rngs["ai"]
 
-        new_room = RectangularRoom(x, y, room_width, room_height)
-
-        # 다른 방과 겹치는지 확인
-        if any(new_room.intersects(other) for other in rooms):
-            continue  # 겹치면 스킵
+    rooms = DUNGEON_ALGORITHMS[algorithm](
+        map_width, map_height, max_rooms, room_min_size, room_max_size, layout
+    )
+    dungeon.rooms = rooms
 
+    for index, room in enumerate(rooms):
         # 방 파기 (벽을 바닥으로)
-        dungeon.tiles[new_room.inner] = tile_types.floor
+        dungeon.carve_rect(room.x1 + 1, room.y1 + 1, room.x2 - 1, room.y2 - 1)
 
-        if len(rooms) == 0:
+        if index == 0:
             # 첫 번째 방: 플레이어 배치
-            player.x, player.y = new_room.center
+            player.x, player.y = room.center
+            dungeon.upstairs_location = room.center
         else:
-            # 이전 방과 터널로 연결
-            for x, y in tunnel_between(rooms[-1].center, new_room.center):
-                dungeon.tiles[x, y] = tile_types.floor
+            # 이전 방과 L자 터널로 연결 (50% 확률로 가로 먼저)
+            dungeon.carve_tunnel(
+                rooms[index - 1].center, room.center, horizontal_first=layout.random() < 0.5
+            )
 
             # 몬스터와 아이템 배치
             place_entities(
-                new_room, dungeon, max_monsters_per_room, max_items_per_room
+                room, dungeon, max_monsters_per_room, max_items_per_room,
+                rngs["monsters"], rngs["items"],
             )
 
-        rooms.append(new_room)
-
     # 마지막 방에 계단 배치
     if rooms:
         stairs_x, stairs_y = rooms[-1].center
+
+        # 시작 방에서 계단까지 이어지지 않은 영역이 있으면 통로로 연결
+        connectivity.repair_connectivity(
+            dungeon, rooms[0].center, required=[(stairs_x, stairs_y)]
+        )
+
         dungeon.tiles[stairs_x, stairs_y] = tile_types.stairs_down
+        dungeon.downstairs_location = (stairs_x, stairs_y)
 
     # 플레이어 추가
     dungeon.add_entity(player)
@@ -162,11 +257,51 @@ def generate_dungeon(
     return dungeon
 
 
+def generate_dungeon_level(depth: int, player: Actor, seed: int) -> GameMap:
+    """
+    층별 던전 생성 (LevelManager의 층 생성 함수)
+
+    2층부터는 플레이어 시작 지점에 올라가는 계단을 둡니다.
+
+    Args:
+        depth: 층 (1부터 시작)
+        player: 플레이어 엔티티
+        seed: 월드 시드
+
+    Returns:
+        생성된 GameMap
+    """
+    from config import (
+        DUNGEON_ALGORITHM, MAP_WIDTH, MAP_HEIGHT, MAX_ROOMS, ROOM_MIN_SIZE, ROOM_MAX_SIZE,
+    )
+
+    dungeon = generate_dungeon(
+        map_width=MAP_WIDTH,
+        map_height=MAP_HEIGHT,
+        max_rooms=MAX_ROOMS,
+        room_min_size=ROOM_MIN_SIZE,
+        room_max_size=ROOM_MAX_SIZE,
+        player=player,
+        max_monsters_per_room=2,
+        max_items_per_room=2,
+        seed=seed,
+        depth=depth,
+        algorithm=DUNGEON_ALGORITHM,
+    )
+
+    if depth > 1 and dungeon.upstairs_location is not None:
+        dungeon.tiles[dungeon.upstairs_location] = tile_types.stairs_up
+
+    return dungeon
+
+
 def place_entities(
     room: RectangularRoom,
     dungeon: GameMap,
     max_monsters: int,
     max_items: int,
+    monster_rng: np.random.Generator,
+    item_rng: np.random.Generator,
 ) -> None:
     """
     방에 몬스터와 아이템 배치
@@ -176,6 +311,8 @@ def place_entities(
         dungeon: 게임 맵
         max_monsters: 최대 몬스터 수
         max_items: 최대 아이템 수
+        monster_rng: 몬스터 배치용 난수 생성기
+        item_rng: 아이템 배치용 난수 생성기
     """
     from components.entity import Actor, Item
     from components.fighter import Fighter
@@ -183,18 +320,19 @@ def place_entities(
     from config import Colors, Symbols
 
     # 몬스터 배치
-    num_monsters = random.randint(0, max_monsters)
+    num_monsters = randint(monster_rng, 0, max_monsters)
 
     for _ in range(num_monsters):
-        x = random.randint(room.x1 + 1, room.x2 - 1)
-        y = random.randint(room.y1 + 1, room.y2 - 1)
+        x = randint(monster_rng, room.x1 + 1, room.x2 - 1)
+        y = randint(monster_rng, room.y1 + 1, room.y2 - 1)
+        roll = monster_rng.random()
 
         # 해당 위치에 이미 엔티티가 있으면 스킵
-        if any(e.x == x and e.y == y for e in dungeon.entities):
+        if dungeon.get_entities_at(x, y):
             continue
 
         # 80% 고블린, 20% 오크
-        if random.random() < 0.8:
+        if roll < 0.8:
             monster = Actor(
                 x=x,
                 y=y,
@@ -218,54 +356,24 @@ def place_entities(
         dungeon.add_entity(monster)
 
     # 아이템 배치
-    num_items = random.randint(0, max_items)
+    num_items = randint(item_rng, 0, max_items)
 
     for _ in range(num_items):
-        x = random.randint(room.x1 + 1, room.x2 - 1)
-        y = random.randint(room.y1 + 1, room.y2 - 1)
+        x = randint(item_rng, room.x1 + 1, room.x2 - 1)
+        y = randint(item_rng, room.y1 + 1, room.y2 - 1)
+        roll = item_rng.random()
 
         # 해당 위치에 이미 아이템이 있으면 스킵
-        if any(i.x == x and i.y == y for i in dungeon.items):
+        if dungeon.get_items_at(x, y):
             continue
 
         # 랜덤 아이템
-        roll = random.random()
         if roll < 0.5:
-            # 음식
-            item = Item(
-                x=x,
-                y=y,
-                char=Symbols.FOOD,
-                color=(0, 200, 0),
-                name="마른 고기",
-                consumable=True,
-                nutrition=200,
-                hydration=0,
-            )
+            item = Item.from_prototype("dried_meat", x, y)  # 음식
         elif roll < 0.8:
-            # 물병
-            item = Item(
-                x=x,
-                y=y,
-                char='!',
-                color=(0, 150, 255),
-                name="물병",
-                consumable=True,
-                nutrition=0,
-                hydration=300,
-            )
+            item = Item.from_prototype("water_bottle", x, y)  # 물병
         else:
-            # 체력 물약
-            item = Item(
-                x=x,
-                y=y,
-                char=Symbols.POTION,
-                color=(255, 0, 0),
-                name="치료 물약",
-                consumable=True,
-                nutrition=0,
-                hydration=0,
-            )
+            item = Item.from_prototype("healing_potion", x, y)  # 체력 물약
 
         dungeon.add_item(item)
 
@@ -274,11 +382,78 @@ def place_entities(
 # 야외 맵 생성 (Unreal World 스타일)
 # =============================================================================
 
+# 노이즈 레이어: 이름 → (첫 옥타브 격자 간격, 옥타브 수, 시드 오프셋)
+_NOISE_LAYERS = {
+    "vegetation": (24.0, 4, 0),   # 식생 밀도 (숲, 덤불)
+    "moisture": (48.0, 3, 7919),  # 습도 (호수, 바위 지대)
+}
+
+# 바이옴별 지형 규칙: (기본 타일, [(노이즈 레이어, 최소값, 최대값, 타일), ...])
+# 뒤에 있는 규칙이 앞의 규칙을 덮어씀
+_BIOMES = {
+    "forest": (tile_types.grass, [
+        ("vegetation", 0.58, 0.63, tile_types.tall_grass),  # 숲 가장자리 덤불
+        ("vegetation", 0.63, 1.01, tile_types.tree),        # 숲 (약 15%)
+        ("moisture", -0.01, 0.25, tile_types.water_shallow),  # 호수 (약 3%)
+    ]),
+    "snow": (tile_types.snow, [
+        ("vegetation", 0.71, 1.01, tile_types.tree),
+        ("moisture", -0.01, 0.28, tile_types.rock),
+    ]),
+    "plains": (tile_types.grass, []),
+}
+
+# 시작 지점과 끊긴 야외 영역: 이 크기 이상이면 길을 내고, 작으면 나무로 메움
+WILDERNESS_MIN_JOIN_SIZE = 16
+
+
+def generate_terrain(
+    x0: int,
+    y0: int,
+    width: int,
+    height: int,
+    biome: str,
+    seed: int,
+) -> np.ndarray:
+    """
+    노이즈 기반 야외 지형 생성
+
+    레이어별 프랙탈 노이즈에 바이옴 임계값을 불리언 마스크로 적용해
+    타일 번호 배열을 만들고, 타일 팔레트를 팬시 인덱싱해 타일 배열로 바꿉니다.
+    노이즈는 맵 좌표 기준이므로 영역을 나누어 생성해도 경계가 이어집니다.
+
+    Args:
+        x0, y0: 영역의 맵 기준 좌상단 좌표
+        width, height: 영역 크기
+        biome: 바이옴 타입 (forest, plains, snow)
+        seed: 월드 시드
+
+    Returns:
+        (width, height) 타일 배열
+    """
+    base_tile, rules = _BIOMES.get(biome, _BIOMES["plains"])
+    palette = np.array([base_tile] + [tile for *_, tile in rules], dtype=tile_types.tile_dt)
+
+    tile_ids = np.zeros((width, height), dtype=np.uint8)
+    layers = {}
+    for index, (layer, low, high, _) in enumerate(rules, start=1):
+        if layer not in layers:
+            period, octaves, offset = _NOISE_LAYERS[layer]
+            layers[layer] = noise.fractal_noise(
+                x0, y0, width, height, seed + offset, period=period, octaves=octaves
+            )
+        values = layers[layer]
+        tile_ids[(values >= low) & (values < high)] = index
+
+    return np.asfortranarray(palette[tile_ids])
+
+
 def generate_wilderness(
     map_width: int,
     map_height: int,
     player: Actor,
     biome: str = "forest",
+    seed: Optional[int] = None,
 ) -> GameMap:
     """
     야외 맵 생성
@@ -287,66 +462,167 @@ def generate_wilderness(
         map_width, map_height: 맵 크기
         player: 플레이어 엔티티
         biome: 바이옴 타입 (forest, plains, snow)
+        seed: 월드 시드 (None이면 무작위)
 
     Returns:
         생성된 GameMap
     """
-    from components.entity import Actor, Item
-    from components.fighter import Fighter
-    from components.ai import PassiveAI
-    from config import Symbols
+    if seed is None:
+        seed = streams.new_world_seed()
+    rngs = streams.level_streams(seed, 0)
+    layout = rngs["layout"]
 
     world = GameMap(map_width, map_height)
-
-    # 기본 타일로 채우기
-    if biome == "forest":
-        base_tile = tile_types.grass
-    elif biome == "snow":
-        base_tile = tile_types.snow
-    else:
-        base_tile = tile_types.grass
-
-    world.tiles[:] = base_tile
-
-    # 노이즈 기반 지형 생성 (간단한 버전)
-    for x in range(map_width):
-        for y in range(map_height):
-            roll = random.random()
-
-            if biome == "forest":
-                if roll < 0.15:
-                    world.tiles[x, y] = tile_types.tree
-                elif roll < 0.20:
-                    world.tiles[x, y] = tile_types.tall_grass
-                elif roll < 0.22:
-                    world.tiles[x, y] = tile_types.water_shallow
-            elif biome == "snow":
-                if roll < 0.05:
-                    world.tiles[x, y] = tile_types.tree
-                elif roll < 0.08:
-                    world.tiles[x, y] = tile_types.rock
+    world.rng = rngs["ai"]
+    terrain_seed = int(rngs["terrain"].integers(2 ** 32))
+    world.tiles[:] = generate_terrain(0, 0, map_width, map_height, biome, terrain_seed)
 
     # 플레이어 시작 위치 찾기 (이동 가능한 곳)
     while True:
-        x = random.randint(5, map_width - 5)
-        y = random.randint(5, map_height - 5)
+        x = randint(layout, 5, map_width - 5)
+        y = randint(layout, 5, map_height - 5)
         if world.tiles["walkable"][x, y]:
             player.x, player.y = x, y
             break
 
+    # 나무/물에 막혀 갈 수 없는 곳이 없도록 연결 (동물 배치 전)
+    base_tile = _BIOMES.get(biome, _BIOMES["plains"])[0]
+    connectivity.repair_connectivity(
+        world,
+        (player.x, player.y),
+        min_join_size=WILDERNESS_MIN_JOIN_SIZE,
+        fill_tile=tile_types.tree,
+        path_tile=base_tile,
+    )
+
     world.add_entity(player)
 
+    place_wildlife(world, 1, 1, map_width - 2, map_height - 2, rngs["wildlife"])
+
+    return world
+
+
+def wilderness_chunk_generator(biome: str, seed: int) -> ChunkGenerator:
+    """
+    청크 단위 야외 지형 생성 함수 만들기
+
+    지형 노이즈는 (seed, 맵 좌표)로만 정해지므로 같은 청크는 언제,
+    어떤 순서로 생성해도 같은 지형이 되고 이웃 청크와 경계가 이어집니다.
+
+    Args:
+        biome: 바이옴 타입 (forest, plains, snow)
+        seed: 월드 시드
+
+    Returns:
+        ChunkedGameMap용 생성 함수
+    """
+    def generate(x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        return generate_terrain(x0, y0, width, height, biome, seed)
+
+    return generate
+
+
+def generate_chunked_wilderness(
+    map_width: int,
+    map_height: int,
+    player: Actor,
+    biome: str = "forest",
+    chunk_size: int = 64,
+    max_loaded_chunks: int = 36,
+    seed: Optional[int] = None,
+) -> ChunkedGameMap:
+    """
+    청크 기반 거대 야외 맵 생성
+
+    지형은 플레이어가 다가갈 때 청크 단위로 생성되고,
+    멀어진 청크는 디스크로 내보내져 메모리 사용량이 일정하게 유지됩니다.
+    동물과 자원은 시작 지점 주변 청크에만 배치합니다.
+
+    Args:
+        map_width, map_height: 월드 크기
+        player: 플레이어 엔티티
+        biome: 바이옴 타입 (forest, plains, snow)
+        chunk_size: 청크 한 변의 타일 수
+        max_loaded_chunks: 메모리에 유지할 최대 청크 수
+        seed: 월드 시드 (None이면 무작위)
+
+    Returns:
+        생성된 ChunkedGameMap
+    """
+    if seed is None:
+        seed = streams.new_world_seed()
+    rngs = streams.level_streams(seed, 0)
+    layout = rngs["layout"]
+
+    terrain_seed = int(rngs["terrain"].integers(2 ** 32))
+    world = ChunkedGameMap(
+        map_width,
+        map_height,
+        wilderness_chunk_generator(biome, terrain_seed),
+        chunk_size=chunk_size,
+        max_loaded_chunks=max_loaded_chunks,
+    )
+    world.rng = rngs["ai"]
+
+    # 월드 중앙 청크에서 시작 위치 찾기
+    x0 = (map_width // 2) // chunk_size * chunk_size
+    y0 = (map_height // 2) // chunk_size * chunk_size
+    x1 = min(map_width, x0 + chunk_size) - 1
+    y1 = min(map_height, y0 + chunk_size) - 1
+    while True:
+        x = randint(layout, x0, x1)
+        y = randint(layout, y0, y1)
+        if world.tiles["walkable"][x, y]:
+            player.x, player.y = x, y
+            break
+
+    world.add_entity(player)
+
+    # 시작 지점 주변 청크 범위에 동물/자원 배치
+    place_wildlife(
+        world,
+        max(1, x0 - chunk_size),
+        max(1, y0 - chunk_size),
+        min(map_width - 2, x1 + chunk_size),
+        min(map_height - 2, y1 + chunk_size),
+        rngs["wildlife"],
+    )
+
+    return world
+
+
+def place_wildlife(
+    world: GameMap,
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+    rng: np.random.Generator,
+) -> None:
+    """
+    야외 맵의 사각 영역에 동물과 자원 배치
+
+    Args:
+        world: 게임 맵
+        x1, y1, x2, y2: 배치 영역 (양 끝 포함)
+        rng: 배치용 난수 생성기
+    """
+    from components.entity import Actor, Item
+    from components.fighter import Fighter
+    from components.ai import PassiveAI
+    from config import Symbols
+
     # 동물 배치
-    num_animals = random.randint(3, 8)
+    num_animals = randint(rng, 3, 8)
     for _ in range(num_animals):
-        x = random.randint(1, map_width - 2)
-        y = random.randint(1, map_height - 2)
+        x = randint(rng, x1, x2)
+        y = randint(rng, y1, y2)
+        roll = rng.random()
 
         if not world.tiles["walkable"][x, y]:
             continue
 
         # 토끼, 사슴, 늑대 등
-        roll = random.random()
         if roll < 0.5:
             animal = Actor(
                 x=x,
@@ -382,37 +658,18 @@ def generate_wilderness(
         world.add_entity(animal)
 
     # 자원 배치 (베리, 약초 등)
-    num_resources = random.randint(5, 15)
+    num_resources = randint(rng, 5, 15)
     for _ in range(num_resources):
-        x = random.randint(1, map_width - 2)
-        y = random.randint(1, map_height - 2)
+        x = randint(rng, x1, x2)
+        y = randint(rng, y1, y2)
+        roll = rng.random()
 
         if not world.tiles["walkable"][x, y]:
             continue
 
-        if random.random() < 0.6:
-            item = Item(
-                x=x,
-                y=y,
-                char=Symbols.HERB,
-                color=(100, 200, 100),
-                name="야생 베리",
-                consumable=True,
-                nutrition=50,
-                hydration=30,
-            )
+        if roll < 0.6:
+            item = Item.from_prototype("wild_berry", x, y)
         else:
-            item = Item(
-                x=x,
-                y=y,
-                char=Symbols.HERB,
-                color=(0, 150, 0),
-                name="약초",
-                consumable=True,
-                nutrition=10,
-                hydration=0,
-            )
+            item = Item.from_prototype("herb", x, y)
 
         world.add_item(item)
-
-    return world
@@ -6,7 +6,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List, Optional, Dict, Callable
 from enum import Enum, auto
 from dataclasses import dataclass, field
-import random
+import numpy as np
+
+from systems import streams
 
 if TYPE_CHECKING:
     from components.entity import Actor
@@ -77,7 +79,7 @@ class Religion:
     플레이어의 신앙 상태 관리
     """
 
-    def __init__(self):
+    def __init__(self, *, rng: Optional[np.random.Generator] = None):
         self.deity: Optional[Deity] = None  # 섬기는 신
         self.faith_points: int = 0          # 신앙 포인트
         self.favor: int = 0                 # 은총 수치 (-100 ~ 100)
@@ -85,6 +87,12 @@ class Religion:
         self.sins: int = 0                  # 죄 (신이 싫어하는 행동)
         self.devotion_acts: int = 0         # 헌신 행위 (신이 좋아하는 행동)
 
+        # 기도 응답 판정용 난수 (보통 streams.player_streams의 "religion" 스트림,
+        # 없으면 기본 시드의 스트림)
+        self.rng = rng if rng is not None else (
+            streams.player_streams(streams.DEFAULT_SEED)["religion"]
+        )
+
         # 활성 축복/저주
         self.active_blessings: Dict[str, int] = {}  # 효과: 남은 턴
         self.active_curses: Dict[str, int] = {}
@@ -180,14 +188,14 @@ class Religion:
 
         elif level == FavorLevel.NEUTRAL:
             # 중립적인 신은 가끔 응답
-            if random.random() < 0.3:
+            if self.rng.random() < 0.3:
                 self._apply_minor_blessing()
                 return True, f"{self.deity.name}이(가) 작은 은총을 내린다."
             return False, f"{self.deity.name}은(는) 침묵한다."
 
         elif level == FavorLevel.PLEASED:
             # 기쁜 신은 자주 응답
-            if random.random() < 0.6:
+            if self.rng.random() < 0.6:
                 self._apply_minor_blessing()
                 return True, f"{self.deity.name}이(가) 은총을 내린다!"
             return True, f"{self.deity.name}이(가) 지켜보고 있음을 느낀다."
@@ -205,7 +213,7 @@ class Religion:
     def _apply_minor_blessing(self) -> None:
         """작은 축복 적용"""
         blessings = ["minor_heal", "minor_satiate", "minor_protection"]
-        blessing = random.choice(blessings)
+        blessing = blessings[int(self.rng.integers(len(blessings)))]
         self.active_blessings[blessing] = 100  # 100턴 지속
 
     def _apply_blessing(self) -> None:
@@ -3,198 +3,558 @@
 게임 화면 렌더링 담당
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 import numpy as np
-import tcod
 
 from systems import tile_types
+from systems.headless import HeadlessConsole
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, MAP_HEIGHT, Colors
 
 if TYPE_CHECKING:
+    import tcod
+    from systems.camera import Camera
     from systems.engine import Engine
     from systems.game_map import GameMap
 
 
+def _viewport(game_map: GameMap, camera: Optional[Camera]) -> Tuple[int, int, int, int]:
+    """그릴 맵 영역 (x, y, 너비, 높이), 카메라가 없으면 맵 전체"""
+    if camera is None:
+        return 0, 0, game_map.width, game_map.height
+    return camera.viewport(game_map.width, game_map.height)
+
+
 def render_map(
     console: tcod.console.Console,
     game_map: GameMap,
+    camera: Optional[Camera] = None,
 ) -> None:
     """
     맵 렌더링
 
+    카메라가 있으면 뷰포트 영역만 콘솔 좌상단에 그립니다.
+
     Args:
         console: tcod 콘솔
         game_map: 게임 맵
+        camera: 카메라 (없으면 맵 전체를 그림)
     """
+    x0, y0, width, height = _viewport(game_map, camera)
+    region = (slice(x0, x0 + width), slice(y0, y0 + height))
+    tiles = game_map.tiles[region]
+    visible = game_map.visible[region]
+    explored = game_map.explored[region]
+
     # 타일 렌더링
     # visible: 밝은 색, explored but not visible: 어두운 색, unexplored: SHROUD
     light = np.select(
-        condlist=[game_map.visible, game_map.explored],
-        choicelist=[game_map.tiles["fg_light"], game_map.tiles["fg_dark"]],
+        condlist=[visible[..., None], explored[..., None]],
+        choicelist=[tiles["fg_light"], tiles["fg_dark"]],
         default=tile_types.SHROUD["fg_light"],
     )
 
-    # 문자 렌더링
-    chars = np.select(
-        condlist=[game_map.visible, game_map.explored],
-        choicelist=[game_map.tiles["char"], game_map.tiles["char"]],
-        default=tile_types.SHROUD["char"],
-    )
+    # 문자 렌더링 (타일에 저장된 코드포인트를 그대로 사용)
+    glyphs = np.where(visible | explored, tiles["glyph"], tile_types.SHROUD["glyph"])
 
     # numpy 배열을 콘솔에 직접 그리기
-    console.rgb["ch"][:game_map.width, :game_map.height] = np.char.encode(chars, 'utf-8')[:, :, 0]
-    console.rgb["fg"][:game_map.width, :game_map.height] = light
+    console.rgb["ch"][:width, :height] = glyphs
+    console.rgb["fg"][:width, :height] = light
 
-    # 아이템 렌더링 (보이는 곳만)
-    for item in game_map.items:
-        if game_map.visible[item.x, item.y]:
-            console.print(
-                x=item.x,
-                y=item.y,
-                string=item.char,
-                fg=item.color,
-            )
+    # 아이템/엔티티 렌더링 (보이는 곳만, 한 번에 기록)
+    xs, ys, glyphs, colors = gather_overlay(game_map, visible, x0, y0)
+    console.rgb["ch"][xs, ys] = glyphs
+    console.rgb["fg"][xs, ys] = colors
 
-    # 엔티티 렌더링 (보이는 곳만)
-    for entity in sorted(game_map.entities, key=lambda e: e.blocks_movement):
-        if game_map.visible[entity.x, entity.y]:
-            console.print(
-                x=entity.x,
-                y=entity.y,
-                string=entity.char,
-                fg=entity.color,
+
+# 그리기 층 (값이 클수록 위에 그려짐, 같은 층은 맵에 추가된 순서)
+LAYER_ITEM = 0      # 바닥 아이템
+LAYER_ENTITY = 1    # 길을 막지 않는 엔티티
+LAYER_BLOCKING = 2  # 길을 막는 엔티티 (Actor)
+
+
+def gather_overlay(
+    game_map: GameMap,
+    visible: np.ndarray,
+    x0: int = 0,
+    y0: int = 0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    보이는 아이템/엔티티를 배열로 모아 칸마다 맨 위의 하나만 남김
+
+    영역 안의 객체를 공간 인덱스로 찾고, 위치와 층을 numpy 배열로 모아
+    visible로 거릅니다. 층 기준 안정 정렬 후 같은 칸에서는 마지막(가장 위)만
+    남기므로 결과를 콘솔에 한 번에 대입할 수 있습니다.
+    글자/색은 살아남은 것만 읽습니다.
+
+    Args:
+        game_map: 게임 맵
+        visible: 그릴 영역의 시야 배열
+        x0, y0: 그릴 영역의 맵 기준 좌상단 좌표
+
+    Returns:
+        (xs, ys, glyphs, colors) - 영역 기준 좌표, 코드포인트(int32), 색상 (n, 3)
+    """
+    width, height = visible.shape
+    items = game_map.get_items_in_rect(x0, y0, width, height)
+    objects = [*items, *game_map.get_entities_in_rect(x0, y0, width, height)]
+    count = len(objects)
+    if count == 0:
+        return (
+            np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp),
+            np.zeros(0, dtype=np.int32), np.zeros((0, 3), dtype=np.uint8),
+        )
+
+    xs = np.fromiter((obj.x for obj in objects), dtype=np.intp, count=count) - x0
+    ys = np.fromiter((obj.y for obj in objects), dtype=np.intp, count=count) - y0
+    layers = np.fromiter((obj.blocks_movement for obj in objects), dtype=np.int8, count=count)
+    layers[len(items):] += LAYER_ENTITY
+    layers[: len(items)] = LAYER_ITEM
+
+    shown = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    shown[shown] = visible[xs[shown], ys[shown]]
+    index = np.nonzero(shown)[0]
+
+    # 층 순서로 정렬한 뒤 같은 칸은 마지막 것만 남김
+    index = index[np.argsort(layers[index], kind="stable")][::-1]
+    _, first = np.unique(xs[index] + ys[index] * width, return_index=True)
+    index = index[first]
+
+    glyphs = np.fromiter((ord(objects[i].char) for i in index), dtype=np.int32, count=len(index))
+    colors = np.array([objects[i].color for i in index], dtype=np.uint8).reshape(-1, 3)
+    return xs[index], ys[index], glyphs, colors
+
+
+# 타일 밝기 단계 (MapRenderer가 칸별로 기억)
+_SHROUDED, _EXPLORED, _VISIBLE = 0, 1, 2
+
+
+class MapRenderer:
+    """
+    증분 맵 렌더러
+
+    이전 프레임에 그린 칸별 밝기 단계(미탐험/탐험/보임)와 엔티티/아이템
+    글자를 기억해 두고, 바뀐 칸만 콘솔에 다시 씁니다. 맵/시야/엔티티
+    리비전이 모두 그대로이고 직접 표시한 칸도 없으면 아무것도 하지 않으므로
+    입력이 없는 프레임이나 둘러보기 커서 이동은 비용이 거의 없습니다.
+
+    콘솔을 매 프레임 지우지 않는다는 전제로 동작합니다. 맵 위에 창을
+    그렸다가 닫을 때는 invalidate()나 mark_dirty()로 다시 그릴 영역을 알려야 합니다.
+
+    Attributes:
+        width, height: 콘솔에서 맵이 차지하는 영역 크기
+        cells_drawn: 마지막 프레임에 다시 그린 칸 수
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.cells_drawn = 0
+
+        self._game_map: Optional[GameMap] = None
+        self._key: Optional[tuple] = None
+        self._full = True
+        self._dirty = np.zeros((width, height), dtype=bool, order="F")
+        self._has_dirty = False
+
+        # 칸별로 마지막에 그린 밝기 단계 / 엔티티·아이템 글자(-1은 없음)와 색
+        self._level = np.full((width, height), -1, dtype=np.int8, order="F")
+        self._glyph = np.full((width, height), -1, dtype=np.int32, order="F")
+        self._color = np.zeros((width, height, 3), dtype=np.uint8, order="F")
+
+    def invalidate(self) -> None:
+        """다음 프레임에 맵 영역 전체를 다시 그리도록 표시"""
+        self._full = True
+
+    def mark_dirty(self, x: int, y: int, width: int = 1, height: int = 1) -> None:
+        """다음 프레임에 해당 영역을 다시 그리도록 표시 (커서, 작은 창 등)"""
+        x1, y1 = max(0, x), max(0, y)
+        x2, y2 = min(self.width, x + width), min(self.height, y + height)
+        if x1 < x2 and y1 < y2:
+            self._dirty[x1:x2, y1:y2] = True
+            self._has_dirty = True
+
+    def render(
+        self,
+        console: tcod.console.Console,
+        game_map: GameMap,
+        camera: Optional[Camera] = None,
+    ) -> None:
+        """
+        바뀐 칸만 다시 그리기
+
+        Args:
+            console: tcod 콘솔 (이전 프레임 내용이 남아 있어야 함)
+            game_map: 게임 맵
+            camera: 카메라 (없으면 맵 좌상단부터 그림)
+        """
+        if game_map is not self._game_map:
+            self._game_map = game_map
+            self._full = True
+
+        x0, y0, width, height = _viewport(game_map, camera)
+        width, height = min(self.width, width), min(self.height, height)
+
+        key = (
+            game_map.revision, game_map.fov_revision, game_map.entity_revision, x0, y0,
+        )
+        if key == self._key and not self._full and not self._has_dirty:
+            self.cells_drawn = 0
+            return
+
+        # 맵 리비전이 바뀌면 타일 모양이, 카메라가 움직이면 화면 전체가 바뀜
+        if self._key is None or key[0] != self._key[0] or key[3:] != self._key[3:]:
+            self._full = True
+        self._key = key
+
+        if self._full:
+            console.rgb[: self.width, : self.height] = (ord(" "), (255, 255, 255), (0, 0, 0))
+            self._level[...] = -1
+            self._glyph[...] = -1
+            self._full = False
+
+        region = (slice(x0, x0 + width), slice(y0, y0 + height))
+        visible = game_map.visible[region]
+        explored = game_map.explored[region]
+
+        level = np.where(visible, _VISIBLE, np.where(explored, _EXPLORED, _SHROUDED))
+        changed = (level != self._level[:width, :height]) | self._dirty[:width, :height]
+
+        # 엔티티/아이템 글자 배치 (보이는 곳만)
+        ox, oy, glyphs, colors = gather_overlay(game_map, visible, x0, y0)
+        glyph = np.full((width, height), -1, dtype=np.int32, order="F")
+        color = np.zeros((width, height, 3), dtype=np.uint8, order="F")
+        glyph[ox, oy] = glyphs
+        color[ox, oy] = colors
+
+        # 글자가 생기거나 사라지거나 바뀐 칸은 타일부터 다시 그림
+        changed |= glyph != self._glyph[:width, :height]
+        changed |= (glyph >= 0) & (color != self._color[:width, :height]).any(axis=2)
+        self._glyph[:width, :height] = glyph
+        self._color[:width, :height] = color
+
+        xs, ys = np.nonzero(changed)
+        if xs.size:
+            tiles = game_map.tiles[region][xs, ys]
+            cell_level = level[xs, ys]
+            shown = cell_level[:, None] != _SHROUDED
+            fg = np.where(
+                cell_level[:, None] == _VISIBLE,
+                tiles["fg_light"],
+                np.where(shown, tiles["fg_dark"], tile_types.SHROUD["fg_light"]),
             )
+            console.rgb["ch"][xs, ys] = np.where(
+                cell_level != _SHROUDED, tiles["glyph"], tile_types.SHROUD["glyph"]
+            )
+            console.rgb["fg"][xs, ys] = fg
+            self._level[:width, :height] = level
 
+        # 다시 그린 칸 위의 엔티티/아이템 (한 번에 기록)
+        redraw = changed[ox, oy]
+        console.rgb["ch"][ox[redraw], oy[redraw]] = glyphs[redraw]
+        console.rgb["fg"][ox[redraw], oy[redraw]] = colors[redraw]
 
-def render_ui(
+        self._dirty[...] = False
+        self._has_dirty = False
+        self.cells_drawn = int(xs.size)
+
+
+def render_frame(
     console: tcod.console.Console,
     engine: Engine,
+    map_renderer: Optional[MapRenderer] = None,
+    look: Optional[Tuple[int, int]] = None,
+    show_help: bool = False,
+    camera: Optional[Camera] = None,
+    status_panel: Optional[StatusPanel] = None,
 ) -> None:
     """
-    UI 렌더링 (하단 상태바)
+    한 프레임 전체 렌더링 (맵 → UI → 상태별 창 → 도움말)
+
+    tcod 콘솔이나 headless.HeadlessConsole 어느 쪽에든 그릴 수 있습니다.
+    카메라는 플레이어(둘러보기 중에는 커서)를 따라갑니다.
 
     Args:
-        console: tcod 콘솔
+        console: 콘솔
         engine: 게임 엔진
+        map_renderer: 증분 맵 렌더러 (없으면 콘솔을 지우고 맵 전체를 그림)
+        look: 둘러보기 커서 위치 (맵 좌표, LOOK 상태에서만 사용)
+        show_help: 도움말 창 표시 여부
+        camera: 카메라 (없으면 맵 좌상단부터 그림)
+        status_panel: 상태 패널 (없으면 UI를 전부 새로 그림)
     """
-    # UI 영역 배경
-    console.draw_rect(
-        x=0,
-        y=MAP_HEIGHT,
-        width=SCREEN_WIDTH,
-        height=SCREEN_HEIGHT - MAP_HEIGHT,
-        ch=ord(" "),
-        bg=Colors.UI_BG,
-    )
+    from systems.engine import GameState
 
-    # 구분선
-    console.print(
-        x=0,
-        y=MAP_HEIGHT,
-        string="─" * SCREEN_WIDTH,
-        fg=(100, 100, 100),
-    )
+    game_map = engine.game_map
+    looking = engine.game_state == GameState.LOOK and look is not None
+    if camera is not None and game_map:
+        target_x, target_y = look if looking else (engine.player.x, engine.player.y)
+        camera.follow(target_x, target_y, game_map.width, game_map.height)
+
+    if map_renderer is None:
+        console.clear()
+        if game_map:
+            render_map(console, game_map, camera)
+    elif game_map:
+        map_renderer.render(console, game_map, camera)
+
+    # UI 영역은 상태 패널 버퍼로 통째로 덮어씀
+    render_ui(console, engine, status_panel)
+
+    # 상태별 추가 렌더링
+    if engine.game_state == GameState.PLAYER_DEAD:
+        render_game_over(console)
+    elif engine.game_state == GameState.INVENTORY:
+        render_inventory(console, engine)
+    elif looking:
+        render_look_mode(console, engine, *look, camera=camera)
+        # 커서가 덮은 칸은 다음 프레임에 복원
+        if map_renderer is not None:
+            screen_x, screen_y = camera.to_screen(*look) if camera else look
+            map_renderer.mark_dirty(screen_x, screen_y)
+
+    if show_help:
+        render_help(console)
+
+
+# 아직 그린 적 없는 위젯의 표시 값
+_UNSET = object()
+
+
+class Widget:
+    """
+    상태 패널의 한 조각 (표시 값이 바뀔 때만 다시 그림)
 
-    player = engine.player
+    그린 결과는 자기 크기의 HeadlessConsole에 남겨 두고,
+    같은 값이 다시 오면 그리지 않고 그대로 재사용합니다.
 
-    # =========================================================================
-    # 1행: 체력바
-    # =========================================================================
-    y = MAP_HEIGHT + 1
+    Attributes:
+        x, y, width, height: 패널 안의 영역
+        draw: (버퍼, *표시 값) → None, 버퍼 좌상단 기준으로 그리는 함수
+        buffer: 마지막으로 그린 칸 배열
+        redraws: 다시 그린 횟수
+    """
 
-    if player.fighter:
-        hp_ratio = player.fighter.hp / player.fighter.max_hp
-        bar_width = 20
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        draw: Callable[..., None],
+    ):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.draw = draw
+        self.buffer = HeadlessConsole(width, height)
+        self.redraws = 0
+        self._values: Any = _UNSET
 
-        # HP 바 배경
-        console.draw_rect(
-            x=1, y=y, width=bar_width, height=1,
-            ch=ord(" "), bg=(50, 0, 0),
-        )
-        # HP 바 (현재)
-        console.draw_rect(
-            x=1, y=y, width=int(bar_width * hp_ratio), height=1,
-            ch=ord(" "), bg=Colors.HEALTH_BAR,
-        )
-        console.print(
-            x=1, y=y,
-            string=f"HP: {player.fighter.hp}/{player.fighter.max_hp}",
-            fg=Colors.WHITE,
-        )
+    def update(self, values: Optional[tuple]) -> bool:
+        """
+        표시 값이 바뀌었으면 버퍼를 다시 그림
 
-    # =========================================================================
-    # 2행: 생존 상태 (배고픔, 갈증)
-    # =========================================================================
-    y = MAP_HEIGHT + 2
+        Args:
+            values: draw에 넘길 표시 값 (None이면 배경만 남김)
 
-    if player.survival:
-        # 배고픔 바
-        hunger_ratio = player.survival.hunger / player.survival.max_hunger
-        console.print(
-            x=1, y=y,
-            string=f"포만: {int(player.survival.hunger_percent):3d}%",
-            fg=_get_status_color(hunger_ratio),
-        )
+        Returns:
+            다시 그렸는지 여부
+        """
+        if values == self._values:
+            return False
+        self._values = values
+        self.buffer.clear(bg=Colors.UI_BG)
+        if values is not None:
+            self.draw(self.buffer, *values)
+        self.redraws += 1
+        return True
 
-        # 갈증 바
-        thirst_ratio = player.survival.thirst / player.survival.max_thirst
-        console.print(
-            x=16, y=y,
-            string=f"수분: {int(player.survival.thirst_percent):3d}%",
-            fg=_get_status_color(thirst_ratio),
-        )
 
-        # 체온
-        temp_color = Colors.SAFE
-        if player.survival.body_temp < 35 or player.survival.body_temp > 39:
-            temp_color = Colors.DANGER
-        elif player.survival.body_temp < 36 or player.survival.body_temp > 38:
-            temp_color = Colors.WARNING
-        console.print(
-            x=31, y=y,
-            string=f"체온: {player.survival.body_temp:.1f}°C",
-            fg=temp_color,
-        )
+def _draw_separator(buffer: HeadlessConsole) -> None:
+    buffer.print(0, 0, "─" * buffer.width, fg=(100, 100, 100))
 
-    # =========================================================================
-    # 3행: 시간 및 상태
-    # =========================================================================
-    y = MAP_HEIGHT + 3
 
-    console.print(
-        x=1, y=y,
-        string=f"{engine.get_time_string()} ({engine.get_time_period()})",
-        fg=(200, 200, 100),
-    )
+def _draw_hp(buffer: HeadlessConsole, hp: int, max_hp: int) -> None:
+    bar_width = buffer.width
+    # HP 바 배경
+    buffer.draw_rect(0, 0, bar_width, 1, ord(" "), bg=(50, 0, 0))
+    # HP 바 (현재)
+    buffer.draw_rect(0, 0, int(bar_width * hp / max_hp), 1, ord(" "), bg=Colors.HEALTH_BAR)
+    buffer.print(0, 0, f"HP: {hp}/{max_hp}", fg=Colors.WHITE)
 
-    # 턴 카운터
-    console.print(
-        x=30, y=y,
-        string=f"Turn: {engine.turn_count}",
-        fg=(150, 150, 150),
-    )
 
-    # 위치
-    console.print(
-        x=50, y=y,
-        string=f"({player.x}, {player.y})",
-        fg=(150, 150, 150),
-    )
+def _draw_hunger(buffer: HeadlessConsole, percent: int, color: Tuple[int, int, int]) -> None:
+    buffer.print(0, 0, f"포만: {percent:3d}%", fg=color)
 
-    # =========================================================================
-    # 4-5행: 메시지 로그
-    # =========================================================================
-    y = MAP_HEIGHT + 4
 
-    for i, (msg, color) in enumerate(engine.message_log.get_recent(3)):
-        # 최신 메시지일수록 밝게
-        fade = 1.0 - (i * 0.2)
-        faded_color = tuple(int(c * fade) for c in color)
-        console.print(
-            x=1, y=y + (2 - i),  # 역순으로 출력 (최신이 아래)
-            string=msg[:SCREEN_WIDTH - 2],
-            fg=faded_color,
-        )
+def _draw_thirst(buffer: HeadlessConsole, percent: int, color: Tuple[int, int, int]) -> None:
+    buffer.print(0, 0, f"수분: {percent:3d}%", fg=color)
+
+
+def _draw_temp(buffer: HeadlessConsole, body_temp: float, color: Tuple[int, int, int]) -> None:
+    buffer.print(0, 0, f"체온: {body_temp:.1f}°C", fg=color)
+
+
+def _draw_time(buffer: HeadlessConsole, time_string: str, period: str) -> None:
+    buffer.print(0, 0, f"{time_string} ({period})", fg=(200, 200, 100))
+
+
+def _draw_turn(buffer: HeadlessConsole, turn: int) -> None:
+    buffer.print(0, 0, f"Turn: {turn}", fg=(150, 150, 150))
+
+
+def _draw_depth(buffer: HeadlessConsole, depth: int) -> None:
+    buffer.print(0, 0, f"{depth}층", fg=(150, 150, 150))
+
+
+def _draw_position(buffer: HeadlessConsole, x: int, y: int) -> None:
+    buffer.print(0, 0, f"({x}, {y})", fg=(150, 150, 150))
+
+
+def _draw_ai_stats(buffer: HeadlessConsole, processed: int, dormant: int) -> None:
+    buffer.print(0, 0, f"AI: {processed} 휴면: {dormant}", fg=(150, 150, 150))
+
+
+def _draw_message(buffer: HeadlessConsole, text: str, color: Tuple[int, int, int]) -> None:
+    buffer.print(0, 0, text, fg=color)
+
+
+def _temp_color(body_temp: float) -> Tuple[int, int, int]:
+    """체온에 따른 상태 색상"""
+    if body_temp < 35 or body_temp > 39:
+        return Colors.DANGER
+    if body_temp < 36 or body_temp > 38:
+        return Colors.WARNING
+    return Colors.SAFE
+
+
+class StatusPanel:
+    """
+    하단 상태바 (위젯 캐시)
+
+    각 위젯은 표시 값(HP, 포만/수분 퍼센트, 체온, 시간, 턴, 위치, 메시지 줄 등)이
+    바뀐 경우에만 문자열을 만들어 다시 그리고, 패널 버퍼의 자기 영역을 갱신합니다.
+    콘솔에는 매 프레임 패널 버퍼 전체를 한 번에 복사하므로
+    창이 UI 영역을 덮었다가 사라져도 다음 프레임에 복원됩니다.
+
+    Attributes:
+        x, y, width, height: 콘솔에서 패널 영역
+        widgets: 이름 → Widget
+        buffer: 위젯을 합친 패널 칸 배열
+    """
+
+    MESSAGE_LINES = 3
+
+    def __init__(
+        self,
+        x: int = 0,
+        y: int = MAP_HEIGHT,
+        width: int = SCREEN_WIDTH,
+        height: int = SCREEN_HEIGHT - MAP_HEIGHT,
+    ):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.buffer = HeadlessConsole(width, height)
+        self.buffer.clear(bg=Colors.UI_BG)
+
+        # 1행: 체력바, AI 통계 / 2행: 생존 상태 / 3행: 시간 및 상태 / 4-6행: 메시지 로그
+        self.widgets: Dict[str, Widget] = {
+            "separator": Widget(0, 0, width, 1, _draw_separator),
+            "hp": Widget(1, 1, 20, 1, _draw_hp),
+            "ai_stats": Widget(50, 1, width - 50, 1, _draw_ai_stats),
+            "hunger": Widget(1, 2, 15, 1, _draw_hunger),
+            "thirst": Widget(16, 2, 15, 1, _draw_thirst),
+            "temp": Widget(31, 2, width - 31, 1, _draw_temp),
+            "time": Widget(1, 3, 29, 1, _draw_time),
+            "turn": Widget(30, 3, 13, 1, _draw_turn),
+            "depth": Widget(43, 3, 7, 1, _draw_depth),
+            "position": Widget(50, 3, width - 50, 1, _draw_position),
+        }
+        for line in range(self.MESSAGE_LINES):
+            self.widgets[f"message{line}"] = Widget(1, 4 + line, width - 2, 1, _draw_message)
+
+    def _values(self, engine: Engine) -> Dict[str, Optional[tuple]]:
+        """위젯별 표시 값 (문자열을 만들지 않고 화면에 보일 값만 모음)"""
+        from config import SHOW_AI_STATS
+
+        player = engine.player
+        fighter = player.fighter
+        survival = player.survival
+
+        values: Dict[str, Optional[tuple]] = {
+            "separator": (),
+            "hp": (fighter.hp, fighter.max_hp) if fighter else None,
+            "ai_stats": (engine.processed_count, engine.dormant_count) if SHOW_AI_STATS else None,
+            "hunger": None,
+            "thirst": None,
+            "temp": None,
+            "time": (engine.get_time_string(), engine.get_time_period()),
+            "turn": (engine.turn_count,),
+            "depth": (engine.depth,),
+            "position": (player.x, player.y),
+        }
+        if survival:
+            values["hunger"] = (
+                int(survival.hunger_percent),
+                _get_status_color(survival.hunger / survival.max_hunger),
+            )
+            values["thirst"] = (
+                int(survival.thirst_percent),
+                _get_status_color(survival.thirst / survival.max_thirst),
+            )
+            values["temp"] = (round(survival.body_temp, 1), _temp_color(survival.body_temp))
+
+        # 최신 메시지일수록 밝게, 역순으로 출력 (최신이 아래)
+        recent = engine.message_log.get_recent(self.MESSAGE_LINES)
+        for line in range(self.MESSAGE_LINES):
+            i = self.MESSAGE_LINES - 1 - line
+            if i < len(recent):
+                msg, color = recent[i]
+                fade = 1.0 - (i * 0.2)
+                values[f"message{line}"] = (
+                    msg[:self.width - 2],
+                    tuple(int(c * fade) for c in color),
+                )
+            else:
+                values[f"message{line}"] = None
+        return values
+
+    def render(self, console: tcod.console.Console, engine: Engine) -> None:
+        """
+        바뀐 위젯만 다시 그리고 패널을 콘솔에 복사
+
+        Args:
+            console: tcod 콘솔
+            engine: 게임 엔진
+        """
+        for name, values in self._values(engine).items():
+            widget = self.widgets[name]
+            if widget.update(values):
+                self.buffer.rgb[
+                    widget.x:widget.x + widget.width, widget.y:widget.y + widget.height
+                ] = widget.buffer.rgb
+        console.rgb[self.x:self.x + self.width, self.y:self.y + self.height] = self.buffer.rgb
+
+
+def render_ui(
+    console: tcod.console.Console,
+    engine: Engine,
+    status_panel: Optional[StatusPanel] = None,
+) -> None:
+    """
+    UI 렌더링 (하단 상태바)
+
+    Args:
+        console: tcod 콘솔
+        engine: 게임 엔진
+        status_panel: 위젯 캐시를 유지하는 상태 패널 (없으면 새로 만들어 전부 그림)
+    """
+    if status_panel is None:
+        status_panel = StatusPanel()
+    status_panel.render(console, engine)
 
 
 def _get_status_color(ratio: float) -> tuple[int, int, int]:
@@ -297,6 +657,7 @@ def render_look_mode(
     engine: Engine,
     cursor_x: int,
     cursor_y: int,
+    camera: Optional[Camera] = None,
 ) -> None:
     """
     둘러보기 모드 렌더링
@@ -304,7 +665,8 @@ def render_look_mode(
     Args:
         console: tcod 콘솔
         engine: 게임 엔진
-        cursor_x, cursor_y: 커서 위치
+        cursor_x, cursor_y: 커서 위치 (맵 좌표)
+        camera: 카메라 (없으면 맵 좌표 = 화면 좌표)
     """
     game_map = engine.game_map
 
@@ -312,9 +674,10 @@ def render_look_mode(
         return
 
     # 커서 표시
+    screen_x, screen_y = camera.to_screen(cursor_x, cursor_y) if camera else (cursor_x, cursor_y)
     console.print(
-        x=cursor_x,
-        y=cursor_y,
+        x=screen_x,
+        y=screen_y,
         string="X",
         fg=(255, 255, 0),
     )
@@ -371,6 +734,7 @@ def render_help(console: tcod.console.Console) -> None:
         "x   : 둘러보기",
         "r   : 휴식",
         ".   : 대기",
+        "> < : 계단 내려가기/올라가기",
         "",
         "인벤토리에서:",
         "  a-z       : 아이템 사용",
@@ -22,7 +22,7 @@ class SaveManager:
     게임 상태를 JSON으로 직렬화/역직렬화
     """
 
-    SAVE_VERSION = "1.0"
+    SAVE_VERSION = "1.1"  # 1.1: 맵을 타일 번호 형식으로 저장
     SAVE_DIR = "saves"
 
     def __init__(self):
@@ -134,12 +134,22 @@ class SaveManager:
         """엔진 상태 직렬화"""
         return {
             "turn_count": engine.turn_count,
+            "time": engine.time,
+            "depth": engine.depth,
+            "seed": engine.levels.seed if engine.levels else None,
             "hour": engine.hour,
             "day": engine.day,
             "environment_temp": engine.environment_temp,
             "game_state": engine.game_state.name,
             "player": self._serialize_actor(engine.player),
-            "game_map": self._serialize_map(engine.game_map) if engine.game_map else None,
+            "game_map": (
+                self._serialize_map(engine.game_map, engine.player) if engine.game_map else None
+            ),
+            # 현재 층 외에 방문했던 층 (캐시/디스크)
+            "levels": {
+                str(depth): spec
+                for depth, spec in engine.levels.export_levels(exclude=engine.depth).items()
+            } if engine.levels else {},
             "message_log": [
                 {"text": msg, "color": list(color)}
                 for msg, color in engine.message_log.messages[-50:]  # 최근 50개만
@@ -155,6 +165,7 @@ class SaveManager:
             "color": list(actor.color),
             "name": actor.name,
             "gold": actor.gold,
+            "speed": actor.speed,
         }
 
         # Fighter 컴포넌트
@@ -186,6 +197,10 @@ class SaveManager:
                 "items": [self._serialize_item(item) for item in actor.inventory.items],
             }
 
+        # Equipment 컴포넌트
+        if actor.equipment:
+            data["equipment"] = actor.equipment.to_spec()
+
         # Quest Log
         if actor.quest_log:
             data["quest_log"] = self._serialize_quest_log(actor.quest_log)
@@ -209,33 +224,20 @@ class SaveManager:
             "hydration": item.hydration,
         }
 
-    def _serialize_map(self, game_map: GameMap) -> Dict[str, Any]:
-        """GameMap 직렬화"""
-        import numpy as np
-
-        # 타일을 간단한 형태로 저장 (walkable, transparent만)
-        tiles_data = []
-        for x in range(game_map.width):
-            col = []
-            for y in range(game_map.height):
-                tile = game_map.tiles[x, y]
-                col.append({
-                    "w": bool(tile["walkable"]),
-                    "t": bool(tile["transparent"]),
-                    "c": str(tile["char"]),
-                })
-            tiles_data.append(col)
+    def _serialize_map(self, game_map: GameMap, player: Actor) -> Dict[str, Any]:
+        """
+        GameMap 직렬화 (플레이어 제외)
+
+        LevelManager의 층 파일과 같은 타일 번호(tile_types.encode_tiles)
+        형식이라 바닥/벽 외의 지형도 그대로 보존됩니다.
+        """
+        from systems import tile_types
+        from systems.level_manager import level_meta
 
         return {
-            "width": game_map.width,
-            "height": game_map.height,
-            "tiles": tiles_data,
+            "tile_ids": tile_types.encode_tiles(game_map.tiles).tolist(),
             "explored": game_map.explored.tolist(),
-            "entities": [
-                self._serialize_actor(e) for e in game_map.entities
-                if hasattr(e, 'fighter')  # Actor만
-            ],
-            "items": [self._serialize_item(i) for i in game_map.items],
+            **level_meta(game_map, exclude=player),
         }
 
     def _serialize_quest_log(self, quest_log) -> Dict[str, Any]:
@@ -273,6 +275,7 @@ class SaveManager:
             "devotion_acts": religion.devotion_acts,
             "active_blessings": dict(religion.active_blessings),
             "active_curses": dict(religion.active_curses),
+            "rng_state": religion.rng.bit_generator.state,
         }
 
 
@@ -290,13 +293,22 @@ def reconstruct_engine(save_data: Dict[str, Any]) -> "Engine":
     from components.fighter import Fighter
     from components.survival import Survival
     from components.inventory import Inventory
+    from components.equipment import Equipment
     from systems.engine import Engine, GameState
-    from systems.game_map import GameMap
+    from systems.level_manager import create_dungeon_levels, level_from_spec
     from systems.quest import QuestLog, Quest, QuestObjective, QuestType, QuestStatus
     from systems.religion import Religion, create_deities
-    from systems import tile_types
+    from systems import streams
     import numpy as np
 
+    # 층 관리자 (방문했던 층은 디스크로 복원, 방문하지 않은 층은 새로 생성됨)
+    depth = save_data.get("depth", 1)
+    levels = create_dungeon_levels(save_data.get("seed"))
+    levels.import_levels({
+        int(level_depth): spec
+        for level_depth, spec in save_data.get("levels", {}).items()
+    })
+
     # 플레이어 재구성
     player_data = save_data["player"]
     player = Actor(
@@ -306,6 +318,7 @@ def reconstruct_engine(save_data: Dict[str, Any]) -> "Engine":
         color=tuple(player_data["color"]),
         name=player_data["name"],
         gold=player_data.get("gold", 0),
+        speed=player_data.get("speed", 100),
     )
 
     # Fighter 컴포넌트
@@ -348,63 +361,32 @@ def reconstruct_engine(save_data: Dict[str, Any]) -> "Engine":
             )
             player.inventory.add(item)
 
-    # 맵 재구성
+    # Equipment 컴포넌트
+    if "equipment" in player_data:
+        player.equipment = Equipment.from_spec(player_data["equipment"])
+        player.equipment.entity = player
+
+    # 맵 재구성 (층 파일과 같은 형식)
     map_data = save_data.get("game_map")
     game_map = None
 
     if map_data:
-        game_map = GameMap(map_data["width"], map_data["height"])
-
-        # 타일 복원
-        for x, col in enumerate(map_data["tiles"]):
-            for y, tile_data in enumerate(col):
-                if tile_data["w"]:  # walkable
-                    game_map.tiles[x, y] = tile_types.floor
-                else:
-                    game_map.tiles[x, y] = tile_types.wall
-
-        # 탐험 상태 복원
-        game_map.explored = np.array(map_data["explored"], dtype=bool)
-
-        # 아이템 복원
-        for item_data in map_data.get("items", []):
-            item = Item(
-                x=item_data["x"],
-                y=item_data["y"],
-                char=item_data["char"],
-                color=tuple(item_data["color"]),
-                name=item_data["name"],
-                consumable=item_data["consumable"],
-                nutrition=item_data["nutrition"],
-                hydration=item_data["hydration"],
-            )
-            game_map.add_item(item)
-
-        # 몬스터 복원 (플레이어 제외)
-        from components.ai import HostileAI
-        for entity_data in map_data.get("entities", []):
-            if entity_data["name"] != player.name:
-                monster = Actor(
-                    x=entity_data["x"],
-                    y=entity_data["y"],
-                    char=entity_data["char"],
-                    color=tuple(entity_data["color"]),
-                    name=entity_data["name"],
-                    ai=HostileAI(),
-                )
-                if "fighter" in entity_data:
-                    f = entity_data["fighter"]
-                    monster.fighter = Fighter(hp=f["max_hp"], defense=f["defense"], power=f["power"])
-                    monster.fighter.hp = f["hp"]
-                    monster.fighter.entity = monster
-                game_map.add_entity(monster)
+        game_map = level_from_spec(
+            np.asarray(map_data["tile_ids"], dtype=np.uint8),
+            np.asarray(map_data["explored"], dtype=bool),
+            map_data,
+        )
 
         # 플레이어 추가
         game_map.add_entity(player)
 
+    if game_map:
+        levels.add_level(depth, game_map)
+
     # 엔진 생성
-    engine = Engine(player=player, game_map=game_map)
+    engine = Engine(player=player, game_map=game_map, levels=levels)
     engine.turn_count = save_data["turn_count"]
+    engine.time = save_data.get("time", 0)
     engine.hour = save_data["hour"]
     engine.day = save_data["day"]
     engine.environment_temp = save_data["environment_temp"]
@@ -422,7 +404,9 @@ def reconstruct_engine(save_data: Dict[str, Any]) -> "Engine":
     # 종교 복원
     if "religion" in player_data:
         rel_data = player_data["religion"]
-        player.religion = Religion()
+        player.religion = Religion(rng=streams.player_streams(levels.seed)["religion"])
+        if rel_data.get("rng_state"):
+            player.religion.rng.bit_generator.state = rel_data["rng_state"]
         if rel_data["deity_id"]:
             deities = create_deities()
             if rel_data["deity_id"] in deities:
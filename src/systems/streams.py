@@ -0,0 +1,83 @@
+"""
+난수 스트림
+하나의 월드 시드에서 층별, 용도별로 독립된 난수 생성기를 파생
+
+층 N의 스트림은 SeedSequence(시드, spawn_key=(N,))에서 spawn하므로
+다른 층을 몇 개, 어떤 순서로 만들었는지와 관계없이 항상 같습니다.
+용도별 스트림이 나뉘어 있어 예를 들어 아이템 배치 규칙을 바꿔도
+방 배치나 몬스터 배치는 달라지지 않습니다.
+플레이어에게 속한 스트림(종교, 장비)은 층과 관계없는 별도 spawn_key에서
+파생하므로 어느 층에서 저장했는지에 따라 달라지지 않습니다.
+"""
+from __future__ import annotations
+from typing import Dict
+import numpy as np
+
+# 용도별 스트림 이름 (순서를 바꾸면 기존 시드의 결과가 달라짐)
+PURPOSES = (
+    "layout",    # 방/통로 배치
+    "monsters",  # 몬스터 배치
+    "items",     # 아이템 배치
+    "terrain",   # 야외 지형 노이즈 시드
+    "wildlife",  # 야외 동물/자원 배치
+    "ai",        # 몬스터 행동 (배회 등)
+)
+
+# 플레이어 스트림 이름 (층 스트림과 마찬가지로 순서를 바꾸면 결과가 달라짐)
+PLAYER_PURPOSES = (
+    "religion",   # 기도 응답 판정
+    "equipment",  # 무기 생성/명중 판정
+)
+
+# 플레이어 스트림의 spawn_key (층 번호로 쓰이지 않는 값)
+PLAYER_SPAWN_KEY = 2 ** 32 - 1
+
+# 스트림을 넘기지 않은 호출이 쓰는 기본 시드 (재현 가능하도록 고정)
+DEFAULT_SEED = 0
+
+
+def new_world_seed() -> int:
+    """새 월드 시드 (OS 엔트로피 기반, 32비트)"""
+    return int(np.random.SeedSequence().generate_state(1)[0])
+
+
+def level_streams(seed: int, depth: int) -> Dict[str, np.random.Generator]:
+    """
+    층의 용도별 난수 생성기
+
+    Args:
+        seed: 월드 시드
+        depth: 층 (야외 맵은 0)
+
+    Returns:
+        용도 이름 → numpy Generator
+    """
+    children = np.random.SeedSequence(seed, spawn_key=(depth,)).spawn(len(PURPOSES))
+    return {
+        purpose: np.random.default_rng(child)
+        for purpose, child in zip(PURPOSES, children)
+    }
+
+
+def player_streams(seed: int) -> Dict[str, np.random.Generator]:
+    """
+    플레이어의 용도별 난수 생성기 (층과 독립)
+
+    Args:
+        seed: 월드 시드
+
+    Returns:
+        용도 이름 → numpy Generator
+    """
+    children = np.random.SeedSequence(seed, spawn_key=(PLAYER_SPAWN_KEY,)).spawn(
+        len(PLAYER_PURPOSES)
+    )
+    return {
+        purpose: np.random.default_rng(child)
+        for purpose, child in zip(PLAYER_PURPOSES, children)
+    }
+
+
+def randint(rng: np.random.Generator, low: int, high: int) -> int:
+    """low 이상 high 이하의 정수 (random.randint와 같은 범위)"""
+    return int(rng.integers(low, high + 1))
@@ -6,11 +6,12 @@ from typing import Tuple
 import numpy as np
 
 # 타일 데이터 타입 정의
-# (walkable, transparent, char, fg_color_light, fg_color_dark, bg_color_light, bg_color_dark)
+# (walkable, transparent, char, glyph, fg_color_light, fg_color_dark, bg_color_light, bg_color_dark)
 tile_dt = np.dtype([
     ("walkable", bool),        # 이동 가능 여부
     ("transparent", bool),     # 시야 통과 여부
     ("char", "U1"),           # 표시 문자 (1 유니코드 문자)
+    ("glyph", np.int32),      # 표시 문자 코드포인트 (렌더러가 콘솔에 그대로 복사)
     ("fg_light", "3B"),       # 밝은 곳 전경색 (RGB)
     ("fg_dark", "3B"),        # 어두운 곳 전경색 (RGB)
     ("bg_light", "3B"),       # 밝은 곳 배경색 (RGB)
@@ -27,9 +28,9 @@ def new_tile(
     bg_light: Tuple[int, int, int] = (0, 0, 0),
     bg_dark: Tuple[int, int, int] = (0, 0, 0),
 ) -> np.ndarray:
-    """새로운 타일 생성 헬퍼 함수"""
+    """새로운 타일 생성 헬퍼 함수 (glyph는 char에서 계산)"""
     return np.array(
-        (walkable, transparent, char, fg_light, fg_dark, bg_light, bg_dark),
+        (walkable, transparent, char, ord(char), fg_light, fg_dark, bg_light, bg_dark),
         dtype=tile_dt,
     )
 
@@ -39,9 +40,12 @@ def new_tile(
 # =============================================================================
 
 # SHROUD: 아직 탐험하지 않은 영역 (완전히 검은색)
-SHROUD = np.array(
-    (False, False, " ", (255, 255, 255), (255, 255, 255), (0, 0, 0), (0, 0, 0)),
-    dtype=tile_dt,
+SHROUD = new_tile(
+    walkable=False,
+    transparent=False,
+    char=" ",
+    fg_light=(255, 255, 255),
+    fg_dark=(255, 255, 255),
 )
 
 # 던전 타일
@@ -196,3 +200,40 @@ road = new_tile(
     fg_light=(139, 119, 101),
     fg_dark=(69, 59, 50),
 )
+
+# =============================================================================
+# 타일 번호 (프로세스 간 전달/압축 저장용)
+# =============================================================================
+
+# 번호 → 타일 (새 타일은 끝에 추가해야 기존 번호가 유지됨)
+TILE_PALETTE = np.array(
+    [
+        floor, wall, door_closed, door_open, stairs_down, stairs_up,
+        grass, tall_grass, tree, water_shallow, water_deep, rock, sand, snow,
+        campfire, trap, road,
+    ],
+    dtype=tile_dt,
+)
+
+
+def encode_tiles(tiles: np.ndarray) -> np.ndarray:
+    """
+    타일 배열을 타일 번호(uint8) 배열로 변환
+
+    Raises:
+        ValueError: TILE_PALETTE에 없는 타일이 있을 때
+    """
+    ids = np.zeros(tiles.shape, dtype=np.uint8, order="F")
+    known = np.zeros(tiles.shape, dtype=bool, order="F")
+    for index, tile in enumerate(TILE_PALETTE):
+        mask = tiles == tile
+        ids[mask] = index
+        known |= mask
+    if not known.all():
+        raise ValueError("TILE_PALETTE에 없는 타일이 있습니다")
+    return ids
+
+
+def decode_tiles(ids: np.ndarray) -> np.ndarray:
+    """타일 번호 배열을 타일 배열로 변환"""
+    return np.asfortranarray(TILE_PALETTE[ids])
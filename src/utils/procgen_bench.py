@@ -0,0 +1,223 @@
+"""
+절차적 생성 벤치마크/품질 측정 도구
+창(tcod) 없이 생성기를 여러 시드와 맵 크기로 실행하고 결과를 JSON/CSV로 저장
+
+실행 방법 (src 디렉터리에서):
+    python -m utils.procgen_bench
+    python -m utils.procgen_bench --seeds 20 --sizes 80x43 200x200 --format csv -o report.csv
+    python -m utils.procgen_bench --generators dungeon-bsp wilderness-forest
+
+측정 항목:
+    seconds: 생성 시간 (벽시계)
+    peak_kb: 생성 중 최대 메모리 사용량 (tracemalloc 기준)
+    rooms: 방 개수 (던전만)
+    walkable_ratio: 이동 가능한 칸 비율
+    regions: 이동 가능한 연결 영역 수
+    reachable_ratio: 이동 가능한 칸 중 시작 지점에서 갈 수 있는 비율
+    actors, items: 배치된 Actor(플레이어 제외)/아이템 수
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# 모듈 경로 설정 (src 밖에서 실행해도 동작하도록)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.entity import Actor
+from systems import procgen
+from systems.connectivity import label_regions
+from systems.game_map import GameMap
+
+# 던전 방 개수/크기 설정 (맵 넓이 1000칸당 방 시도 횟수)
+ROOMS_PER_1000_TILES = 9
+ROOM_MIN_SIZE = 6
+ROOM_MAX_SIZE = 10
+
+FIELDS = (
+    "generator", "width", "height", "seed", "seconds", "peak_kb", "rooms",
+    "walkable_ratio", "regions", "reachable_ratio", "actors", "items",
+)
+
+
+# =============================================================================
+# 생성기 목록
+# =============================================================================
+
+def _dungeon(algorithm: str) -> Callable[[int, int, Actor, int], GameMap]:
+    """던전 생성기 함수"""
+    def generate(width: int, height: int, player: Actor, seed: int) -> GameMap:
+        max_rooms = max(1, width * height * ROOMS_PER_1000_TILES // 1000)
+        return procgen.generate_dungeon(
+            width, height, max_rooms, ROOM_MIN_SIZE, ROOM_MAX_SIZE, player,
+            seed=seed, algorithm=algorithm,
+        )
+
+    return generate
+
+
+def _wilderness(biome: str) -> Callable[[int, int, Actor, int], GameMap]:
+    """야외 맵 생성기 함수"""
+    def generate(width: int, height: int, player: Actor, seed: int) -> GameMap:
+        return procgen.generate_wilderness(width, height, player, biome, seed=seed)
+
+    return generate
+
+
+GENERATORS: Dict[str, Callable[[int, int, Actor, int], GameMap]] = {
+    "dungeon-rooms": _dungeon("rooms"),
+    "dungeon-bsp": _dungeon("bsp"),
+    "wilderness-forest": _wilderness("forest"),
+    "wilderness-snow": _wilderness("snow"),
+    "wilderness-plains": _wilderness("plains"),
+}
+
+
+# =============================================================================
+# 측정
+# =============================================================================
+
+def measure(name: str, width: int, height: int, seed: int) -> Dict[str, Any]:
+    """
+    생성기 측정 결과 레코드 반환
+
+    tracemalloc은 할당마다 비용이 들어 시간을 부풀리므로
+    시간과 메모리는 같은 시드로 따로 실행해 측정합니다.
+    """
+    generator = GENERATORS[name]
+
+    tracemalloc.start()
+    generator(width, height, Actor(name="<player>"), seed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    player = Actor(name="<player>")
+    started = time.perf_counter()
+    game_map = generator(width, height, player, seed)
+    seconds = time.perf_counter() - started
+
+    walkable = game_map.tiles["walkable"]
+    labels, sizes = label_regions(walkable)
+    total = int(sizes.sum())
+    start_region = labels[player.x, player.y]
+    reachable = int(sizes[start_region]) if start_region >= 0 else 0
+
+    return {
+        "generator": name,
+        "width": width,
+        "height": height,
+        "seed": seed,
+        "seconds": round(seconds, 6),
+        "peak_kb": peak // 1024,
+        "rooms": len(game_map.rooms),
+        "walkable_ratio": round(total / walkable.size, 4),
+        "regions": len(sizes),
+        "reachable_ratio": round(reachable / total, 4) if total else 0.0,
+        "actors": sum(1 for entity in game_map.entities if entity is not player),
+        "items": len(game_map.items),
+    }
+
+
+def summarize(records: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """(생성기, 크기)별 평균/최소/최대 요약"""
+    groups: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = {}
+    for record in records:
+        key = (record["generator"], record["width"], record["height"])
+        groups.setdefault(key, []).append(record)
+
+    summary = []
+    for (name, width, height), group in groups.items():
+        times = [record["seconds"] for record in group]
+        row: Dict[str, Any] = {
+            "generator": name,
+            "width": width,
+            "height": height,
+            "runs": len(group),
+            "seconds_mean": round(sum(times) / len(times), 6),
+            "seconds_min": min(times),
+            "seconds_max": max(times),
+            "peak_kb_max": max(record["peak_kb"] for record in group),
+            "fully_connected": sum(1 for record in group if record["reachable_ratio"] == 1.0),
+        }
+        for field in ("rooms", "walkable_ratio", "regions", "reachable_ratio", "actors", "items"):
+            row[f"{field}_mean"] = round(sum(record[field] for record in group) / len(group), 4)
+        summary.append(row)
+    return summary
+
+
+def run(
+    generators: Sequence[str],
+    sizes: Sequence[Tuple[int, int]],
+    seeds: Sequence[int],
+) -> List[Dict[str, Any]]:
+    """모든 (생성기, 크기, 시드) 조합 측정"""
+    # 첫 실행은 지연 import 시간이 섞이므로 생성기마다 한 번 버림
+    for name in generators:
+        measure(name, 20, 20, 0)
+
+    return [
+        measure(name, width, height, seed)
+        for name in generators
+        for width, height in sizes
+        for seed in seeds
+    ]
+
+
+# =============================================================================
+# 명령줄
+# =============================================================================
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    """'80x43' → (80, 43)"""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"맵 크기는 WIDTHxHEIGHT 형식이어야 합니다: {text}")
+    return width, height
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="절차적 생성 벤치마크/품질 측정")
+    parser.add_argument(
+        "--generators", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS),
+        help="측정할 생성기 (기본: 전부)",
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=_parse_size, default=[(80, 43), (200, 200)],
+        help="맵 크기 목록 (예: 80x43 200x200)",
+    )
+    parser.add_argument("--seeds", type=int, default=5, help="생성기/크기별 시드 수")
+    parser.add_argument("--first-seed", type=int, default=0, help="첫 시드 값")
+    parser.add_argument("--format", choices=("json", "csv"), default="json", help="출력 형식")
+    parser.add_argument("-o", "--output", help="출력 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    records = run(args.generators, args.sizes, seeds)
+
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(
+                {"records": records, "summary": summarize(records)},
+                out, ensure_ascii=False, indent=2,
+            )
+            out.write("\n")
+        else:
+            writer = csv.DictWriter(out, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""
+테스트 공통 설정
+게임 모듈은 src 디렉터리 기준으로 import하므로 경로에 추가
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
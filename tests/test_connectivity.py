@@ -0,0 +1,130 @@
+"""
+연결성 분석/수리 테스트
+"""
+import numpy as np
+import pytest
+
+from systems import connectivity
+from systems import procgen
+from systems import tile_types
+from components.entity import Actor
+from systems.game_map import GameMap
+
+
+def _flood_fill_count(walkable, diagonal):
+    """비교용 단순 BFS 영역 수"""
+    width, height = walkable.shape
+    seen = np.zeros_like(walkable)
+    steps = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx or dy)]
+    if not diagonal:
+        steps = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    count = 0
+    for x in range(width):
+        for y in range(height):
+            if not walkable[x, y] or seen[x, y]:
+                continue
+            count += 1
+            stack = [(x, y)]
+            seen[x, y] = True
+            while stack:
+                cx, cy = stack.pop()
+                for dx, dy in steps:
+                    nx, ny = cx + dx, cy + dy
+                    if 0 <= nx < width and 0 <= ny < height and walkable[nx, ny] and not seen[nx, ny]:
+                        seen[nx, ny] = True
+                        stack.append((nx, ny))
+    return count
+
+
+def _map_from(walkable):
+    game_map = GameMap(*walkable.shape)
+    game_map.tiles[...] = np.where(walkable, tile_types.floor, tile_types.wall)
+    return game_map
+
+
+def test_label_regions_empty():
+    labels, sizes = connectivity.label_regions(np.zeros((4, 3), dtype=bool))
+    assert (labels == -1).all()
+    assert len(sizes) == 0
+
+
+def test_label_regions_diagonal():
+    walkable = np.zeros((3, 3), dtype=bool)
+    walkable[0, 0] = walkable[1, 1] = True
+    _, sizes = connectivity.label_regions(walkable, diagonal=True)
+    assert list(sizes) == [2]
+    _, sizes = connectivity.label_regions(walkable, diagonal=False)
+    assert sorted(sizes) == [1, 1]
+
+
+@pytest.mark.parametrize("diagonal", [True, False])
+def test_label_regions_matches_flood_fill(diagonal):
+    rng = np.random.default_rng(11)
+    for _ in range(10):
+        walkable = rng.random((25, 17)) > 0.45
+        labels, sizes = connectivity.label_regions(walkable, diagonal)
+        assert len(sizes) == _flood_fill_count(walkable, diagonal)
+        assert sizes.sum() == walkable.sum()
+        assert ((labels >= 0) == walkable).all()
+
+
+def test_repair_joins_regions():
+    walkable = np.zeros((30, 20), dtype=bool)
+    walkable[2:8, 2:8] = True
+    walkable[20:26, 10:16] = True
+    walkable[12:14, 15:17] = True
+    game_map = _map_from(walkable)
+
+    report = connectivity.repair_connectivity(game_map, (3, 3))
+    assert report.region_count == 3
+    assert report.disconnected_area == 36 + 4
+    assert report.joined == 2
+    _, sizes = connectivity.label_regions(game_map.tiles["walkable"])
+    assert len(sizes) == 1
+
+
+def test_repair_fills_small_regions():
+    walkable = np.zeros((30, 20), dtype=bool)
+    walkable[2:8, 2:8] = True
+    walkable[20:26, 10:16] = True
+    walkable[12, 15] = True
+    game_map = _map_from(walkable)
+
+    report = connectivity.repair_connectivity(
+        game_map, (3, 3), min_join_size=5, fill_tile=tile_types.wall
+    )
+    assert (report.joined, report.filled) == (1, 1)
+    assert not game_map.tiles["walkable"][12, 15]
+    _, sizes = connectivity.label_regions(game_map.tiles["walkable"])
+    assert len(sizes) == 1
+
+
+def test_repair_always_joins_required():
+    walkable = np.zeros((30, 20), dtype=bool)
+    walkable[2:8, 2:8] = True
+    walkable[25, 15] = True
+    game_map = _map_from(walkable)
+
+    report = connectivity.repair_connectivity(
+        game_map, (3, 3), required=[(25, 15)], min_join_size=5, fill_tile=tile_types.wall
+    )
+    assert (report.joined, report.filled) == (1, 0)
+    labels, _ = connectivity.label_regions(game_map.tiles["walkable"])
+    assert labels[25, 15] == labels[3, 3]
+
+
+def test_repair_rejects_blocked_start():
+    game_map = _map_from(np.zeros((5, 5), dtype=bool))
+    with pytest.raises(ValueError):
+        connectivity.repair_connectivity(game_map, (2, 2))
+
+
+@pytest.mark.parametrize("algorithm", ["rooms", "bsp"])
+def test_generated_dungeon_is_connected(algorithm):
+    for seed in range(5):
+        player = Actor(name="p")
+        dungeon = procgen.generate_dungeon(
+            80, 43, 30, 6, 10, player, seed=seed, algorithm=algorithm
+        )
+        labels, _ = connectivity.label_regions(dungeon.tiles["walkable"])
+        assert labels[player.x, player.y] == labels[dungeon.downstairs_location]
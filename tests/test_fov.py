@@ -0,0 +1,84 @@
+"""
+시야(FOV) 엔진 테스트
+"""
+import numpy as np
+import pytest
+
+from systems import fov
+
+
+def _full_fov(transparent, x, y, radius, **kwargs):
+    """compute_fov 결과를 맵 크기 배열로 펼침"""
+    visible = np.zeros_like(transparent)
+    lit, region = fov.compute_fov(transparent, x, y, radius, **kwargs)
+    visible[region] = lit
+    return visible
+
+
+def test_open_map_is_disc():
+    transparent = np.ones((31, 31), dtype=bool)
+    visible = _full_fov(transparent, 15, 15, 10)
+
+    xs, ys = np.indices(transparent.shape)
+    disc = (xs - 15) ** 2 + (ys - 15) ** 2 <= 10 ** 2
+    assert np.array_equal(visible, disc)
+
+
+def test_origin_always_visible():
+    transparent = np.zeros((5, 5), dtype=bool)
+    visible = _full_fov(transparent, 2, 2, 3)
+    assert visible[2, 2]
+
+
+def test_wall_casts_shadow():
+    transparent = np.ones((21, 21), dtype=bool)
+    transparent[12, 10] = False
+    visible = _full_fov(transparent, 10, 10, 8)
+
+    assert visible[12, 10]  # 벽 자체는 보임 (light_walls)
+    assert not visible[13, 10]
+    assert not visible[16, 10]
+
+
+def test_light_walls_false_hides_walls():
+    transparent = np.ones((21, 21), dtype=bool)
+    transparent[12, 10] = False
+    visible = _full_fov(transparent, 10, 10, 8, light_walls=False)
+    assert not visible[12, 10]
+
+
+def test_window_clipped_at_map_edge():
+    transparent = np.ones((10, 10), dtype=bool)
+    lit, (xs, ys) = fov.compute_fov(transparent, 0, 0, 5)
+    assert lit.shape == (xs.stop - xs.start, ys.stop - ys.start)
+    assert (xs.start, ys.start) == (0, 0)
+
+
+@pytest.mark.parametrize("algorithm", [fov.FOV_SYMMETRIC_SHADOWCAST])
+def test_symmetric(algorithm):
+    rng = np.random.default_rng(3)
+    for _ in range(10):
+        transparent = rng.random((30, 30)) > 0.3
+        floors = np.argwhere(transparent)
+        points = [tuple(p) for p in floors[rng.choice(len(floors), 15, replace=False)]]
+        views = {
+            p: _full_fov(transparent, *p, 8, algorithm=algorithm, light_walls=False)
+            for p in points
+        }
+        for a in points:
+            for b in points:
+                assert views[a][b] == views[b][a], (a, b)
+
+
+def test_permissive_sees_at_least_symmetric():
+    rng = np.random.default_rng(7)
+    transparent = rng.random((30, 30)) > 0.3
+    transparent[15, 15] = True
+    symmetric = _full_fov(transparent, 15, 15, 10)
+    permissive = _full_fov(transparent, 15, 15, 10, algorithm=fov.FOV_PERMISSIVE)
+    assert not (symmetric & ~permissive).any()
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        fov.compute_fov(np.ones((3, 3), dtype=bool), 1, 1, 1, algorithm=99)
@@ -0,0 +1,101 @@
+"""
+층 관리자 테스트 (타일 번호 인코딩, LRU 캐시, 디스크 내보내기/복원)
+"""
+import numpy as np
+import pytest
+
+from components.entity import Actor
+from systems import procgen
+from systems import tile_types
+from systems.level_manager import LevelManager
+
+
+def _actor_positions(game_map, player):
+    return sorted(
+        (actor.name, actor.x, actor.y) for actor in game_map.actors if actor is not player
+    )
+
+
+@pytest.fixture
+def levels(tmp_path):
+    manager = LevelManager(
+        procgen.generate_dungeon_level, seed=1234, cache_size=1, save_dir=str(tmp_path)
+    )
+    yield manager
+    manager.close()
+
+
+def test_encode_decode_round_trip():
+    tiles = np.asfortranarray(tile_types.TILE_PALETTE[np.arange(40).reshape(8, 5) % 17])
+    ids = tile_types.encode_tiles(tiles)
+    assert ids.dtype == np.uint8
+    assert np.array_equal(tile_types.decode_tiles(ids), tiles)
+
+
+def test_encode_rejects_unknown_tile():
+    tiles = np.full((2, 2), tile_types.floor, dtype=tile_types.tile_dt)
+    tiles[0, 0]["char"] = ord("@")
+    with pytest.raises(ValueError):
+        tile_types.encode_tiles(tiles)
+
+
+def test_same_seed_same_level(tmp_path):
+    a = LevelManager(procgen.generate_dungeon_level, seed=99)
+    b = LevelManager(procgen.generate_dungeon_level, seed=99)
+    try:
+        # 생성 순서와 관계없이 같은 층은 같음
+        b.get(3, Actor(name="p"))
+        map_a = a.get(2, Actor(name="p"))
+        map_b = b.get(2, Actor(name="p"))
+        assert np.array_equal(map_a.tiles, map_b.tiles)
+    finally:
+        a.close()
+        b.close()
+
+
+def test_evict_and_restore(levels):
+    player = Actor(name="p")
+    first = levels.get(1, player)
+    first.remove_entity(player)
+    victim = next(actor for actor in first.actors if actor is not player)
+    first.remove_entity(victim)
+    first.explored[:5, :5] = True
+    tiles = first.tiles.copy()
+    expected = _actor_positions(first, player)
+
+    levels.get(2, player)
+    assert levels.evicted_count == 1
+    assert 1 not in levels.levels
+    assert levels.has_level(1)
+
+    restored = levels.get(1, player)
+    assert levels.loaded_count == 1
+    assert levels.generated_count == 2
+    assert np.array_equal(restored.tiles, tiles)
+    assert restored.explored[:5, :5].all()
+    assert _actor_positions(restored, player) == expected
+
+
+def test_export_import_levels(levels, tmp_path):
+    player = Actor(name="p")
+    first = levels.get(1, player)
+    first.remove_entity(player)
+    levels.get(2, player)  # 1층은 디스크로
+    levels.get(2, player).remove_entity(player)
+    tiles = first.tiles.copy()
+
+    specs = levels.export_levels(exclude=2)
+    assert sorted(specs) == [1]
+
+    (tmp_path / "other").mkdir()
+    other = LevelManager(
+        procgen.generate_dungeon_level, seed=levels.seed, save_dir=str(tmp_path / "other")
+    )
+    try:
+        other.import_levels(specs)
+        assert other.has_level(1)
+        restored = other.get(1, player)
+        assert other.generated_count == 0
+        assert np.array_equal(restored.tiles, tiles)
+    finally:
+        other.close()
@@ -0,0 +1,77 @@
+"""
+층 미리 생성 테스트
+"""
+import numpy as np
+import pytest
+
+from components.entity import Actor
+from systems import procgen
+from systems import tile_types
+from systems.level_manager import LevelManager, actor_to_spec, item_to_spec
+from systems.pregen import LevelPregenerator, build_level_payload, map_from_payload
+
+SEED = 2024
+
+
+def _entity_specs(game_map, player):
+    actors = [actor_to_spec(a) for a in game_map.actors if a is not player]
+    items = [item_to_spec(i) for i in game_map.items]
+    return actors, items
+
+
+def test_payload_matches_in_process_level():
+    payload = build_level_payload(procgen.generate_dungeon_level, 3, SEED)
+
+    player = Actor(name="p")
+    direct = procgen.generate_dungeon_level(3, player, SEED)
+
+    assert np.array_equal(tile_types.decode_tiles(payload.tile_ids), direct.tiles)
+    assert payload.player_start == (player.x, player.y)
+    assert payload.upstairs == direct.upstairs_location
+    assert payload.downstairs == direct.downstairs_location
+    assert payload.rng_state == direct.rng.bit_generator.state
+    assert (payload.actors, payload.items) == _entity_specs(direct, player)
+
+
+def test_map_from_payload_places_player():
+    payload = build_level_payload(procgen.generate_dungeon_level, 2, SEED)
+    player = Actor(name="p")
+    game_map = map_from_payload(payload, player)
+
+    assert (player.x, player.y) == payload.player_start
+    assert player.game_map is game_map
+    assert _entity_specs(game_map, player) == (payload.actors, payload.items)
+
+
+def test_pregenerator_take():
+    pregenerator = LevelPregenerator(procgen.generate_dungeon_level, SEED, lookahead=1)
+    try:
+        pregenerator.request(2)
+        assert pregenerator.pending == [2]
+        payload = pregenerator.take(2)
+        assert pregenerator.pending == []
+        assert pregenerator.take(5) is None
+    finally:
+        pregenerator.shutdown()
+
+    if payload is None:
+        pytest.skip("프로세스 풀을 쓸 수 없는 환경")
+    expected = build_level_payload(procgen.generate_dungeon_level, 2, SEED)
+    assert np.array_equal(payload.tile_ids, expected.tile_ids)
+    assert payload.actors == expected.actors
+
+
+def test_level_manager_discards_requests_behind_player():
+    levels = LevelManager(procgen.generate_dungeon_level, seed=SEED, lookahead=2)
+    try:
+        player = Actor(name="p")
+        levels.get(1, player).remove_entity(player)
+        levels.get(2, player).remove_entity(player)
+        if not levels.pregenerator.pending:
+            pytest.skip("프로세스 풀을 쓸 수 없는 환경")
+        assert sorted(levels.pregenerator.pending) == [3, 4]
+
+        levels.get(1, player)
+        assert levels.pregenerator.pending == [3]
+    finally:
+        levels.close()
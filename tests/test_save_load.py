@@ -0,0 +1,121 @@
+"""
+저장/불러오기 테스트
+"""
+import numpy as np
+import pytest
+
+import config
+from components.entity import Actor
+from components.equipment import Equipment
+from components.fighter import Fighter
+from components.inventory import Inventory
+from systems import procgen
+from systems import streams
+from systems import tile_types
+from systems.engine import Engine
+from systems.level_manager import LevelManager
+from systems.religion import Religion
+from systems.save_load import SaveManager, reconstruct_engine
+
+
+def _actor_positions(game_map, player):
+    return sorted(
+        (actor.name, actor.x, actor.y) for actor in game_map.actors if actor is not player
+    )
+
+
+@pytest.fixture
+def engines(tmp_path, monkeypatch):
+    """새 게임 엔진 (미리 생성 끔, 저장 디렉터리는 임시)"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "PREGENERATE_LEVELS", 0)
+
+    created = []
+
+    def make():
+        player = Actor(
+            char="@", name="당신",
+            fighter=Fighter(hp=30, defense=2, power=5),
+            inventory=Inventory(capacity=26),
+            equipment=Equipment(),
+        )
+        levels = LevelManager(procgen.generate_dungeon_level, seed=4321)
+        engine = Engine(player=player, game_map=levels.get(1, player), levels=levels)
+        created.append(engine)
+        return engine
+
+    def load(engine):
+        manager = SaveManager()
+        ok, message = manager.save_game(engine, 0)
+        assert ok, message
+        data, message = manager.load_game(0)
+        assert data is not None, message
+        loaded = reconstruct_engine(data)
+        created.append(loaded)
+        return loaded
+
+    yield make, load
+    for engine in created:
+        engine.levels.close()
+
+
+def test_round_trip_current_level(engines):
+    make, load = engines
+    engine = make()
+    # 바닥/벽 외의 지형도 보존되어야 함
+    engine.game_map.tiles[1, 1] = tile_types.water_shallow
+    engine.game_map.tiles[2, 1] = tile_types.tree
+    engine.game_map.explored[:10, :10] = True
+    for _ in range(3):
+        engine.handle_enemy_turn()
+    engine.update_fov()  # 불러올 때 시야를 다시 계산하므로 미리 맞춰 둠
+
+    loaded = load(engine)
+    assert np.array_equal(loaded.game_map.tiles, engine.game_map.tiles)
+    assert np.array_equal(loaded.game_map.explored, engine.game_map.explored)
+    assert (loaded.player.x, loaded.player.y) == (engine.player.x, engine.player.y)
+    assert loaded.player.fighter.hp == engine.player.fighter.hp
+    assert _actor_positions(loaded.game_map, loaded.player) == _actor_positions(
+        engine.game_map, engine.player
+    )
+    assert loaded.time == engine.time
+    assert loaded.levels.seed == engine.levels.seed
+    # 맵 행동용 난수도 이어서 진행
+    assert loaded.game_map.rng.random() == engine.game_map.rng.random()
+
+
+def test_round_trip_visited_levels(engines):
+    make, load = engines
+    engine = make()
+    first = engine.game_map
+    victim = next(actor for actor in first.actors if actor is not engine.player)
+    first.remove_entity(victim)
+    expected = _actor_positions(first, engine.player)
+
+    engine.player.place(*first.downstairs_location)
+    assert engine.descend()
+
+    loaded = load(engine)
+    assert loaded.depth == 2
+    loaded.player.place(*loaded.game_map.upstairs_location)
+    assert loaded.ascend()
+    assert loaded.levels.generated_count == 0
+    assert _actor_positions(loaded.game_map, loaded.player) == expected
+
+
+def test_religion_stream_restored(engines):
+    make, load = engines
+    engine = make()
+    engine.player.religion = Religion(
+        rng=streams.player_streams(engine.levels.seed)["religion"]
+    )
+    engine.player.religion.rng.random()
+
+    loaded = load(engine)
+    assert loaded.player.religion.rng.random() == engine.player.religion.rng.random()
+
+
+def test_loaded_game_uses_configured_levels(engines):
+    make, load = engines
+    loaded = load(make())
+    assert loaded.levels.cache_size == config.LEVEL_CACHE_SIZE